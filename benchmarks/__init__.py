@@ -0,0 +1,4 @@
+"""Performance benchmarks for the ride discount system.
+
+Run the suite with ``make bench`` or ``PYTHONPATH=src python -m benchmarks``.
+"""
@@ -0,0 +1,61 @@
+"""Run the benchmark suite: ``PYTHONPATH=src python -m benchmarks [-o report.json]``."""
+
+import argparse
+from pathlib import Path
+
+from benchmarks.harness import (
+    build_report,
+    measure_allocations,
+    measure_import_time,
+    run_benchmark,
+    write_report,
+)
+from benchmarks.suite import build_allocation_suite, build_memory_suite, build_suite
+
+
+def main() -> None:
+    """Run the selected benchmarks, print a summary and write the JSON report."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("-o", "--output", type=Path, help="write the JSON report to this file")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks containing this")
+    parser.add_argument("--repeat", type=int, default=7, help="samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per sample")
+    args = parser.parse_args()
+
+    results = []
+    for benchmark in build_suite():
+        if args.filter not in benchmark.name:
+            continue
+        result = run_benchmark(benchmark, args.repeat, args.min_time)
+        summary = result.to_dict()
+        print(
+            f"{result.name:45s} {summary['median']:12.1f} {result.unit:12s}"
+            f" (min {summary['min']:.1f}, stdev {summary['stdev']:.1f})"
+        )
+        results.append(result)
+
+    for benchmark, calls in build_allocation_suite():
+        if args.filter not in f"alloc.{benchmark.name}":
+            continue
+        result = measure_allocations(benchmark, calls)
+        print(f"{result.name:45s} {result.to_dict()['median']:12.1f} {result.unit}")
+        results.append(result)
+
+    for result in build_memory_suite():
+        if args.filter not in result.name:
+            continue
+        print(f"{result.name:45s} {result.to_dict()['median']:12.1f} {result.unit}")
+        results.append(result)
+
+    if args.filter in "import.ride_discount":
+        result = measure_import_time("ride_discount", args.repeat)
+        print(f"{result.name:45s} {result.to_dict()['median']:12.1f} {result.unit}")
+        results.append(result)
+
+    if args.output is not None:
+        write_report(build_report(results), args.output)
+        print(f"\nreport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
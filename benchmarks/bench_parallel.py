@@ -0,0 +1,56 @@
+"""Throughput of ParallelPricingExecutor as the number of workers grows.
+
+Besides rides/s, each row reports the parent process's CPU time per ride
+(submitting chunks, rebuilding results) as a share of sequential pricing.
+Workers cannot go faster than the parent hands results out, so the speedup
+is capped at about 1 / share however many cores there are; unlike the
+speedup itself, this ceiling can be measured on a single core.
+
+Run with: PYTHONPATH=src python benchmarks/bench_parallel.py [RIDES] [MAX_WORKERS]
+(MAX_WORKERS defaults to the CPU count; higher values oversubscribe the cores.)
+"""
+
+import multiprocessing
+import sys
+import time
+
+from workload import generate_rides
+
+from ride_discount import CalculateRideDiscountUseCase
+from ride_discount.application.parallel import ParallelPricingExecutor
+
+
+def main() -> None:
+    """Print rides/second sequentially and for 1, 2, 4, ... workers."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else multiprocessing.cpu_count()
+    rides = generate_rides(count)
+    print(f"{count:,d} rides, {multiprocessing.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    CalculateRideDiscountUseCase().execute_many(rides)
+    sequential_seconds = time.perf_counter() - start
+    sequential = count / sequential_seconds
+    print(f"sequential     {sequential:12,.0f} rides/s")
+
+    workers = 1
+    while workers <= max_workers:
+        with ParallelPricingExecutor(max_workers=workers, chunk_size=2000) as executor:
+            executor.execute_many(rides[:workers])  # warm up
+            start = time.perf_counter()
+            parent_start = time.process_time()
+            executor.execute_many(rides)
+            parent_seconds = time.process_time() - parent_start
+            throughput = count / (time.perf_counter() - start)
+        share = parent_seconds / sequential_seconds
+        print(
+            f"{workers:3d} workers    {throughput:12,.0f} rides/s"
+            f"   speedup {throughput / sequential:5.2f}x"
+            f"   parent {parent_seconds / count * 1e9:6,.0f} ns/ride"
+            f" ({share:5.1%}, speedup <= {1 / share:5.1f}x)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Per-quote overhead of the compiled rule pipeline versus per-ride rule instantiation.
+
+Both are timed over the same generated workload, so every rule branch is
+exercised instead of a single ride.
+
+Run with: PYTHONPATH=src python benchmarks/bench_pipeline.py [RIDES]
+"""
+
+import sys
+import time
+from collections.abc import Callable, Sequence
+from decimal import Decimal
+
+from workload import generate_rides
+
+from ride_discount import CalculateRideDiscountUseCase, RideContext
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+REPEAT = 5
+
+
+def execute_uncompiled(context: RideContext) -> tuple[Decimal, list[DiscountResult]]:
+    """Reference implementation: instantiate every rule on every quote."""
+    applied_discounts = [
+        discount_result
+        for rule_class in DiscountRule.registered_rules
+        if (discount_result := rule_class().calculate_discount(context))
+    ]
+
+    total_discount_percentage = min(
+        sum((d.discount_percentage for d in applied_discounts), Decimal("0")),
+        CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT,
+    )
+
+    discount_amount = context.base_price * (total_discount_percentage / Decimal("100"))
+    return context.base_price - discount_amount, applied_discounts
+
+
+def best_ns_per_quote(
+    func: Callable[[RideContext], object], rides: Sequence[RideContext]
+) -> float:
+    """Best-of-REPEAT nanoseconds per call of func over every ride."""
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for context in rides:
+            func(context)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(rides) * 1e9
+
+
+def main() -> None:
+    """Print per-quote timings before and after pipeline compilation."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rides = generate_rides(count)
+    use_case = CalculateRideDiscountUseCase()
+    assert all(use_case.execute(c) == execute_uncompiled(c) for c in rides)
+
+    before = best_ns_per_quote(execute_uncompiled, rides)
+    after = best_ns_per_quote(use_case.execute, rides)
+
+    print(f"rides:                      {count:8,d}")
+    print(f"rules registered:           {len(DiscountRule.registered_rules)}")
+    print(f"per-ride instantiation:     {before:8.0f} ns/quote")
+    print(f"compiled pipeline:          {after:8.0f} ns/quote")
+    print(f"saved per quote:            {before - after:8.0f} ns ({(1 - after / before):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Throughput of one shared use case priced from a growing number of threads.
+
+On a GIL build the threads take turns and throughput stays flat; on a
+free-threaded build (python3.13t, PYTHON_GIL=0) it should grow with the
+thread count up to the number of cores.
+
+Run with: PYTHONPATH=src python benchmarks/bench_threads.py [RIDES]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from workload import generate_rides
+
+from ride_discount import CalculateRideDiscountUseCase
+
+
+def main() -> None:
+    """Print rides/second sequentially and for 1, 2, 4, ... threads."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rides = generate_rides(count)
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled else 'disabled'}")
+
+    use_case = CalculateRideDiscountUseCase()
+    use_case.execute_many(rides[:100])  # compile the pipeline
+    start = time.perf_counter()
+    use_case.execute_many(rides)
+    sequential = count / (time.perf_counter() - start)
+    print(f"sequential     {sequential:12,.0f} rides/s")
+
+    threads = 1
+    while threads <= (os.cpu_count() or 1):
+        chunk = -(-count // threads)
+        chunks = [rides[start : start + chunk] for start in range(0, count, chunk)]
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            start = time.perf_counter()
+            list(pool.map(use_case.execute_many, chunks))
+            throughput = count / (time.perf_counter() - start)
+        print(
+            f"{threads:3d} threads    {throughput:12,.0f} rides/s"
+            f"   speedup {throughput / sequential:5.2f}x"
+        )
+        threads *= 2
+
+
+if __name__ == "__main__":
+    main()
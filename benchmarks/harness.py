@@ -0,0 +1,274 @@
+"""Minimal timing harness producing machine-readable benchmark reports."""
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A single benchmark case.
+
+    Attributes:
+        name: Dotted, stable identifier used to compare runs across commits
+        func: Callable performing `operations` units of work per call
+        operations: Units of work (quotes, rides, objects...) done by one call
+        unit: Label of one unit of work, used in the reported unit
+    """
+
+    name: str
+    func: Callable[[], object]
+    operations: int
+    unit: str = "op"
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings of one benchmark, in nanoseconds per unit of work.
+
+    Attributes:
+        name: Benchmark identifier
+        unit: Reported unit, e.g. "ns/quote"
+        samples: Time per unit of work of each repeat
+    """
+
+    name: str
+    unit: str
+    samples: list[float]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summary statistics plus the raw samples, for JSON serialization."""
+        return {
+            "unit": self.unit,
+            "min": min(self.samples),
+            "median": statistics.median(self.samples),
+            "mean": statistics.fmean(self.samples),
+            "stdev": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "samples": self.samples,
+        }
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int, min_time: float) -> BenchmarkResult:
+    """Time a benchmark.
+
+    The callable is first run until min_time seconds have elapsed, which both
+    warms it up and calibrates how many calls go into one sample. Each of the
+    `repeat` samples then runs that many calls.
+
+    Args:
+        benchmark: The case to run
+        repeat: Number of samples to collect
+        min_time: Minimum duration of one sample in seconds
+
+    Returns:
+        Nanoseconds per unit of work of every sample
+    """
+    func = benchmark.func
+    loops = _calibrate(func, min_time)
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter_ns() - start) / (loops * benchmark.operations))
+    return BenchmarkResult(benchmark.name, f"ns/{benchmark.unit}", samples)
+
+
+def run_relative(
+    benchmark: Benchmark, reference: Benchmark, repeat: int, min_time: float
+) -> BenchmarkResult:
+    """Time a benchmark relative to a reference workload timed alongside it.
+
+    Each sample of the benchmark is bracketed by two samples of the
+    reference, and recorded as its time per unit of work over the mean
+    reference time per step. Machine speed drifts (frequency scaling, noisy
+    neighbours) slow both alike, so the ratio is comparable between runs
+    where absolute timings are not.
+
+    Args:
+        benchmark: The case to run
+        reference: Workload independent of the code under test
+        repeat: Number of samples to collect
+        min_time: Minimum duration of one sample in seconds
+
+    Returns:
+        Reference steps per unit of work of every sample
+    """
+    loops = {case.name: _calibrate(case.func, min_time) for case in (benchmark, reference)}
+
+    def sample(case: Benchmark) -> float:
+        func = case.func
+        count = loops[case.name]
+        start = time.perf_counter_ns()
+        for _ in range(count):
+            func()
+        return (time.perf_counter_ns() - start) / (count * case.operations)
+
+    samples = []
+    before = sample(reference)
+    for _ in range(repeat):
+        timing = sample(benchmark)
+        after = sample(reference)
+        samples.append(timing / ((before + after) / 2))
+        before = after
+    return BenchmarkResult(benchmark.name, f"{reference.unit}s/{benchmark.unit}", samples)
+
+
+def _calibrate(func: Callable[[], object], min_time: float) -> int:
+    """Warm func up and return how many calls take about min_time seconds."""
+    calls = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < min_time or calls == 0:
+        func()
+        calls += 1
+    return max(1, round(calls * min_time / elapsed))
+
+
+def measure_memory(
+    name: str, factory: Callable[[int], object], count: int, repeat: int = 3
+) -> BenchmarkResult:
+    """Measure the memory retained per object built by factory.
+
+    Only memory allocated by the factory calls themselves is counted; the
+    list holding the objects is excluded.
+
+    Args:
+        name: Benchmark identifier
+        factory: Builds one object from its index
+        count: Objects built per sample
+        repeat: Number of samples
+
+    Returns:
+        Bytes per object of every sample
+    """
+    samples = []
+    for _ in range(repeat):
+        objects: list[object] = [None] * count
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            objects[index] = factory(index)
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        samples.append(retained / count)
+        del objects
+    return BenchmarkResult(name, "bytes/object", samples)
+
+
+def measure_allocations(benchmark: Benchmark, calls: int = 1, repeat: int = 3) -> BenchmarkResult:
+    """Measure the peak memory allocated per unit of work, temporaries included.
+
+    Each call is traced on its own: its peak is the largest amount of
+    memory allocated during the call above what was allocated before it,
+    which counts the temporaries alive at that moment and the result built,
+    whether or not it is kept. Results are discarded between calls, so
+    calls of a sample do not add up. The callable is run `calls` times
+    first so that caches it fills are not counted. The peak is
+    deterministic, unlike timings, when a sample's calls repeat the same
+    work; temporaries freed before the peak of their call are not seen.
+
+    Args:
+        benchmark: The case to run
+        calls: Calls per sample, e.g. one per ride of a cycled workload
+        repeat: Number of samples
+
+    Returns:
+        Mean peak bytes per unit of work of every sample
+    """
+    for _ in range(calls):
+        benchmark.func()
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        tracemalloc.start()
+        peak_bytes = 0
+        for _ in range(calls):
+            allocated_before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            benchmark.func()
+            peak_bytes += tracemalloc.get_traced_memory()[1] - allocated_before
+        tracemalloc.stop()
+        samples.append(peak_bytes / (calls * benchmark.operations))
+    return BenchmarkResult(f"alloc.{benchmark.name}", f"bytes/{benchmark.unit}", samples)
+
+
+def measure_import_time(module: str, repeat: int = 7) -> BenchmarkResult:
+    """Measure how long importing a module takes in a fresh interpreter.
+
+    Each sample starts a new interpreter, so nothing is cached in sys.modules;
+    only the import statement itself is timed, not interpreter startup.
+
+    Args:
+        module: Dotted name of the module to import
+        repeat: Number of samples
+
+    Returns:
+        Nanoseconds per import of every sample
+    """
+    code = (
+        "import time\n"
+        "start = time.perf_counter_ns()\n"
+        f"import {module}\n"
+        "print(time.perf_counter_ns() - start)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True, env=env
+        ).stdout
+        samples.append(float(output))
+    return BenchmarkResult(f"import.{module}", "ns/import", samples)
+
+
+def _git_commit() -> str | None:
+    """Current git commit, if the benchmarks run from a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results: list[BenchmarkResult]) -> dict[str, Any]:
+    """Assemble the JSON report with environment metadata.
+
+    Args:
+        results: Results of the benchmarks that ran
+
+    Returns:
+        JSON-serializable report
+    """
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": {result.name: result.to_dict() for result in results},
+    }
+
+
+def write_report(report: dict[str, Any], path: Path) -> None:
+    """Write a report as indented JSON."""
+    path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
@@ -0,0 +1,178 @@
+"""Closed-loop load generator for the HTTP quote server.
+
+Each connection is a thread sending requests back to back over one
+keep-alive connection, so throughput and latency include HTTP parsing,
+JSON decoding and encoding and the socket round trip. Without --url a
+server is started in a subprocess (python -m ride_discount serve --port 0)
+and stopped afterwards. The client threads share the GIL, so on slow
+machines the client can saturate before the server; compare against
+--connections 1 to tell.
+
+Run with: PYTHONPATH=src python benchmarks/load.py [--connections N] [--batch N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from http.client import HTTPConnection
+from typing import Any
+from urllib.parse import urlsplit
+
+from workload import PROFILES, SEED, generate_rides
+
+from ride_discount import RideContext
+
+
+def ride_record(context: RideContext) -> dict[str, Any]:
+    """The JSON object of a ride, as the server expects it."""
+    return {
+        "customer_id": context.customer.id,
+        "total_rides": context.customer.total_rides,
+        "distance_km": str(context.distance_km),
+        "base_price": str(context.base_price),
+        "ride_datetime": context.ride_datetime.isoformat(),
+    }
+
+
+def build_bodies(
+    batch: int, profile: str = "default", seed: int = SEED, count: int = 1000
+) -> tuple[str, list[bytes]]:
+    """The endpoint and pre-encoded request bodies cycled through by the clients."""
+    rides = generate_rides(count * batch, PROFILES[profile], seed)
+    records = [ride_record(context) for context in rides]
+    if batch == 1:
+        return "/quote", [json.dumps(record).encode() for record in records]
+    return "/quotes", [
+        json.dumps({"rides": records[start : start + batch]}).encode()
+        for start in range(0, len(records), batch)
+    ]
+
+
+def percentile(ordered: list[int], fraction: float) -> int:
+    """Nearest-rank percentile of sorted values."""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Client(threading.Thread):
+    """Sends requests over one keep-alive connection until a deadline."""
+
+    def __init__(
+        self, host: str, port: int, path: str, bodies: list[bytes], offset: int
+    ) -> None:
+        """Create a client cycling through bodies, starting at offset."""
+        super().__init__(daemon=True)
+        self.host, self.port, self.path = host, port, path
+        self.bodies, self.offset = bodies, offset
+        self.latencies_ns: list[int] = []
+        self.errors = 0
+        self.record_after = 0.0
+        self.deadline = 0.0
+
+    def run(self) -> None:
+        """Send requests until the deadline, recording latencies after record_after."""
+        connection = HTTPConnection(self.host, self.port, timeout=30)
+        headers = {"Content-Type": "application/json"}
+        bodies, index = self.bodies, self.offset
+        try:
+            while (now := time.perf_counter()) < self.deadline:
+                body = bodies[index % len(bodies)]
+                index += 1
+                start = time.perf_counter_ns()
+                connection.request("POST", self.path, body, headers)
+                response = connection.getresponse()
+                response.read()
+                elapsed = time.perf_counter_ns() - start
+                if response.status != 200:
+                    self.errors += 1
+                elif now >= self.record_after:
+                    self.latencies_ns.append(elapsed)
+        finally:
+            connection.close()
+
+
+def start_server() -> tuple[subprocess.Popen[str], str]:
+    """Start a server on a free port; return the process and its URL."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, ["src", env.get("PYTHONPATH")]))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "ride_discount", "serve", "--port", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+        env=env,
+    )
+    assert process.stdout is not None
+    line = process.stdout.readline()
+    if not line.startswith("Serving quotes on "):
+        process.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    return process, line.split()[-1]
+
+
+def main() -> None:
+    """Drive the server and print throughput and latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="server to load (default: start one)")
+    parser.add_argument("--connections", type=int, default=4, help="concurrent connections")
+    parser.add_argument("--duration", type=float, default=5.0, help="measured seconds")
+    parser.add_argument("--warm-up", type=float, default=1.0, help="unmeasured seconds first")
+    parser.add_argument("--batch", type=int, default=1, help="rides per request (1: /quote)")
+    parser.add_argument("--profile", choices=PROFILES, default="default", help="ride workload")
+    parser.add_argument("--seed", type=int, default=SEED, help="workload seed")
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server()
+    parts = urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    path, bodies = build_bodies(args.batch, args.profile, args.seed)
+
+    try:
+        start = time.perf_counter()
+        clients = [
+            Client(host, port, path, bodies, offset=index * 97)
+            for index in range(args.connections)
+        ]
+        for client in clients:
+            client.record_after = start + args.warm_up
+            client.deadline = start + args.warm_up + args.duration
+            client.start()
+        for client in clients:
+            client.join()
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies = sorted(latency for client in clients for latency in client.latencies_ns)
+    errors = sum(client.errors for client in clients)
+    if not latencies:
+        print(f"no successful requests ({errors} errors)")
+        return
+    requests_per_second = len(latencies) / args.duration
+    print(
+        f"{url}{path}  {args.connections} connections, {args.batch} rides/request,"
+        f" {args.profile} workload"
+    )
+    print(f"requests   {len(latencies):10,d}   errors {errors:,d}")
+    print(
+        f"throughput {requests_per_second:10,.0f} requests/s"
+        f" {requests_per_second * args.batch:12,.0f} quotes/s"
+    )
+    print(
+        "latency ms "
+        + "  ".join(
+            f"{name} {percentile(latencies, fraction) / 1e6:.3f}"
+            for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99), ("p99.9", 0.999))
+        )
+        + f"  max {latencies[-1] / 1e6:.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Performance regression gate: compare a benchmark run with the stored baseline.
+
+Run with: ``PYTHONPATH=src:. python -m benchmarks.regression`` (or ``make bench-gate``).
+
+The gated benchmarks (per-quote latency, batch throughput, peak bytes
+allocated per quote) are run and compared with benchmarks/baseline.json.
+Timings are recorded as multiples of a reference workload timed alongside
+them, which cancels most machine speed drift. A timing regresses when its
+median is more than --threshold above the baseline median and a one-sided
+Mann-Whitney U test over the samples says the slowdown is not noise
+(p < --alpha). Allocation peaks are deterministic and regress on the
+threshold alone. Exits 1 on a regression, 2 on a missing, unreadable or
+incompatible baseline, 0 otherwise; errors go to stderr.
+
+Refresh the baseline with --update after an intended change, on the
+machine that runs the gate.
+"""
+
+import argparse
+import json
+import math
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from benchmarks.harness import build_report, measure_allocations, run_relative, write_report
+from benchmarks.suite import build_allocation_suite, build_reference, build_suite
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+# Per-quote latency and batch throughput, relative to the reference workload
+GATED_TIMINGS = ("use_case.execute", "use_case.execute_total", "batch.execute_many")
+# Peak bytes allocated per quote, temporaries included
+GATED_ALLOCATIONS = ("alloc.use_case.execute", "alloc.batch.execute_many")
+GATED = GATED_TIMINGS + GATED_ALLOCATIONS
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_ALPHA = 0.01
+# Units whose samples are exact counts rather than noisy timings
+_DETERMINISTIC_UNITS = ("blocks/", "bytes/")
+
+
+def mann_whitney_u(baseline: list[float], current: list[float]) -> tuple[float, float]:
+    """One-sided Mann-Whitney U test that current tends to be larger than baseline.
+
+    Ties get midranks. The p-value is exact when there are no ties, and
+    uses the tie-corrected normal approximation otherwise.
+
+    Args:
+        baseline: Samples of the reference run
+        current: Samples of the run under test
+
+    Returns:
+        (U statistic of current, p-value)
+
+    Raises:
+        ValueError: If either sample list is empty
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("both sample lists must be non-empty")
+    pooled = sorted([(value, 0) for value in baseline] + [(value, 1) for value in current])
+    rank_sum = 0.0
+    tie_term = 0
+    start = 0
+    while start < len(pooled):
+        end = start
+        while end + 1 < len(pooled) and pooled[end + 1][0] == pooled[start][0]:
+            end += 1
+        midrank = (start + end) / 2 + 1
+        rank_sum += midrank * sum(group for _, group in pooled[start : end + 1])
+        tie_term += (end - start + 1) ** 3 - (end - start + 1)
+        start = end + 1
+    u = rank_sum - n1 * (n1 + 1) / 2
+
+    if tie_term == 0:
+        return u, _exact_upper_tail(round(u), n1, n2)
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance == 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)  # continuity correction
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _exact_upper_tail(u: int, n1: int, n2: int) -> float:
+    """P(U >= u) under the null hypothesis, for samples without ties."""
+    size = n1 * n2 + 1
+    # table[m][n][k]: orderings of m current and n baseline samples with U == k.
+    # The largest sample is either a current one, beating all n baseline
+    # samples, or a baseline one, beating none.
+    table: list[list[list[int]]] = [[[] for _ in range(n2 + 1)] for _ in range(n1 + 1)]
+    for m in range(n1 + 1):
+        for n in range(n2 + 1):
+            if m == 0 or n == 0:
+                table[m][n] = [1] + [0] * (size - 1)
+                continue
+            without_current = table[m - 1][n]
+            without_baseline = table[m][n - 1]
+            table[m][n] = [
+                (without_current[k - n] if k >= n else 0) + without_baseline[k]
+                for k in range(size)
+            ]
+    distribution = table[n1][n2]
+    return sum(distribution[u:]) / math.comb(n1 + n2, n1)
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Outcome of comparing one benchmark with its baseline.
+
+    Attributes:
+        name: Benchmark identifier
+        unit: Reported unit
+        baseline: Median of the baseline samples
+        current: Median of the current samples
+        p_value: One-sided Mann-Whitney U p-value, or None for exact counts
+        regressed: Whether the change fails the gate
+    """
+
+    name: str
+    unit: str
+    baseline: float
+    current: float
+    p_value: float | None
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change of the median, positive when slower or larger."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare(
+    name: str,
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> Comparison:
+    """Compare one benchmark's report entries.
+
+    Args:
+        name: Benchmark identifier
+        baseline: Its entry in the baseline report
+        current: Its entry in the current report
+        threshold: Relative slowdown of the median tolerated
+        alpha: Significance level of the Mann-Whitney U test
+
+    Returns:
+        The comparison
+
+    Raises:
+        ValueError: If the units differ
+    """
+    if baseline["unit"] != current["unit"]:
+        raise ValueError(f"{name}: unit changed from {baseline['unit']} to {current['unit']}")
+    exceeded = current["median"] > baseline["median"] * (1 + threshold)
+    if current["unit"].startswith(_DETERMINISTIC_UNITS):
+        p_value = None
+        regressed = exceeded
+    else:
+        _, p_value = mann_whitney_u(baseline["samples"], current["samples"])
+        regressed = exceeded and p_value < alpha
+    return Comparison(
+        name, current["unit"], baseline["median"], current["median"], p_value, regressed
+    )
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    names: tuple[str, ...] = GATED,
+    threshold: float = DEFAULT_THRESHOLD,
+    alpha: float = DEFAULT_ALPHA,
+) -> list[Comparison]:
+    """Compare the named benchmarks of two reports.
+
+    Raises:
+        ValueError: If a named benchmark is missing from either report
+    """
+    comparisons = []
+    for name in names:
+        missing = [
+            label
+            for label, report in (("baseline", baseline), ("current", current))
+            if name not in report["benchmarks"]
+        ]
+        if missing:
+            raise ValueError(f"{name} is missing from the {' and '.join(missing)} report")
+        comparisons.append(
+            compare(
+                name,
+                baseline["benchmarks"][name],
+                current["benchmarks"][name],
+                threshold,
+                alpha,
+            )
+        )
+    return comparisons
+
+
+def run_gated(repeat: int, min_time: float) -> dict[str, Any]:
+    """Run the gated benchmarks and return their report.
+
+    Timings are measured relative to the suite's reference workload, so
+    they compare across runs on a machine whose speed drifts.
+    """
+    reference = build_reference()
+    results = [
+        run_relative(benchmark, reference, repeat, min_time)
+        for benchmark in build_suite()
+        if benchmark.name in GATED_TIMINGS
+    ]
+    results += [
+        measure_allocations(benchmark, calls)
+        for benchmark, calls in build_allocation_suite()
+        if f"alloc.{benchmark.name}" in GATED_ALLOCATIONS
+    ]
+    return build_report(results)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the gate; return the process exit status."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.regression",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="baseline report")
+    parser.add_argument("--update", action="store_true", help="rewrite the baseline and exit")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"relative slowdown tolerated (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=DEFAULT_ALPHA,
+        help=f"significance level of the U test (default: {DEFAULT_ALPHA})",
+    )
+    parser.add_argument("--repeat", type=int, default=15, help="samples per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per sample")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        write_report(run_gated(args.repeat, args.min_time), args.baseline)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    try:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        print(f"error: no baseline at {args.baseline}; create it with --update", file=sys.stderr)
+        return 2
+    except (OSError, ValueError) as error:  # includes JSON and UTF-8 decoding errors
+        print(f"error: cannot read baseline {args.baseline}: {error}", file=sys.stderr)
+        return 2
+    if not isinstance(baseline, dict) or not isinstance(baseline.get("benchmarks"), dict):
+        print(f'error: baseline {args.baseline} has no "benchmarks" object', file=sys.stderr)
+        return 2
+
+    current = run_gated(args.repeat, args.min_time)
+    try:
+        comparisons = compare_reports(baseline, current, GATED, args.threshold, args.alpha)
+    except (KeyError, TypeError, ValueError) as error:
+        print(f"error: incompatible baseline {args.baseline}: {error!r}", file=sys.stderr)
+        return 2
+    for comparison in comparisons:
+        p_value = "exact" if comparison.p_value is None else f"p={comparison.p_value:.4f}"
+        verdict = "REGRESSED" if comparison.regressed else "ok"
+        print(
+            f"{comparison.name:32s} {comparison.baseline:9.3f} -> {comparison.current:9.3f}"
+            f" {comparison.unit:14s} {comparison.change:+7.1%}  {p_value:10s} {verdict}"
+        )
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:", *regressions)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
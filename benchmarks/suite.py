@@ -0,0 +1,403 @@
+"""Benchmark cases covering the use case, each rule, the DTOs and batch workloads."""
+
+import array
+import io
+import itertools
+import json
+import tempfile
+import weakref
+from collections.abc import Callable
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from benchmarks.harness import Benchmark, BenchmarkResult, measure_memory
+from benchmarks.workload import PROFILES, SEED, generate_rides
+from ride_discount import CalculateRideDiscountUseCase, Customer, DiscountResult, RideContext
+from ride_discount.application.dtos import FixedPointRide
+from ride_discount.application.fixed_point import FixedPointPricingEngine
+from ride_discount.application.instrumentation import PricingInstrumentation
+from ride_discount.application.price_surface import PriceSurfaceBuilder
+from ride_discount.application.quote_cache import QuoteCache
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.schedule import HOURS_PER_WEEK
+from ride_discount.infrastructure.ride_count_store import RideCountStore
+from ride_discount.infrastructure.ride_io import read_rides
+from ride_discount.infrastructure.ride_log import RideLog, RideLogWriter, price_ride_log
+
+RuleFunction = Callable[[RideContext], DiscountResult | None]
+
+MEMORY_OBJECTS = 100_000
+QUOTE_MIX_SIZE = 1_000
+BATCH_SIZE = 10_000
+SURFACE_BUCKETS = 40
+SURFACE_WEEK_START = datetime(2024, 1, 1)
+STREAM_CACHE_SIZE = 1_000
+
+
+def surface_base_price(distance_km: Decimal) -> Decimal:
+    """Base price of a price surface bucket: the tariff of the default workload."""
+    return PROFILES["default"].base_price(distance_km)
+
+
+def build_suite() -> list[Benchmark]:
+    """Create every benchmark case of the suite.
+
+    Returns:
+        The benchmark cases, in reporting order
+    """
+    quotes = generate_rides(QUOTE_MIX_SIZE)
+    batch = generate_rides(BATCH_SIZE, seed=SEED + 1)
+    use_case = CalculateRideDiscountUseCase()
+    use_case.execute(quotes[0])
+
+    def execute_mix() -> None:
+        execute = use_case.execute
+        for context in quotes:
+            execute(context)
+
+    def execute_mix_totals() -> None:
+        execute_total = use_case.execute_total
+        for context in quotes:
+            execute_total(context)
+
+    instrumented = CalculateRideDiscountUseCase(PricingInstrumentation())
+
+    def execute_mix_instrumented() -> None:
+        execute = instrumented.execute
+        for context in quotes:
+            execute(context)
+
+    cache = QuoteCache(use_case, max_size=len(quotes), ttl=3600.0)
+
+    def execute_mix_cached() -> None:
+        execute = cache.execute
+        for context in quotes:
+            execute(context)
+
+    # A small, cold cache over a long stream: the hit rate follows each workload's
+    # skew. stream_{name} prices the same stream without the cache, for comparison.
+    def stream_through_cache(rides: list[RideContext]) -> Callable[[], None]:
+        def execute_stream() -> None:
+            execute = QuoteCache(use_case, max_size=STREAM_CACHE_SIZE, ttl=3600.0).execute
+            for context in rides:
+                execute(context)
+
+        return execute_stream
+
+    def stream_uncached(rides: list[RideContext]) -> Callable[[], None]:
+        def execute_stream() -> None:
+            execute = use_case.execute
+            for context in rides:
+                execute(context)
+
+        return execute_stream
+
+    streams = {
+        name: generate_rides(BATCH_SIZE, profile, seed=SEED + 2)
+        for name, profile in PROFILES.items()
+    }
+
+    fixed_point = FixedPointPricingEngine()
+    fixed_rides = [r for c in quotes if (r := FixedPointRide.from_context(c)) is not None]
+
+    def quote_mix_fixed_point() -> None:
+        quote = fixed_point.quote
+        for context in quotes:
+            quote(context)
+
+    def price_mix_integer_only() -> None:
+        final_price_scaled = fixed_point.final_price_scaled
+        for ride in fixed_rides:
+            final_price_scaled(ride)
+
+    surface_builder = PriceSurfaceBuilder()
+    surface_customer = quotes[0].customer
+    surface_distances = [Decimal(km) for km in range(1, SURFACE_BUCKETS + 1)]
+    surface_contexts = [
+        RideContext(
+            customer=surface_customer,
+            distance_km=distance,
+            base_price=surface_base_price(distance),
+            ride_datetime=SURFACE_WEEK_START + timedelta(hours=hour_of_week),
+        )
+        for hour_of_week in range(HOURS_PER_WEEK)
+        for distance in surface_distances
+    ]
+
+    def build_surface() -> None:
+        surface_builder.build(surface_customer, surface_distances, surface_base_price)
+
+    def execute_surface_cells() -> None:
+        execute = use_case.execute
+        for context in surface_contexts:
+            execute(context)
+
+    suite = [
+        Benchmark("use_case.execute", execute_mix, len(quotes), "quote"),
+        Benchmark("use_case.execute_total", execute_mix_totals, len(quotes), "quote"),
+        Benchmark("use_case.execute_instrumented", execute_mix_instrumented, len(quotes), "quote"),
+        Benchmark("quote_cache.execute", execute_mix_cached, len(quotes), "quote"),
+        *(
+            Benchmark(f"{prefix}.stream_{name}", stream(rides), len(rides), "quote")
+            for name, rides in streams.items()
+            for prefix, stream in (
+                ("use_case", stream_uncached),
+                ("quote_cache", stream_through_cache),
+            )
+        ),
+        Benchmark("fixed_point.quote", quote_mix_fixed_point, len(quotes), "quote"),
+        Benchmark(
+            "fixed_point.final_price_scaled", price_mix_integer_only, len(fixed_rides), "quote"
+        ),
+        Benchmark("price_surface.build", build_surface, len(surface_contexts), "cell"),
+        Benchmark(
+            "price_surface.execute_cells", execute_surface_cells, len(surface_contexts), "cell"
+        ),
+    ]
+
+    for rule_class in DiscountRule.registered_rules:
+        calculate = rule_class().calculate_discount
+
+        def evaluate_rule(calculate: RuleFunction = calculate) -> None:
+            for context in quotes:
+                calculate(context)
+
+        suite.append(Benchmark(f"rule.{rule_class.__name__}", evaluate_rule, len(quotes), "call"))
+
+    rows = [
+        (c.customer.id, c.customer.total_rides, c.distance_km, c.base_price, c.ride_datetime)
+        for c in quotes
+    ]
+    customers = [c.customer for c in quotes]
+    percentage = Decimal("10")
+
+    def build_customers() -> None:
+        for customer_id, total_rides, _, _, _ in rows:
+            Customer(id=customer_id, total_rides=total_rides)
+
+    def build_ride_contexts() -> None:
+        for customer, (_, _, distance, price, ride_datetime) in zip(customers, rows, strict=True):
+            RideContext(
+                customer=customer, distance_km=distance, base_price=price, ride_datetime=ride_datetime
+            )
+
+    def build_discount_results() -> None:
+        for _ in rows:
+            DiscountResult(discount_percentage=percentage, reason="Benchmark discount")
+
+    ride_counts = RideCountStore({c.customer.id: c.customer.total_rides for c in quotes})
+    customer_ids = [c.customer.id for c in quotes]
+
+    def look_up_customers() -> None:
+        customer = ride_counts.customer
+        for customer_id in customer_ids:
+            customer(customer_id)
+
+    def complete_rides() -> None:
+        increment = ride_counts.increment
+        for customer_id in customer_ids:
+            increment(customer_id)
+
+    suite += [
+        Benchmark("ride_counts.customer", look_up_customers, len(customer_ids), "lookup"),
+        Benchmark("ride_counts.increment", complete_rides, len(customer_ids), "update"),
+        Benchmark("construct.Customer", build_customers, len(rows), "object"),
+        Benchmark("construct.RideContext", build_ride_contexts, len(rows), "object"),
+        Benchmark("construct.DiscountResult", build_discount_results, len(rows), "object"),
+        Benchmark("batch.execute_many", lambda: use_case.execute_many(batch), len(batch), "ride"),
+    ]
+
+    # The same rides as JSONL text and as a memory-mapped binary log
+    jsonl_text = "".join(
+        json.dumps(
+            {
+                "customer_id": c.customer.id,
+                "total_rides": c.customer.total_rides,
+                "distance_km": str(c.distance_km),
+                "base_price": str(c.base_price),
+                "ride_datetime": c.ride_datetime.isoformat(),
+            }
+        )
+        + "\n"
+        for c in batch
+    )
+    log_directory = tempfile.TemporaryDirectory()
+    log_path = Path(log_directory.name) / "rides.bin"
+    with log_path.open("wb") as stream:
+        RideLogWriter(stream).write_rides(batch)
+    ride_log = RideLog(log_path)
+    weakref.finalize(ride_log, log_directory.cleanup)
+
+    def parse_jsonl() -> None:
+        for _ in read_rides(io.StringIO(jsonl_text), "jsonl"):
+            pass
+
+    suite += [
+        Benchmark("batch.parse_jsonl", parse_jsonl, len(batch), "ride"),
+        Benchmark(
+            "batch.ride_log", lambda: price_ride_log(ride_log, io.BytesIO()), len(batch), "ride"
+        ),
+    ]
+
+    try:
+        from ride_discount.application.vectorized import RideColumns, VectorizedPricingEngine
+    except ImportError:  # NumPy is optional
+        return suite
+
+    columns = RideColumns.from_contexts(batch)
+    engine = VectorizedPricingEngine()
+    epoch = datetime(1970, 1, 1)
+    buffers = (
+        array.array("q", [c.customer.total_rides for c in batch]),
+        array.array("d", [float(c.distance_km) for c in batch]),
+        array.array("d", [float(c.base_price) for c in batch]),
+        array.array("q", [(c.ride_datetime - epoch) // timedelta(seconds=1) for c in batch]),
+    )
+    suite += [
+        Benchmark("batch.vectorized", lambda: engine.price(columns), len(batch), "ride"),
+        Benchmark(
+            "batch.vectorized_from_contexts",
+            lambda: engine.price(RideColumns.from_contexts(batch)),
+            len(batch),
+            "ride",
+        ),
+        Benchmark(
+            "batch.vectorized_from_buffers",
+            lambda: engine.price(RideColumns(*buffers)),
+            len(batch),
+            "ride",
+        ),
+        Benchmark(
+            "batch.vectorized_ride_log",
+            lambda: engine.price(ride_log.to_columns()),
+            len(batch),
+            "ride",
+        ),
+    ]
+    return suite
+
+
+def _dict_backed(cls: type) -> type:
+    """Frozen dataclass with the same fields as cls but a per-instance __dict__.
+
+    Used as the "before" reference of the memory benchmarks.
+    """
+    return make_dataclass(
+        f"{cls.__name__}WithDict", [(f.name, f.type) for f in fields(cls)], frozen=True
+    )
+
+
+def build_memory_suite() -> list[BenchmarkResult]:
+    """Measure bytes per Customer, RideContext and DiscountResult.
+
+    Each slotted class is measured next to a dict-backed twin with the same
+    fields, so the report records the per-object size before and after
+    __slots__. Field values are shared between objects, so only the objects
+    themselves are counted.
+
+    Returns:
+        One result per class and per dict-backed twin
+    """
+    context = generate_rides(1)[0]
+    customer = context.customer
+    percentage = Decimal("10")
+    factories: dict[str, tuple[type, Callable[[type], Callable[[int], object]]]] = {
+        "Customer": (
+            Customer,
+            lambda cls: lambda i: cls(id=customer.id, total_rides=customer.total_rides),
+        ),
+        "RideContext": (
+            RideContext,
+            lambda cls: lambda i: cls(
+                customer=customer,
+                distance_km=context.distance_km,
+                base_price=context.base_price,
+                ride_datetime=context.ride_datetime,
+            ),
+        ),
+        "DiscountResult": (
+            DiscountResult,
+            lambda cls: lambda i: cls(discount_percentage=percentage, reason="Benchmark"),
+        ),
+    }
+
+    results = []
+    for name, (cls, factory) in factories.items():
+        results.append(measure_memory(f"memory.{name}", factory(cls), MEMORY_OBJECTS))
+        results.append(
+            measure_memory(f"memory.{name}.dict_baseline", factory(_dict_backed(cls)), MEMORY_OBJECTS)
+        )
+    return results
+
+
+def build_allocation_suite() -> list[tuple[Benchmark, int]]:
+    """Create the allocation benchmarks: peak bytes allocated per quote.
+
+    Quotes are priced one per call, cycling through the quote mix, so the
+    temporaries of each quote are traced on their own.
+
+    Returns:
+        (case, calls per sample) pairs, for measure_allocations()
+    """
+    quotes = generate_rides(QUOTE_MIX_SIZE)
+    batch = generate_rides(BATCH_SIZE, seed=SEED + 1)
+    use_case = CalculateRideDiscountUseCase()
+    execute_quotes = itertools.cycle(quotes)
+    total_quotes = itertools.cycle(quotes)
+    return [
+        (
+            Benchmark(
+                "use_case.execute",
+                lambda: use_case.execute(next(execute_quotes)),
+                1,
+                "quote",
+            ),
+            len(quotes),
+        ),
+        (
+            Benchmark(
+                "use_case.execute_total",
+                lambda: use_case.execute_total(next(total_quotes)),
+                1,
+                "quote",
+            ),
+            len(quotes),
+        ),
+        (
+            Benchmark(
+                "batch.execute_many", lambda: use_case.execute_many(batch), len(batch), "ride"
+            ),
+            1,
+        ),
+    ]
+
+
+def build_reference() -> Benchmark:
+    """Create the reference workload timings are normalized against.
+
+    It exercises the interpreter paths pricing uses (Decimal arithmetic and
+    comparisons, datetime arithmetic, dict updates, calls) without any code
+    from this repository, so its speed tracks the machine and not the code
+    under test.
+
+    Returns:
+        The reference case, 1,000 steps per call
+    """
+    prices = [Decimal(index) / 7 for index in range(1_000)]
+    start = datetime(2024, 1, 1)
+    hour = timedelta(hours=1)
+    factor = Decimal("0.85")
+    limit = Decimal("50")
+
+    def reference() -> Decimal:
+        total = Decimal("0")
+        per_weekday: dict[int, int] = {}
+        for index, price in enumerate(prices):
+            weekday = (start + index * hour).weekday()
+            total += price * factor if price < limit else price
+            per_weekday[weekday] = per_weekday.get(weekday, 0) + 1
+        return total
+
+    return Benchmark("reference", reference, len(prices), "step")
@@ -0,0 +1,201 @@
+"""Seeded, production-like ride traffic shared by every benchmark and load test.
+
+A workload draws rides from a fixed population of repeat customers, with
+Zipf-skewed popularity, mixed with one-off customers seen only once.
+Ride counts are heavy-tailed (Pareto), distances log-normal, and departure
+times follow a weekly calendar: weekday commuter peaks, weekend nights.
+The same profile and seed always produce the same stream, and a shorter
+stream is a prefix of a longer one.
+
+Print a summary of each profile with: PYTHONPATH=src python -m benchmarks.workload
+"""
+
+import itertools
+import random
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from ride_discount import Customer, RideContext
+
+SEED = 20240115
+
+# Relative ride volume per hour of day: quiet nights, morning and evening peaks
+WEEKDAY_HOURLY_WEIGHTS = (2, 1, 1, 1, 1, 2, 5, 9, 10, 7, 5, 5, 6, 5, 5, 6, 8, 10, 9, 7, 6, 5, 4, 3)
+# Weekends: no commute, busy afternoons and late nights
+WEEKEND_HOURLY_WEIGHTS = (6, 5, 4, 3, 2, 1, 1, 2, 3, 4, 5, 6, 7, 7, 7, 7, 7, 7, 8, 8, 8, 8, 8, 7)
+# Relative ride volume per weekday, Monday first
+DAILY_WEIGHTS = (0.9, 0.95, 1.0, 1.05, 1.25, 1.2, 0.85)
+
+_CENTS = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class WorkloadProfile:
+    """Distributions a ride workload is drawn from.
+
+    Attributes:
+        customers: Size of the repeat-customer population
+        repeat_fraction: Share of rides taken by repeat customers; the rest
+            are taken by one-off customers
+        popularity_skew: Zipf exponent of repeat-customer popularity
+            (0: every repeat customer is equally likely)
+        ride_count_shape: Pareto shape of completed ride counts; lower is
+            heavier-tailed
+        ride_count_scale: Ride counts are int(scale * pareto) - scale
+        max_ride_count: Upper bound of completed ride counts
+        distance_mu: Mean of the logarithm of distances in km
+        distance_sigma: Standard deviation of the logarithm of distances
+        distance_decimals: Decimal places distances are rounded to
+        base_fare: Fixed part of the base price
+        price_per_km: Distance part of the base price
+        weekday_hourly_weights: Relative ride volume per hour, Monday-Friday
+        weekend_hourly_weights: Relative ride volume per hour, weekends
+        daily_weights: Relative ride volume per weekday, Monday first
+        start: Monday 00:00 of the first week of departures
+        weeks: Number of weeks departures are spread over
+    """
+
+    customers: int = 20_000
+    repeat_fraction: float = 0.8
+    popularity_skew: float = 1.0
+    ride_count_shape: float = 1.1
+    ride_count_scale: int = 4
+    max_ride_count: int = 5_000
+    distance_mu: float = 1.8
+    distance_sigma: float = 0.7
+    distance_decimals: int = 1
+    base_fare: Decimal = Decimal("4.50")
+    price_per_km: Decimal = Decimal("1.85")
+    weekday_hourly_weights: Sequence[float] = WEEKDAY_HOURLY_WEIGHTS
+    weekend_hourly_weights: Sequence[float] = WEEKEND_HOURLY_WEIGHTS
+    daily_weights: Sequence[float] = DAILY_WEIGHTS
+    start: datetime = datetime(2024, 1, 8)
+    weeks: int = 4
+
+    def __post_init__(self) -> None:
+        """Validate the profile.
+
+        Raises:
+            ValueError: If a size or fraction is out of range, a weight table
+                has the wrong length, or start is not a Monday at midnight
+        """
+        if self.customers < 1 or self.weeks < 1:
+            raise ValueError("customers and weeks must be positive")
+        if not 0 <= self.repeat_fraction <= 1:
+            raise ValueError("repeat_fraction must be between 0 and 1")
+        if len(self.weekday_hourly_weights) != 24 or len(self.weekend_hourly_weights) != 24:
+            raise ValueError("hourly weights need one weight per hour")
+        if len(self.daily_weights) != 7:
+            raise ValueError("daily weights need one weight per weekday")
+        if self.start.weekday() != 0 or self.start.time() != datetime.min.time():
+            raise ValueError("start must be a Monday at midnight")
+
+    def base_price(self, distance_km: Decimal) -> Decimal:
+        """Tariff of a ride: base fare plus a price per km, in cents."""
+        return (self.base_fare + distance_km * self.price_per_km).quantize(_CENTS)
+
+
+PROFILES = {
+    # Skewed repeat traffic, as observed in production
+    "default": WorkloadProfile(),
+    # A few very frequent customers dominate: caches pay off
+    "hot": WorkloadProfile(customers=2_000, repeat_fraction=0.95, popularity_skew=1.3),
+    # Every ride by a different customer: nothing to reuse between quotes
+    "uniform": WorkloadProfile(repeat_fraction=0.0),
+}
+
+
+def iter_rides(
+    profile: WorkloadProfile = PROFILES["default"], seed: int = SEED
+) -> Iterator[RideContext]:
+    """Endless reproducible stream of rides.
+
+    Args:
+        profile: Distributions to draw from
+        seed: Random seed
+
+    Yields:
+        Ride contexts, the same sequence for the same profile and seed
+    """
+    population_rng = random.Random(seed)
+    population = [
+        Customer(id=f"CUST-{index:07d}", total_rides=_ride_count(population_rng, profile))
+        for index in range(profile.customers)
+    ]
+    popularity = list(
+        itertools.accumulate(
+            1 / rank**profile.popularity_skew for rank in range(1, profile.customers + 1)
+        )
+    )
+    hour_weights = list(
+        itertools.accumulate(
+            daily_weight * hourly_weight
+            for day, daily_weight in enumerate(profile.daily_weights)
+            for hourly_weight in (
+                profile.weekday_hourly_weights if day < 5 else profile.weekend_hourly_weights
+            )
+        )
+    )
+
+    rng = random.Random(seed + 1)
+    for one_off in itertools.count():
+        if rng.random() < profile.repeat_fraction:
+            customer = population[bisect_right(popularity, rng.random() * popularity[-1])]
+        else:
+            customer = Customer(id=f"ONCE-{one_off:09d}", total_rides=_ride_count(rng, profile))
+        distance = Decimal(
+            str(
+                round(
+                    rng.lognormvariate(profile.distance_mu, profile.distance_sigma),
+                    profile.distance_decimals,
+                )
+            )
+        )
+        hour_of_week = bisect_right(hour_weights, rng.random() * hour_weights[-1])
+        yield RideContext(
+            customer=customer,
+            distance_km=distance,
+            base_price=profile.base_price(distance),
+            ride_datetime=profile.start
+            + timedelta(
+                weeks=rng.randrange(profile.weeks),
+                hours=hour_of_week,
+                minutes=rng.randrange(60),
+            ),
+        )
+
+
+def generate_rides(
+    count: int, profile: WorkloadProfile = PROFILES["default"], seed: int = SEED
+) -> list[RideContext]:
+    """The first count rides of iter_rides(profile, seed)."""
+    return list(itertools.islice(iter_rides(profile, seed), count))
+
+
+def _ride_count(rng: random.Random, profile: WorkloadProfile) -> int:
+    """Draw a heavy-tailed number of completed rides."""
+    scale = profile.ride_count_scale
+    ride_count = int(rng.paretovariate(profile.ride_count_shape) * scale) - scale
+    return min(ride_count, profile.max_ride_count)
+
+
+def describe(rides: Sequence[RideContext]) -> str:
+    """One-line summary of the skew of a workload."""
+    per_customer = Counter(context.customer.id for context in rides)
+    top = max(1, len(per_customer) // 100)
+    top_share = sum(count for _, count in per_customer.most_common(top)) / len(rides)
+    repeated = sum(count for count in per_customer.values() if count > 1) / len(rides)
+    night = sum(context.ride_datetime.hour < 6 for context in rides) / len(rides)
+    return (
+        f"{len(per_customer):7,d} customers, top 1% take {top_share:5.1%} of rides, "
+        f"{repeated:5.1%} by customers seen twice or more, {night:5.1%} between 0h and 6h"
+    )
+
+
+if __name__ == "__main__":
+    for name, profile in PROFILES.items():
+        print(f"{name:8s} {describe(generate_rides(100_000, profile))}")
@@ -1,21 +1,65 @@
-"""Ride discount system - Clean Architecture implementation."""
+"""Ride discount system - Clean Architecture implementation.
 
-from ride_discount.application.dtos import RideContext
-from ride_discount.application.use_cases import CalculateRideDiscountUseCase
-from ride_discount.domain.entities import Customer
+Importing the package is cheap: the public names are resolved on first
+access, and discount rules are discovered when the first quote is priced.
+Call warm_up() to pay that cost ahead of time, e.g. during a cold start.
+"""
 
-# Import rules to trigger auto-registration
-from ride_discount.domain.rules import (  # noqa: F401
-    DiscountRule,
-    OffPeakDiscountRule,
-    ProportionalDistanceDiscountRule,
-    RideFrequencyDiscountRule,
-)
-from ride_discount.domain.value_objects import DiscountResult
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ride_discount.application.dtos import RideContext
+    from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+    from ride_discount.domain.entities import Customer
+    from ride_discount.domain.rules import (
+        DiscountRule,
+        OffPeakDiscountRule,
+        ProportionalDistanceDiscountRule,
+        RideFrequencyDiscountRule,
+    )
+    from ride_discount.domain.rules.registry import RegistrySnapshot
+    from ride_discount.domain.value_objects import DiscountResult
+
+_EXPORTS = {
+    "Customer": "ride_discount.domain.entities",
+    "RideContext": "ride_discount.application.dtos",
+    "DiscountResult": "ride_discount.domain.value_objects",
+    "CalculateRideDiscountUseCase": "ride_discount.application.use_cases",
+    "DiscountRule": "ride_discount.domain.rules",
+    "OffPeakDiscountRule": "ride_discount.domain.rules",
+    "ProportionalDistanceDiscountRule": "ride_discount.domain.rules",
+    "RideFrequencyDiscountRule": "ride_discount.domain.rules",
+}
 
 __all__ = [
     "Customer",
     "RideContext",
     "DiscountResult",
     "CalculateRideDiscountUseCase",
+    "warm_up",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining an exported name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def warm_up() -> "RegistrySnapshot":
+    """Discover every discount rule and build their lookup tables now.
+
+    Returns:
+        The rule registry snapshot the next quotes will be priced with
+    """
+    from ride_discount.application.pipeline import CompiledRulePipeline
+    from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+    from ride_discount.domain.rules.base import DiscountRule
+
+    CompiledRulePipeline(CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT).rules
+    return DiscountRule.registry.snapshot
@@ -0,0 +1,8 @@
+"""Entry point for ``python -m ride_discount``."""
+
+import sys
+
+from ride_discount.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
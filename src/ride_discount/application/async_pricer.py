@@ -0,0 +1,181 @@
+"""asyncio facade that micro-batches concurrent pricing requests."""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.value_objects import DiscountResult
+
+PricedRide = tuple[Decimal, list[DiscountResult]]
+
+
+@dataclass(frozen=True)
+class PricerStats:
+    """Latency and batching statistics of an AsyncBatchPricer.
+
+    Latencies cover the time from quote() being awaited until its result is
+    available, over the most recent quotes only.
+
+    Attributes:
+        quotes: Total number of quotes resolved
+        batches: Total number of batches priced
+        mean_batch_size: Average number of quotes per batch
+        p50_latency: Median quote latency in seconds
+        p99_latency: 99th percentile quote latency in seconds
+    """
+
+    quotes: int
+    batches: int
+    mean_batch_size: float
+    p50_latency: float
+    p99_latency: float
+
+
+class AsyncBatchPricer:
+    """Prices rides for asyncio code without blocking the event loop.
+
+    Concurrent quote() calls are collected for at most max_delay seconds, or
+    until max_batch_size requests are waiting. Each group is then priced with
+    a single CalculateRideDiscountUseCase.execute_many call in an executor, and
+    every caller's future is resolved with its own result. Tune max_delay with
+    the latency percentiles reported by stats().
+
+    Use it as an async context manager, or call aclose() when done.
+    """
+
+    def __init__(
+        self,
+        use_case: CalculateRideDiscountUseCase | None = None,
+        max_delay: float = 0.002,
+        max_batch_size: int = 256,
+        executor: Executor | None = None,
+        latency_window: int = 10_000,
+    ) -> None:
+        """Create the pricer.
+
+        Args:
+            use_case: Use case pricing the batches (default: a new instance)
+            max_delay: Longest time in seconds a request waits for its batch to fill
+            max_batch_size: Batch size that triggers pricing immediately
+            executor: Executor running the batches (default: a private
+                single-thread executor, shut down by aclose())
+            latency_window: Number of recent quotes kept for the percentiles
+
+        Raises:
+            ValueError: If max_delay is negative or a size is not positive
+        """
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be positive")
+        if latency_window < 1:
+            raise ValueError("latency_window must be positive")
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self._use_case = use_case or CalculateRideDiscountUseCase()
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ride-pricer"
+        )
+        self._pending: list[tuple[RideContext, asyncio.Future[PricedRide], float]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._quotes = 0
+        self._batches = 0
+
+    async def quote(self, context: RideContext) -> PricedRide:
+        """Price one ride as part of the next batch.
+
+        Args:
+            context: The ride context to price
+
+        Returns:
+            A tuple of (final_price, applied_discounts), as execute() would return
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[PricedRide] = loop.create_future()
+        self._pending.append((context, future, time.perf_counter()))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+
+        return await future
+
+    def stats(self) -> PricerStats:
+        """Return quote latency percentiles and batching statistics."""
+        latencies = sorted(self._latencies)
+        return PricerStats(
+            quotes=self._quotes,
+            batches=self._batches,
+            mean_batch_size=self._quotes / self._batches if self._batches else 0.0,
+            p50_latency=_percentile(latencies, 50),
+            p99_latency=_percentile(latencies, 99),
+        )
+
+    async def aclose(self) -> None:
+        """Price the requests still waiting, then release the executor."""
+        self._flush()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncBatchPricer":
+        """Enter the async runtime context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the pricer when leaving the async runtime context."""
+        await self.aclose()
+
+    def _flush(self) -> None:
+        """Hand the waiting requests to the executor as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(self._price_batch(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _price_batch(
+        self, batch: list[tuple[RideContext, asyncio.Future[PricedRide], float]]
+    ) -> None:
+        """Price one batch off the event loop and resolve its futures."""
+        contexts = [context for context, _, _ in batch]
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self._use_case.execute_many, contexts
+            )
+        except Exception as error:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        finished = time.perf_counter()
+        self._batches += 1
+        self._quotes += len(batch)
+        for (_, future, started), result in zip(batch, results, strict=True):
+            self._latencies.append(finished - started)
+            if not future.done():
+                future.set_result(result)
+
+
+def _percentile(sorted_values: list[float], percent: int) -> float:
+    """Nearest-rank percentile of already sorted values (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-percent * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
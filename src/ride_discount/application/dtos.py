@@ -7,7 +7,7 @@ from decimal import Decimal
 from ride_discount.domain.entities import Customer
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RideContext:
     """DTO containing all information needed to calculate ride discounts.
 
@@ -31,3 +31,46 @@ class RideContext:
             raise ValueError("distance_km must be non-negative")
         if self.base_price < 0:
             raise ValueError("base_price must be non-negative")
+
+
+@dataclass(frozen=True, slots=True)
+class FixedPointRide:
+    """Integer-only counterpart of RideContext for the fixed-point pricing path.
+
+    Attributes:
+        total_rides: Total number of rides completed by the customer
+        distance_m: Distance of the ride in whole metres
+        price_minor: Base price in minor currency units (e.g. cents)
+        ride_datetime: Date and time when the ride occurs
+    """
+
+    total_rides: int
+    distance_m: int
+    price_minor: int
+    ride_datetime: datetime
+
+    @classmethod
+    def from_context(cls, context: RideContext, minor_digits: int = 2) -> "FixedPointRide | None":
+        """Convert a RideContext, if it is representable without rounding.
+
+        Args:
+            context: The ride context to convert
+            minor_digits: Decimal digits of the currency's minor unit
+
+        Returns:
+            The integer ride, or None if the distance is not a whole number of
+            metres or the price is not a whole number of minor units
+        """
+        distance_m = context.distance_km.scaleb(3)
+        price_minor = context.base_price.scaleb(minor_digits)
+        if (
+            distance_m != distance_m.to_integral_value()
+            or price_minor != price_minor.to_integral_value()
+        ):
+            return None
+        return cls(
+            total_rides=context.customer.total_rides,
+            distance_m=int(distance_m),
+            price_minor=int(price_minor),
+            ride_datetime=context.ride_datetime,
+        )
@@ -0,0 +1,258 @@
+"""Exact integer (fixed-point) pricing path."""
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from ride_discount.application.dtos import FixedPointRide, RideContext
+from ride_discount.application.pipeline import CompiledRulePipeline
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.fixed_point import PPM, percent_to_ppm
+from ride_discount.domain.rules.base import DiscountRule
+
+PpmFunction = Callable[[FixedPointRide], int | None]
+
+_EPOCH = datetime(1970, 1, 1)
+_INT64_FORMATS = ("q", "l")
+
+
+def _discount_exponent(discount_ppm: int) -> int:
+    """Exponent of discount_percentage / 100 on the Decimal path, from the discount in ppm.
+
+    The quotient keeps only the decimals it needs: 27% gives 0.27, 0% gives 0.
+    """
+    if not discount_ppm:
+        return 0
+    exponent = -6
+    while exponent < 0 and discount_ppm % 10 == 0:
+        discount_ppm //= 10
+        exponent += 1
+    return exponent
+
+
+def _int_column(column: Sequence[int]) -> Sequence[int]:
+    """An integer column as a sequence of Python ints, viewing int64 buffers in place.
+
+    Raw bytes (e.g. mmap slices) are read as native int64 values; buffers of
+    any other item type are rejected instead of being reinterpreted.
+    """
+    try:
+        view = memoryview(column)  # type: ignore[arg-type]
+    except TypeError:
+        return column
+    if view.format == "B" or (view.itemsize == 8 and view.format.lstrip("@=") in _INT64_FORMATS):
+        return view.cast("B").cast("q")
+    raise ValueError(f"integer columns must hold int64 items, not {view.format!r}")
+
+
+class FixedPointPricingEngine:
+    """Prices rides with integer arithmetic only.
+
+    Discounts are summed and capped as integer parts per million, and the
+    final price is computed as an exact integer. The result equals the Decimal
+    path of CalculateRideDiscountUseCase, cap included, without any Decimal
+    operation per ride. Decimals appear only at the API boundary, when
+    quote() converts a RideContext and returns its final price.
+
+    Some rides are priced through the Decimal use case instead. That happens
+    when a ride cannot be represented exactly (fractional metres or minor
+    units), or when a registered rule has no calculate_discount_ppm.
+
+    Attributes:
+        minor_digits: Decimal digits of the currency's minor unit
+        max_total_discount_ppm: The total discount cap in ppm
+    """
+
+    def __init__(self, minor_digits: int = 2) -> None:
+        """Create the engine.
+
+        Args:
+            minor_digits: Decimal digits of the currency's minor unit
+        """
+        self.minor_digits = minor_digits
+        self._use_case = CalculateRideDiscountUseCase()
+        self._pipeline = CompiledRulePipeline(CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT)
+        self.max_total_discount_ppm = percent_to_ppm(self._pipeline.max_total_discount)
+        # (registry version, calculators), replaced as one object so threads
+        # never pair calculators with the wrong version
+        self._calculators: tuple[int, tuple[PpmFunction, ...]] = (-1, ())
+
+    def total_discount_ppm(self, ride: FixedPointRide) -> int | None:
+        """Sum the rules' discounts for a ride and apply the cap.
+
+        Args:
+            ride: The integer ride
+
+        Returns:
+            Capped total discount in parts per million, or None if a
+            registered rule has no fixed-point implementation
+        """
+        total = 0
+        for calculate in self._ensure_calculators():
+            discount = calculate(ride)
+            if discount is None:
+                return None
+            total += discount
+        return min(total, self.max_total_discount_ppm)
+
+    @property
+    def rules(self) -> tuple[DiscountRule, ...]:
+        """Rule instances in evaluation order; bit i of a rule mask stands for rules[i]."""
+        return self._pipeline.rules
+
+    def price_with_rule_mask(self, ride: FixedPointRide) -> tuple[int, int] | None:
+        """Exact final price of a ride and the rules that discounted it.
+
+        Args:
+            ride: The integer ride
+
+        Returns:
+            A tuple of (final_price_scaled, rule_mask), where bit i of
+            rule_mask is set when rules[i] granted a non-zero discount, or
+            None if a registered rule has no fixed-point implementation
+        """
+        total = 0
+        mask = 0
+        for bit, calculate in enumerate(self._ensure_calculators()):
+            discount = calculate(ride)
+            if discount is None:
+                return None
+            if discount:
+                total += discount
+                mask |= 1 << bit
+        return ride.price_minor * (PPM - min(total, self.max_total_discount_ppm)), mask
+
+    def final_price_scaled(self, ride: FixedPointRide) -> int | None:
+        """Exact final price in millionths of a minor unit.
+
+        Args:
+            ride: The integer ride
+
+        Returns:
+            price_minor * (1,000,000 - capped discount ppm), or None if a
+            registered rule has no fixed-point implementation
+        """
+        discount_ppm = self.total_discount_ppm(ride)
+        if discount_ppm is None:
+            return None
+        return ride.price_minor * (PPM - discount_ppm)
+
+    def price_columns(
+        self,
+        total_rides: Sequence[int],
+        distance_m: Sequence[int],
+        price_minor: Sequence[int],
+        timestamps: Sequence[int],
+    ) -> list[int]:
+        """Exact final prices of a batch of integer rides stored column by column.
+
+        Columns may be sequences of ints or contiguous int64 buffers
+        (array.array("q"), NumPy int64 arrays, raw bytes such as mmap slices),
+        which are read in place. No Decimal or RideContext is built per ride,
+        unless a registered rule has no fixed-point implementation: such rides
+        are priced through the Decimal use case and rounded to a millionth of
+        a minor unit.
+
+        Args:
+            total_rides: Completed rides of each customer
+            distance_m: Ride distances in whole metres
+            price_minor: Base prices in minor currency units
+            timestamps: Naive wall-clock seconds since 1970-01-01
+
+        Returns:
+            Final price of each ride in millionths of a minor unit, in input order
+
+        Raises:
+            ValueError: If the columns differ in length, a buffer does not
+                hold int64 items, or a ride count, distance or price is negative
+        """
+        columns = [_int_column(c) for c in (total_rides, distance_m, price_minor, timestamps)]
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("all columns must have the same length")
+        for name, column in zip(("total_rides", "distance_m", "price_minor"), columns):
+            if column and min(column) < 0:
+                raise ValueError(f"{name} must be non-negative")
+
+        price = self.final_price_scaled
+        epoch = _EPOCH
+        final_prices: list[int] = []
+        for rides, metres, minor, timestamp in zip(*columns):
+            ride = FixedPointRide(rides, metres, minor, epoch + timedelta(seconds=timestamp))
+            scaled = price(ride)
+            final_prices.append(self._price_decimal(ride) if scaled is None else scaled)
+        return final_prices
+
+    def to_decimal(self, final_price_scaled: int, discount_ppm: int | None = None) -> Decimal:
+        """Convert a scaled integer final price to a Decimal in major units.
+
+        Args:
+            final_price_scaled: Final price in millionths of a minor unit
+            discount_ppm: The capped discount the price was computed with. If
+                given, the result has the exponent the Decimal path gives a base
+                price with minor_digits decimals, e.g. Decimal("32.8500") for
+                45.00 less 27%; otherwise it is exact to a millionth of a minor unit
+
+        Returns:
+            The final price
+        """
+        if discount_ppm is None:
+            return Decimal(final_price_scaled).scaleb(-(self.minor_digits + 6))
+        exponent = -self.minor_digits + _discount_exponent(discount_ppm)
+        return self._scaled_to_decimal(final_price_scaled, exponent)
+
+    def quote(self, context: RideContext) -> Decimal:
+        """Final price of a ride, equal to the one CalculateRideDiscountUseCase returns.
+
+        Args:
+            context: The ride context
+
+        Returns:
+            The final price after the capped discount. Its exponent is the one
+            the Decimal path gives, unless a rule's Decimal percentage carries
+            trailing zeros (e.g. from a distance of "25.0" km); the value is
+            equal either way
+        """
+        ride = FixedPointRide.from_context(context, self.minor_digits)
+        if ride is not None and (discount_ppm := self.total_discount_ppm(ride)) is not None:
+            base_exponent = context.base_price.as_tuple().exponent
+            assert isinstance(base_exponent, int), "finite prices have an integer exponent"
+            return self._scaled_to_decimal(
+                ride.price_minor * (PPM - discount_ppm),
+                base_exponent + _discount_exponent(discount_ppm),
+            )
+        return self._use_case.execute(context)[0]
+
+    def quote_many(self, contexts: Iterable[RideContext]) -> Iterator[Decimal]:
+        """Lazily quote final prices for a stream of rides, in input order."""
+        for context in contexts:
+            yield self.quote(context)
+
+    def _scaled_to_decimal(self, final_price_scaled: int, exponent: int) -> Decimal:
+        """A scaled integer final price as a Decimal with the given exponent."""
+        shift = exponent + self.minor_digits + 6
+        if shift >= 0:
+            coefficient = final_price_scaled // 10**shift
+        else:
+            coefficient = final_price_scaled * 10**-shift
+        return Decimal(coefficient).scaleb(exponent)
+
+    def _price_decimal(self, ride: FixedPointRide) -> int:
+        """Final price of an integer ride through the Decimal use case, in millionths."""
+        context = RideContext(
+            customer=Customer(id="", total_rides=ride.total_rides),
+            distance_km=Decimal(ride.distance_m).scaleb(-3),
+            base_price=Decimal(ride.price_minor).scaleb(-self.minor_digits),
+            ride_datetime=ride.ride_datetime,
+        )
+        final_price = self._use_case.execute(context)[0]
+        return int(final_price.scaleb(self.minor_digits + 6).to_integral_value())
+
+    def _ensure_calculators(self) -> tuple[PpmFunction, ...]:
+        """Bound calculate_discount_ppm methods of the current rule registry."""
+        version, calculators = self._calculators
+        if version != DiscountRule.registry.snapshot.version:
+            version, rules = self._pipeline.versioned_rules()
+            calculators = tuple(rule.calculate_discount_ppm for rule in rules)
+            self._calculators = (version, calculators)
+        return calculators
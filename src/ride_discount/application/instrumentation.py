@@ -0,0 +1,187 @@
+"""Opt-in per-rule timing and hit-rate instrumentation."""
+
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from threading import Lock
+
+from ride_discount.domain.rules.base import DiscountRule
+
+DEFAULT_LATENCY_BUCKETS_NS = (250, 500, 1_000, 2_000, 4_000, 8_000, 16_000, 32_000, 64_000)
+
+
+class RuleCounters:
+    """Mutable counters of a single rule, updated under the instrumentation's lock."""
+
+    __slots__ = ("calls", "hits", "total_ns", "histogram")
+
+    def __init__(self, bucket_count: int) -> None:
+        """Create zeroed counters with bucket_count + 1 histogram buckets."""
+        self.calls = 0
+        self.hits = 0
+        self.total_ns = 0
+        self.histogram = [0] * (bucket_count + 1)
+
+
+@dataclass(frozen=True)
+class RuleMetrics:
+    """Point-in-time metrics of one discount rule.
+
+    Attributes:
+        rule: Name of the rule class
+        calls: Number of evaluations
+        hits: Number of evaluations that returned a discount
+        total_ns: Cumulative evaluation time in nanoseconds
+        histogram: (upper bound in ns, count) per latency bucket; the last
+            bucket has no upper bound (None)
+    """
+
+    rule: str
+    calls: int
+    hits: int
+    total_ns: int
+    histogram: tuple[tuple[int | None, int], ...]
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of evaluations that returned a discount."""
+        return self.hits / self.calls if self.calls else 0.0
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean evaluation time in nanoseconds."""
+        return self.total_ns / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class PricingMetrics:
+    """Point-in-time metrics of all quotes priced with an instrumentation.
+
+    Attributes:
+        quotes: Number of quotes priced
+        capped_quotes: Quotes whose summed discounts exceeded the cap
+        rules: Metrics per rule, in evaluation order
+    """
+
+    quotes: int
+    capped_quotes: int
+    rules: tuple[RuleMetrics, ...]
+
+    @property
+    def cap_rate(self) -> float:
+        """Fraction of quotes clipped by the total discount cap."""
+        return self.capped_quotes / self.quotes if self.quotes else 0.0
+
+
+class PricingInstrumentation:
+    """Collects per-rule call counts, hit counts and latency histograms.
+
+    Pass an instance to CalculateRideDiscountUseCase to enable it. When no
+    instrumentation is passed, the compiled pipeline does not contain any
+    timing code at all, so disabled instrumentation costs nothing per quote.
+
+    An instrumentation may be shared by pipelines running in several
+    threads, with or without the GIL: counters are updated under a lock,
+    taken once per quote, so no count is lost.
+
+    Attributes:
+        latency_buckets_ns: Upper bounds of the latency histogram buckets
+    """
+
+    def __init__(self, latency_buckets_ns: tuple[int, ...] = DEFAULT_LATENCY_BUCKETS_NS) -> None:
+        """Create an empty instrumentation.
+
+        Args:
+            latency_buckets_ns: Ascending upper bounds of the histogram buckets
+
+        Raises:
+            ValueError: If the bucket bounds are not strictly ascending
+        """
+        if list(latency_buckets_ns) != sorted(set(latency_buckets_ns)):
+            raise ValueError("latency_buckets_ns must be strictly ascending")
+        self.latency_buckets_ns = latency_buckets_ns
+        self.quotes = 0
+        self.capped_quotes = 0
+        self._counters: dict[type[DiscountRule], RuleCounters] = {}
+        self._lock = Lock()
+
+    def counters_for(self, rule_class: type[DiscountRule]) -> RuleCounters:
+        """Counters of a rule, created on first use.
+
+        Args:
+            rule_class: The rule class being instrumented
+
+        Returns:
+            The live counters of that rule
+        """
+        with self._lock:
+            counters = self._counters.get(rule_class)
+            if counters is None:
+                counters = RuleCounters(len(self.latency_buckets_ns))
+                self._counters[rule_class] = counters
+        return counters
+
+    def record(self, counters: RuleCounters, elapsed_ns: int, hit: bool) -> None:
+        """Record one rule evaluation.
+
+        Args:
+            counters: Counters obtained from counters_for()
+            elapsed_ns: Duration of the evaluation
+            hit: Whether the rule returned a discount
+        """
+        with self._lock:
+            self._record(counters, elapsed_ns, hit)
+
+    def record_quote(
+        self, evaluations: Iterable[tuple[RuleCounters, int, bool]], capped: bool
+    ) -> None:
+        """Record one quote and all of its rule evaluations at once.
+
+        Args:
+            evaluations: (counters, elapsed_ns, hit) of each rule evaluated
+            capped: Whether the summed discounts exceeded the cap
+        """
+        with self._lock:
+            self.quotes += 1
+            self.capped_quotes += capped
+            for counters, elapsed_ns, hit in evaluations:
+                self._record(counters, elapsed_ns, hit)
+
+    def _record(self, counters: RuleCounters, elapsed_ns: int, hit: bool) -> None:
+        """Update the counters of one evaluation; the caller holds the lock."""
+        counters.calls += 1
+        counters.hits += hit
+        counters.total_ns += elapsed_ns
+        counters.histogram[bisect_left(self.latency_buckets_ns, elapsed_ns)] += 1
+
+    def snapshot(self) -> PricingMetrics:
+        """Return an immutable copy of the current metrics."""
+        bounds: list[int | None] = [*self.latency_buckets_ns, None]
+        with self._lock:
+            return self._snapshot(bounds)
+
+    def _snapshot(self, bounds: list[int | None]) -> PricingMetrics:
+        """Copy the metrics; the caller holds the lock."""
+        return PricingMetrics(
+            quotes=self.quotes,
+            capped_quotes=self.capped_quotes,
+            rules=tuple(
+                RuleMetrics(
+                    rule=rule_class.__name__,
+                    calls=counters.calls,
+                    hits=counters.hits,
+                    total_ns=counters.total_ns,
+                    histogram=tuple(zip(bounds, counters.histogram, strict=True)),
+                )
+                for rule_class, counters in self._counters.items()
+            ),
+        )
+
+    def reset(self) -> None:
+        """Zero every counter in place; compiled pipelines keep recording into them."""
+        with self._lock:
+            self.quotes = 0
+            self.capped_quotes = 0
+            for counters in self._counters.values():
+                counters.calls = counters.hits = counters.total_ns = 0
+                counters.histogram[:] = [0] * len(counters.histogram)
@@ -0,0 +1,336 @@
+"""Process-pool parallel pricing for large ride batches."""
+
+import gc
+import multiprocessing
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from itertools import count, islice
+from multiprocessing.context import BaseContext
+from threading import Lock
+from types import TracebackType
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.discovery import load_rules
+from ride_discount.domain.value_objects import DiscountResult
+
+PricedRide = tuple[Decimal, list[DiscountResult]]
+
+# Chunks cross the process boundary as columns of primitives rather than
+# lists of dataclasses: pickling a frozen dataclass costs about as much as
+# pricing the ride, which would cap the achievable speedup.
+# Naive datetimes travel as integer microseconds since the epoch.
+EncodedChunk = tuple[list[str], list[int], list[str], list[str], list[int] | list[datetime]]
+# Results come back as (final prices joined by spaces, combination index per
+# ride, combinations as indexes into the discounts, (percentage, reason) of
+# each distinct discount), so the parent rebuilds a chunk with C-level
+# map/zip calls and no Python code per ride.
+EncodedResults = tuple[str, "array[int]", list[tuple[int, ...]], list[tuple[str, str]]]
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+_worker_use_case: CalculateRideDiscountUseCase | None = None
+# Batches inherited by forked workers, by batch id; workers receive index ranges
+_inherited_batches: dict[int, Sequence[RideContext]] = {}
+_batch_ids = count()
+
+
+def _install_rules(rule_classes: tuple[type[DiscountRule], ...]) -> None:
+    """Worker initializer: reproduce the parent's rule registry exactly."""
+    global _worker_use_case
+    load_rules()  # so discovery cannot add to the installed rules later
+    DiscountRule.registry.replace(rule_classes)
+    _worker_use_case = CalculateRideDiscountUseCase()
+
+
+def _encode_chunk(contexts: list[RideContext]) -> EncodedChunk:
+    """Flatten ride contexts into columns of primitive values."""
+    ride_datetimes: list[int] | list[datetime]
+    try:
+        ride_datetimes = [(c.ride_datetime - _EPOCH) // _MICROSECOND for c in contexts]
+    except TypeError:  # timezone-aware datetimes are sent as they are
+        ride_datetimes = [c.ride_datetime for c in contexts]
+    return (
+        [c.customer.id for c in contexts],
+        [c.customer.total_rides for c in contexts],
+        [str(c.distance_km) for c in contexts],
+        [str(c.base_price) for c in contexts],
+        ride_datetimes,
+    )
+
+
+def _decode_chunk(chunk: EncodedChunk) -> list[RideContext]:
+    """Rebuild the ride contexts of an encoded chunk."""
+    customer_ids, total_rides, distances, base_prices, ride_datetimes = chunk
+    datetimes = [
+        _EPOCH + timedelta(microseconds=value) if isinstance(value, int) else value
+        for value in ride_datetimes
+    ]
+    return [
+        RideContext(
+            customer=Customer(id=customer_id, total_rides=rides),
+            distance_km=Decimal(distance_km),
+            base_price=Decimal(base_price),
+            ride_datetime=ride_datetime,
+        )
+        for customer_id, rides, distance_km, base_price, ride_datetime in zip(
+            customer_ids, total_rides, distances, base_prices, datetimes, strict=True
+        )
+    ]
+
+
+def _price_chunk(chunk: EncodedChunk) -> EncodedResults:
+    """Worker task: rebuild the contexts of one chunk, price them, encode the results."""
+    assert _worker_use_case is not None, "worker was not initialized"
+    return _encode_results(_worker_use_case.execute_many(_decode_chunk(chunk)))
+
+
+def _price_range(batch_id: int, start: int, stop: int) -> EncodedResults:
+    """Worker task: price a slice of a batch inherited from the parent, encode the results."""
+    assert _worker_use_case is not None, "worker was not initialized"
+    contexts = _inherited_batches[batch_id][start:stop]
+    return _encode_results(_worker_use_case.execute_many(contexts))
+
+
+def _encode_results(results: list[PricedRide]) -> EncodedResults:
+    """Encode priced rides; each distinct discount and combination is sent once."""
+    discount_index: dict[DiscountResult, int] = {}
+    combination_index: dict[tuple[int, ...], int] = {}
+    combinations = array("I")
+    for _, discounts in results:
+        combination = tuple(
+            discount_index.setdefault(discount, len(discount_index)) for discount in discounts
+        )
+        combinations.append(combination_index.setdefault(combination, len(combination_index)))
+    return (
+        " ".join([str(final_price) for final_price, _ in results]),
+        combinations,
+        list(combination_index),
+        [(str(d.discount_percentage), d.reason) for d in discount_index],
+    )
+
+
+def _decode_results(
+    encoded: EncodedResults, shared_results: dict[tuple[str, str], DiscountResult]
+) -> Iterator[PricedRide]:
+    """Rebuild the priced rides of a chunk; equal discounts share one instance."""
+    final_prices, combination_ids, combinations, discounts = encoded
+    # DiscountResult is immutable, so equal results can share one instance
+    chunk_discounts = [
+        shared_results.get(key)
+        or shared_results.setdefault(
+            key, DiscountResult(discount_percentage=Decimal(key[0]), reason=key[1])
+        )
+        for key in discounts
+    ]
+    chunk_combinations = [
+        tuple([chunk_discounts[index] for index in combination]) for combination in combinations
+    ]
+    return zip(
+        map(Decimal, final_prices.split()),
+        map(list, map(chunk_combinations.__getitem__, combination_ids)),
+        strict=True,
+    )
+
+
+@contextmanager
+def _collection_paused() -> Iterator[None]:
+    """Pause automatic garbage collection, restoring its previous state on exit.
+
+    Every container the parent creates while it rebuilds a batch is a result
+    that stays alive, so collections triggered meanwhile would free nothing.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _default_context() -> BaseContext:
+    """Prefer fork so rules registered at runtime reach the workers as they are."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+class ParallelPricingExecutor:
+    """Prices ride batches across a pool of worker processes.
+
+    The batch is split into chunks that are priced by CalculateRideDiscountUseCase
+    in worker processes. Results are returned in input order. Each worker is
+    initialized with the parent's rule registry. That includes rules registered
+    at runtime. If the registry changes after the pool was started, the pool is
+    replaced before the next batch.
+
+    With the fork start method (the default where available) any registered
+    rule works, including classes defined inside functions. With spawn or
+    forkserver, rule classes are pickled by reference and must be importable.
+
+    The executor is a context manager; use close() to stop the workers otherwise.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = 1000,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Create the executor; worker processes start on first use.
+
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+            chunk_size: Rides sent to a worker per task
+            mp_context: Multiprocessing context (default: fork where available)
+
+        Raises:
+            ValueError: If max_workers or chunk_size is not positive
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self._mp_context = mp_context or _default_context()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_version = -1
+        self._pool_lock = Lock()
+
+    def execute_many(self, contexts: Iterable[RideContext]) -> list[PricedRide]:
+        """Price a batch of rides in parallel.
+
+        Args:
+            contexts: The ride contexts to price
+
+        Returns:
+            One (final_price, applied_discounts) tuple per context, in input order
+        """
+        results: list[PricedRide] = []
+        with _collection_paused():
+            for chunk_results in self._iter_chunks(contexts):
+                results.extend(chunk_results)
+        return results
+
+    def iter_execute(self, contexts: Iterable[RideContext]) -> Iterator[PricedRide]:
+        """Lazily price a stream of rides in parallel.
+
+        At most two chunks per worker are in flight, so memory stays bounded
+        for arbitrarily long input streams.
+
+        Args:
+            contexts: The ride contexts to price
+
+        Yields:
+            One (final_price, applied_discounts) tuple per context, in input order
+        """
+        for chunk_results in self._iter_chunks(contexts):
+            yield from chunk_results
+
+    def _iter_chunks(self, contexts: Iterable[RideContext]) -> Iterator[Iterator[PricedRide]]:
+        """Price rides chunk by chunk, yielding each chunk's results in input order.
+
+        With the fork start method, a sequence of rides is not sent to the
+        workers at all: a pool forked for the batch inherits it and is sent
+        index ranges. Other inputs are encoded and sent to the shared pool.
+        """
+        if isinstance(contexts, Sequence) and self._mp_context.get_start_method() == "fork":
+            yield from self._iter_inherited_chunks(contexts)
+            return
+        pool = self._ensure_pool()
+        rides = iter(contexts)
+        pending: deque[Future[EncodedResults]] = deque()
+        max_pending = 2 * self.max_workers
+        shared_results: dict[tuple[str, str], DiscountResult] = {}
+
+        while True:
+            while len(pending) < max_pending and (chunk := list(islice(rides, self.chunk_size))):
+                pending.append(pool.submit(_price_chunk, _encode_chunk(chunk)))
+            if not pending:
+                return
+            yield _decode_results(pending.popleft().result(), shared_results)
+
+    def _iter_inherited_chunks(
+        self, contexts: Sequence[RideContext]
+    ) -> Iterator[Iterator[PricedRide]]:
+        """Price a sequence in a pool forked for it, sending index ranges only."""
+        if not contexts:
+            return
+        load_rules()
+        batch_id = next(_batch_ids)
+        _inherited_batches[batch_id] = contexts
+        # Objects alive now, the batch included, are not traversed by collections until
+        # the batch is done: neither by the parent while it rebuilds results, nor by
+        # the workers, whose collections would copy the parent's pages
+        gc.freeze()
+        starts = iter(range(0, len(contexts), self.chunk_size))
+        pending: deque[Future[EncodedResults]] = deque()
+        max_pending = 2 * self.max_workers
+        shared_results: dict[tuple[str, str], DiscountResult] = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, -(-len(contexts) // self.chunk_size)),
+                mp_context=self._mp_context,
+                initializer=_install_rules,
+                initargs=(DiscountRule.registry.snapshot.rules,),
+            ) as pool:
+                while True:
+                    while len(pending) < max_pending and (start := next(starts, None)) is not None:
+                        stop = start + self.chunk_size
+                        pending.append(pool.submit(_price_range, batch_id, start, stop))
+                    if not pending:
+                        return
+                    yield _decode_results(pending.popleft().result(), shared_results)
+        finally:
+            del _inherited_batches[batch_id]
+            gc.unfreeze()
+
+    def close(self) -> None:
+        """Shut the worker processes down."""
+        with self._pool_lock:
+            self._shutdown_pool()
+
+    def _shutdown_pool(self) -> None:
+        """Shut the current pool down, if any; the caller holds the pool lock."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "ParallelPricingExecutor":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut the workers down when leaving the runtime context."""
+        self.close()
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        """Start the pool, or restart it if the rule registry changed."""
+        load_rules()
+        with self._pool_lock:
+            snapshot = DiscountRule.registry.snapshot
+            if self._pool is None or snapshot.version != self._pool_version:
+                self._shutdown_pool()
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self._mp_context,
+                    initializer=_install_rules,
+                    initargs=(snapshot.rules,),
+                )
+                self._pool_version = snapshot.version
+            return self._pool
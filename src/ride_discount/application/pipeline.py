@@ -0,0 +1,276 @@
+"""Compiled discount rule pipeline for the application layer."""
+
+from collections.abc import Callable, Iterable, Iterator
+from decimal import Decimal
+from threading import Lock
+from time import perf_counter_ns
+from typing import NamedTuple
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.instrumentation import PricingInstrumentation
+from ride_discount.application.planner import EvaluationPlan
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.discovery import load_rules
+from ride_discount.domain.value_objects import DiscountResult
+
+PriceFunction = Callable[[RideContext], tuple[Decimal, list[DiscountResult]]]
+TotalFunction = Callable[[RideContext], tuple[Decimal, Decimal]]
+
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
+
+class _Compilation(NamedTuple):
+    """Everything compiled from one registry snapshot, published as a single object."""
+
+    version: int
+    rules: tuple[DiscountRule, ...]
+    price: PriceFunction
+    price_total: TotalFunction
+
+
+def _not_compiled(context: RideContext) -> tuple[Decimal, list[DiscountResult]]:
+    """Placeholder pricing function of a pipeline that has not been compiled yet."""
+    raise RuntimeError("pipeline is not compiled")
+
+
+def _not_compiled_total(context: RideContext) -> tuple[Decimal, Decimal]:
+    """Placeholder totals function of a pipeline that has not been compiled yet."""
+    raise RuntimeError("pipeline is not compiled")
+
+
+class CompiledRulePipeline:
+    """Pricing pipeline compiled once from the discount rule registry.
+
+    Every registered rule is instantiated a single time and its bound
+    calculate_discount method is resolved up front. Rule evaluation, discount
+    aggregation and the total discount cap are folded into one specialized
+    pricing function, so a quote costs only the rule logic itself.
+
+    The pipeline recompiles itself automatically whenever the rule registry
+    publishes a new snapshot version, which keeps the Open/Closed extension
+    model intact. Checking for changes is a single integer comparison.
+
+    Rules are called only for rides that satisfy their declared
+    PRECONDITIONS, as selected by an EvaluationPlan; a rule skipped this way
+    would have returned None anyway.
+
+    When an instrumentation is given, an instrumented variant of the pricing
+    function is compiled instead; without one, no timing code is generated.
+    Skipped rules are not counted as calls.
+
+    A second, totals-only function is always compiled as well. It evaluates
+    rules in descending order of their MAX_DISCOUNT and stops as soon as the
+    cap is reached, without building the list of applied discounts.
+
+    A pipeline may be shared by any number of threads, with or without the
+    GIL. Pricing reads one immutable compilation and takes no lock. A
+    recompilation is published with a single attribute assignment, under a
+    lock taken only when the registry version changed, so concurrent threads
+    never see rules and pricing functions from different snapshots.
+
+    Attributes:
+        max_total_discount: Maximum allowed total discount percentage
+        instrumentation: Optional per-rule metrics collector
+    """
+
+    def __init__(
+        self,
+        max_total_discount: Decimal,
+        instrumentation: PricingInstrumentation | None = None,
+    ) -> None:
+        """Create a pipeline; it is compiled on first use.
+
+        Args:
+            max_total_discount: Maximum allowed total discount percentage
+            instrumentation: Optional per-rule metrics collector
+        """
+        self.max_total_discount = max_total_discount
+        self.instrumentation = instrumentation
+        self._compiled = _Compilation(-1, (), _not_compiled, _not_compiled_total)
+        self._compile_lock = Lock()
+
+    @property
+    def version(self) -> int:
+        """Registry snapshot version of the current compilation."""
+        return self._ensure_compiled().version
+
+    @property
+    def rules(self) -> tuple[DiscountRule, ...]:
+        """Rule instances of the current compilation, in registration order."""
+        return self._ensure_compiled().rules
+
+    def versioned_rules(self) -> tuple[int, tuple[DiscountRule, ...]]:
+        """The version and rule instances of the current compilation, read together.
+
+        Reading the version and rules properties one after the other could
+        pair rules with the version of a later compilation.
+        """
+        compiled = self._ensure_compiled()
+        return compiled.version, compiled.rules
+
+    def price(self, context: RideContext) -> tuple[Decimal, list[DiscountResult]]:
+        """Price a single ride.
+
+        Args:
+            context: The ride context containing all necessary information
+
+        Returns:
+            A tuple of (final_price, applied_discounts)
+        """
+        compiled = self._compiled
+        if compiled.version != DiscountRule.registry.snapshot.version:
+            compiled = self._compile()
+        return compiled.price(context)
+
+    def price_total(self, context: RideContext) -> tuple[Decimal, Decimal]:
+        """Price a single ride without explaining the discounts.
+
+        Args:
+            context: The ride context containing all necessary information
+
+        Returns:
+            A tuple of (final_price, total_discount_percentage), both equal in
+            value to what price() computes
+        """
+        compiled = self._compiled
+        if compiled.version != DiscountRule.registry.snapshot.version:
+            compiled = self._compile()
+        return compiled.price_total(context)
+
+    def price_many(
+        self, contexts: Iterable[RideContext]
+    ) -> Iterator[tuple[Decimal, list[DiscountResult]]]:
+        """Lazily price a stream of rides.
+
+        The registry is checked once per yielded ride, so rules registered
+        while the stream is being consumed apply from the next ride on.
+
+        Args:
+            contexts: The ride contexts to price
+
+        Yields:
+            One (final_price, applied_discounts) tuple per context, in input order
+        """
+        compiled = self._compiled
+        for context in contexts:
+            if compiled.version != DiscountRule.registry.snapshot.version:
+                compiled = self._compile()
+            yield compiled.price(context)
+
+    def _ensure_compiled(self) -> _Compilation:
+        """Recompile if the registry published a new snapshot since the last compilation."""
+        compiled = self._compiled
+        if compiled.version != DiscountRule.registry.snapshot.version:
+            compiled = self._compile()
+        return compiled
+
+    def _compile(self) -> _Compilation:
+        """Discover and instantiate the registered rules and build the pricing functions.
+
+        Threads that find the pipeline outdated at the same time wait for a
+        single compilation of the current snapshot.
+        """
+        load_rules()
+        with self._compile_lock:
+            snapshot = DiscountRule.registry.snapshot
+            compiled = self._compiled
+            if compiled.version == snapshot.version:
+                return compiled
+            rules = tuple(rule_class() for rule_class in snapshot.rules)
+            if self.instrumentation is None:
+                price = self._compile_fast(rules)
+            else:
+                price = self._compile_instrumented(rules, self.instrumentation)
+            compiled = _Compilation(snapshot.version, rules, price, self._compile_totals(rules))
+            self._compiled = compiled
+        return compiled
+
+    def _compile_fast(self, rules: tuple[DiscountRule, ...]) -> PriceFunction:
+        """Build the uninstrumented pricing function."""
+        plan = EvaluationPlan(rules, [rule.calculate_discount for rule in rules])
+        select = plan.select
+        max_total_discount = self.max_total_discount
+
+        def price(context: RideContext) -> tuple[Decimal, list[DiscountResult]]:
+            applied_discounts = [
+                discount_result
+                for calculate in select(context)
+                if (discount_result := calculate(context))
+            ]
+
+            total_discount_percentage = _ZERO
+            for discount in applied_discounts:
+                total_discount_percentage += discount.discount_percentage
+            if total_discount_percentage > max_total_discount:
+                total_discount_percentage = max_total_discount
+
+            base_price = context.base_price
+            final_price = base_price - base_price * (total_discount_percentage / _HUNDRED)
+            return final_price, applied_discounts
+
+        return price
+
+    def _compile_instrumented(
+        self, rules: tuple[DiscountRule, ...], instrumentation: PricingInstrumentation
+    ) -> PriceFunction:
+        """Build a pricing function that records per-rule timings and cap hits."""
+        plan = EvaluationPlan(
+            rules,
+            [(rule.calculate_discount, instrumentation.counters_for(type(rule))) for rule in rules],
+        )
+        select = plan.select
+        record_quote = instrumentation.record_quote
+        max_total_discount = self.max_total_discount
+
+        def price(context: RideContext) -> tuple[Decimal, list[DiscountResult]]:
+            applied_discounts = []
+            evaluations = []
+            for calculate, counters in select(context):
+                started = perf_counter_ns()
+                discount_result = calculate(context)
+                elapsed_ns = perf_counter_ns() - started
+                evaluations.append((counters, elapsed_ns, discount_result is not None))
+                if discount_result:
+                    applied_discounts.append(discount_result)
+
+            total_discount_percentage = _ZERO
+            for discount in applied_discounts:
+                total_discount_percentage += discount.discount_percentage
+            capped = total_discount_percentage > max_total_discount
+            if capped:
+                total_discount_percentage = max_total_discount
+            record_quote(evaluations, capped)
+
+            base_price = context.base_price
+            final_price = base_price - base_price * (total_discount_percentage / _HUNDRED)
+            return final_price, applied_discounts
+
+        return price
+
+    def _compile_totals(self, rules: tuple[DiscountRule, ...]) -> TotalFunction:
+        """Build the totals-only function that stops once the cap is reached."""
+        # Rules without a published bound may grant anything, so they go first
+        ordered = sorted(
+            rules,
+            key=lambda rule: -(_HUNDRED if rule.MAX_DISCOUNT is None else rule.MAX_DISCOUNT),
+        )
+        plan = EvaluationPlan(ordered, [rule.calculate_discount for rule in ordered])
+        select = plan.select
+        max_total_discount = self.max_total_discount
+
+        def price_total(context: RideContext) -> tuple[Decimal, Decimal]:
+            total_discount_percentage = _ZERO
+            for calculate in select(context):
+                discount_result = calculate(context)
+                if discount_result:
+                    total_discount_percentage += discount_result.discount_percentage
+                    if total_discount_percentage >= max_total_discount:
+                        total_discount_percentage = max_total_discount
+                        break
+
+            base_price = context.base_price
+            final_price = base_price - base_price * (total_discount_percentage / _HUNDRED)
+            return final_price, total_discount_percentage
+
+        return price_total
@@ -0,0 +1,132 @@
+"""Evaluation planning from declared rule pre-conditions."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Sequence
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.preconditions import LOWER_BOUNDS, Precondition
+
+T = TypeVar("T")
+MaskFunction = Callable[[RideContext], int]
+
+
+def _compile_threshold_index(
+    field: str,
+    lower: bool,
+    conditions: Sequence[tuple[int, Precondition]],
+    all_mask: int,
+) -> MaskFunction:
+    """Compile the conditions of one field and bound direction into a mask function.
+
+    Each rule's tightest condition is kept and sorted by threshold. For a
+    lower bound, the rules whose condition holds for a value then form a
+    prefix of the sorted thresholds; for an upper bound, a suffix. One bisect
+    finds the bit mask of the rules that may still apply. The sort key is
+    (threshold, flag): a lower bound holds iff (threshold, strict) <=
+    (value, False), an upper bound iff (threshold, inclusive) >= (value, True).
+    """
+    tightest: dict[int, tuple[Any, bool]] = {}
+    for index, precondition in conditions:
+        flag = precondition.strict if lower else not precondition.strict
+        key = (precondition.threshold, flag)
+        current = tightest.get(index)
+        if current is None or (key > current if lower else key < current):
+            tightest[index] = key
+    entries = sorted((key, index) for index, key in tightest.items())
+    keys = [key for key, _ in entries]
+
+    unconstrained = all_mask
+    for index in tightest:
+        unconstrained &= ~(1 << index)
+    masks = [unconstrained]
+    for _, index in entries if lower else reversed(entries):
+        masks.append(masks[-1] | 1 << index)
+    if not lower:
+        masks.reverse()
+
+    getter = attrgetter(field)
+    if len(entries) == 1:
+        # A single threshold needs one comparison, not a bisect
+        (threshold, flag), _ = entries[0]
+        if lower:
+            passed, failed = masks[1], masks[0]
+            if flag:
+                return lambda context: passed if getter(context) > threshold else failed
+            return lambda context: passed if getter(context) >= threshold else failed
+        passed, failed = masks[0], masks[1]
+        if flag:
+            return lambda context: passed if getter(context) <= threshold else failed
+        return lambda context: passed if getter(context) < threshold else failed
+
+    if lower:
+        return lambda context: masks[bisect_right(keys, (getter(context), False))]
+    return lambda context: masks[bisect_left(keys, (getter(context), True))]
+
+
+class EvaluationPlan(Generic[T]):
+    """Selects, per ride, the rules whose declared pre-conditions all hold.
+
+    Pre-conditions are grouped by context field and bound direction, and
+    each group is indexed by threshold. Selecting the candidate rules for a
+    ride costs one comparison or bisect per group, however many rules there
+    are; rules without pre-conditions are always candidates. Candidates are
+    returned in registration order, and the selection for each distinct set
+    of candidates is built once and reused.
+
+    Attributes:
+        items: Per-rule values, in registration order
+        select: Function returning the items of the candidate rules of a ride
+    """
+
+    def __init__(self, rules: Sequence[DiscountRule], items: Sequence[T]) -> None:
+        """Build the plan.
+
+        Args:
+            rules: Rule instances, in registration order
+            items: Value returned for each rule (e.g. its bound calculate
+                method), in the same order
+        """
+        self.items = tuple(items)
+        all_mask = (1 << len(self.items)) - 1
+        groups: dict[tuple[str, bool], list[tuple[int, Precondition]]] = {}
+        for index, rule in enumerate(rules):
+            for precondition in rule.PRECONDITIONS:
+                lower = precondition.operator in LOWER_BOUNDS
+                groups.setdefault((precondition.field, lower), []).append((index, precondition))
+        self._mask_functions = tuple(
+            _compile_threshold_index(field, lower, conditions, all_mask)
+            for (field, lower), conditions in groups.items()
+        )
+        self._selections: dict[int, tuple[T, ...]] = {all_mask: self.items}
+        self.select: Callable[[RideContext], tuple[T, ...]] = self._compile_select(all_mask)
+
+    @property
+    def is_trivial(self) -> bool:
+        """True when no rule declares a pre-condition, so every rule always runs."""
+        return not self._mask_functions
+
+    def _compile_select(self, all_mask: int) -> Callable[[RideContext], tuple[T, ...]]:
+        """Build the selection function for the indexed groups."""
+        items = self.items
+        selections = self._selections
+        mask_functions = self._mask_functions
+
+        def selection_for(mask: int) -> tuple[T, ...]:
+            selection = tuple(item for bit, item in enumerate(items) if mask >> bit & 1)
+            selections[mask] = selection
+            return selection
+
+        if not mask_functions:
+            return lambda context: items
+
+        def select(context: RideContext) -> tuple[T, ...]:
+            mask = all_mask
+            for mask_function in mask_functions:
+                mask &= mask_function(context)
+            selection = selections.get(mask)
+            return selection if selection is not None else selection_for(mask)
+
+        return select
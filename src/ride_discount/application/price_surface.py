@@ -0,0 +1,247 @@
+"""Precomputed discount surfaces over hour of week x distance, for quote previews."""
+
+from bisect import bisect_right
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.pipeline import CompiledRulePipeline
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.schedule import HOURS_PER_DAY, HOURS_PER_WEEK
+
+BasePriceFunction = Callable[[Decimal], Decimal]
+
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+_HOUR = timedelta(hours=1)
+# 2024-01-01 was a Monday
+DEFAULT_WEEK_START = datetime(2024, 1, 1)
+
+# Context fields that are the same in every cell of a surface; customer
+# discounts are folded into the distance axis, which every cell includes
+_CUSTOMER_FIELDS = frozenset({"customer.id", "customer.total_rides"})
+# Fields that vary along the distance axis only (the base price is a function of distance)
+_DISTANCE_FIELDS = _CUSTOMER_FIELDS | {"distance_km", "base_price"}
+_HOUR_FIELDS = _CUSTOMER_FIELDS | {"ride_datetime"}
+
+
+@dataclass(frozen=True, slots=True)
+class PriceSurface:
+    """Discounts and final prices of one customer over hour of week x distance.
+
+    The surface is stored per axis: a discount per distance bucket and one
+    per hour of the week. Only rules that depend on both axes, or that do
+    not declare DEPENDS_ON, need a per-cell table. A point lookup adds the
+    axes, applies the cap and computes the final price exactly as
+    CalculateRideDiscountUseCase.execute() does. Surfaces are immutable,
+    hashable and picklable, so they can be cached or shipped to clients.
+
+    Distance bucket i covers [distances[i], distances[i + 1]) and is priced
+    at distances[i].
+
+    Attributes:
+        customer: The customer the surface was computed for
+        week_start: Monday 00:00 of the week the hours were evaluated in
+        distances: Sorted lower edges of the distance buckets, in kilometres
+        base_prices: Base price of each distance bucket
+        distance_discounts: Discount of the customer and distance rules per bucket
+        hour_discounts: Discount of the time rules per hour of the week (168)
+        cell_discounts: Discounts of the other rules, hour-major (168 x
+            len(distances)), or None when every rule depends on one axis
+        max_total_discount: Cap on the total discount percentage
+        version: Rule registry snapshot version the surface was computed from
+    """
+
+    customer: Customer
+    week_start: datetime
+    distances: tuple[Decimal, ...]
+    base_prices: tuple[Decimal, ...]
+    distance_discounts: tuple[Decimal, ...]
+    hour_discounts: tuple[Decimal, ...]
+    cell_discounts: tuple[Decimal, ...] | None
+    max_total_discount: Decimal
+    version: int
+
+    def discount_percentage(self, hour_of_week: int, bucket: int) -> Decimal:
+        """Capped total discount of one cell.
+
+        Args:
+            hour_of_week: weekday * 24 + hour (Monday=0), 0-167
+            bucket: Index of the distance bucket
+
+        Returns:
+            The total discount percentage after the cap
+        """
+        total = self.distance_discounts[bucket] + self.hour_discounts[hour_of_week]
+        if self.cell_discounts is not None:
+            total += self.cell_discounts[hour_of_week * len(self.distances) + bucket]
+        return total if total < self.max_total_discount else self.max_total_discount
+
+    def final_price(self, hour_of_week: int, bucket: int) -> Decimal:
+        """Final price of one cell, equal to what execute() returns for that ride.
+
+        Args:
+            hour_of_week: weekday * 24 + hour (Monday=0), 0-167
+            bucket: Index of the distance bucket
+
+        Returns:
+            The final price after the capped discount
+        """
+        base_price = self.base_prices[bucket]
+        return base_price - base_price * (self.discount_percentage(hour_of_week, bucket) / _HUNDRED)
+
+    def bucket(self, distance_km: Decimal) -> int:
+        """Index of the distance bucket containing a distance.
+
+        Raises:
+            ValueError: If the distance is below the first bucket
+        """
+        index = bisect_right(self.distances, distance_km) - 1
+        if index < 0:
+            raise ValueError(f"distance {distance_km} is below the first bucket")
+        return index
+
+    def quote(self, ride_datetime: datetime, distance_km: Decimal) -> Decimal:
+        """Preview the final price of a ride from its hour of week and distance bucket.
+
+        Args:
+            ride_datetime: Departure time; only its weekday and hour are used
+            distance_km: Route length
+
+        Returns:
+            The final price of the matching cell
+        """
+        hour_of_week = ride_datetime.weekday() * HOURS_PER_DAY + ride_datetime.hour
+        return self.final_price(hour_of_week, self.bucket(distance_km))
+
+    def final_prices(self) -> list[list[Decimal]]:
+        """Every final price, as 168 rows (hours of the week) of one price per bucket."""
+        return [
+            [self.final_price(hour_of_week, bucket) for bucket in range(len(self.distances))]
+            for hour_of_week in range(HOURS_PER_WEEK)
+        ]
+
+
+class PriceSurfaceBuilder:
+    """Computes PriceSurfaces from the registered rules in one pass.
+
+    Each rule is evaluated along the axes its DEPENDS_ON declares. Rules
+    reading only the customer run once per surface, rules reading the
+    distance or base price once per distance bucket, and rules reading the
+    departure time once per hour of the week. Only the remaining rules run
+    for every cell. With the built-in rules, a 168 x n surface costs
+    1 + n + 168 rule calls instead of 3 x 168 x n.
+    """
+
+    def __init__(self) -> None:
+        """Create the builder with a pipeline compiled from the rule registry."""
+        self._pipeline = CompiledRulePipeline(CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT)
+
+    def build(
+        self,
+        customer: Customer,
+        distances: Sequence[Decimal],
+        base_price: BasePriceFunction,
+        week_start: datetime = DEFAULT_WEEK_START,
+    ) -> PriceSurface:
+        """Compute the surface of one customer.
+
+        Args:
+            customer: The customer to preview prices for
+            distances: Lower edges of the distance buckets, in kilometres
+            base_price: Base price of a ride as a function of its distance
+            week_start: Monday 00:00 of the week to evaluate the hours in
+
+        Returns:
+            The surface
+
+        Raises:
+            ValueError: If distances is empty, not strictly increasing, or
+                week_start is not a Monday at midnight
+        """
+        distances = tuple(distances)
+        if not distances:
+            raise ValueError("at least one distance bucket is required")
+        if any(lower >= upper for lower, upper in zip(distances, distances[1:])):
+            raise ValueError("distances must be strictly increasing")
+        if week_start.weekday() != 0 or week_start.time() != datetime.min.time():
+            raise ValueError("week_start must be a Monday at midnight")
+
+        version, rules = self._pipeline.versioned_rules()
+        base_prices = tuple(base_price(distance) for distance in distances)
+        hours = [week_start + hour * _HOUR for hour in range(HOURS_PER_WEEK)]
+
+        def context(bucket: int, hour_of_week: int) -> RideContext:
+            return RideContext(
+                customer=customer,
+                distance_km=distances[bucket],
+                base_price=base_prices[bucket],
+                ride_datetime=hours[hour_of_week],
+            )
+
+        by_distance = [context(bucket, 0) for bucket in range(len(distances))]
+        by_hour = [context(0, hour_of_week) for hour_of_week in range(HOURS_PER_WEEK)]
+        distance_discounts = [_ZERO] * len(distances)
+        hour_discounts = [_ZERO] * HOURS_PER_WEEK
+        cell_discounts: list[Decimal] | None = None
+
+        cells: list[RideContext] = []
+
+        for rule in rules:
+            axis = _axis(type(rule))
+            if axis == "customer":
+                result = rule.calculate_discount(by_distance[0])
+                if result is not None:
+                    for bucket in range(len(distances)):
+                        distance_discounts[bucket] += result.discount_percentage
+            elif axis == "distance":
+                _accumulate(distance_discounts, rule, by_distance)
+            elif axis == "hour":
+                _accumulate(hour_discounts, rule, by_hour)
+            else:
+                if cell_discounts is None:
+                    cell_discounts = [_ZERO] * (HOURS_PER_WEEK * len(distances))
+                    cells = [
+                        context(bucket, hour_of_week)
+                        for hour_of_week in range(HOURS_PER_WEEK)
+                        for bucket in range(len(distances))
+                    ]
+                _accumulate(cell_discounts, rule, cells)
+
+        return PriceSurface(
+            customer=customer,
+            week_start=week_start,
+            distances=distances,
+            base_prices=base_prices,
+            distance_discounts=tuple(distance_discounts),
+            hour_discounts=tuple(hour_discounts),
+            cell_discounts=None if cell_discounts is None else tuple(cell_discounts),
+            max_total_discount=self._pipeline.max_total_discount,
+            version=version,
+        )
+
+
+def _axis(rule_class: type[DiscountRule]) -> str:
+    """What a rule's result varies with: "customer", "distance", "hour" or "cell"."""
+    depends_on = rule_class.DEPENDS_ON
+    if depends_on is not None:
+        if depends_on <= _CUSTOMER_FIELDS:
+            return "customer"
+        if depends_on <= _DISTANCE_FIELDS:
+            return "distance"
+        if depends_on <= _HOUR_FIELDS:
+            return "hour"
+    return "cell"
+
+
+def _accumulate(totals: list[Decimal], rule: DiscountRule, contexts: list[RideContext]) -> None:
+    """Add a rule's discount for each context to the matching total."""
+    calculate = rule.calculate_discount
+    for index, context in enumerate(contexts):
+        result = calculate(context)
+        if result is not None:
+            totals[index] += result.discount_percentage
@@ -0,0 +1,245 @@
+"""Bounded LRU + TTL memoization of discount rule results."""
+
+import time
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from threading import Lock
+from typing import Any, NamedTuple
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.pipeline import CompiledRulePipeline
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+PricedRide = tuple[Decimal, list[DiscountResult]]
+KeyFunction = Callable[[RideContext], Hashable]
+
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
+
+@dataclass(frozen=True)
+class QuoteCacheStats:
+    """Hit/miss statistics of a QuoteCache, counted per rule result.
+
+    Attributes:
+        hits: Rule results answered from the cache
+        misses: Rule results computed by their rule (expired entries included)
+        evictions: Entries dropped because a rule's cache was full
+        expirations: Entries dropped because they outlived the TTL
+        invalidations: Times the cache was emptied after a registry change
+        size: Entries currently cached, over all rules
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of rule results answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _CachedRule(NamedTuple):
+    """A rule's key function, calculate method and entries (None: not cached)."""
+
+    cache_key: KeyFunction
+    calculate: Callable[[RideContext], DiscountResult | None]
+    entries: dict[Hashable, list[Any]] | None
+
+
+class QuoteCache:
+    """Memoizes each rule's result on the inputs that rule reads.
+
+    Quotes are priced like CalculateRideDiscountUseCase.execute(), but every
+    registered rule's result is looked up under its own cache_key() first.
+    Caching per rule rather than per quote keeps hit rates high: a moved pin
+    changes the distance rule's key only, and the frequency and off-peak
+    results are still hits. The applied discounts are then summed, capped
+    and applied to each ride's own base price with the pipeline's
+    arithmetic, so quotes equal execute() exactly. Rules with no key
+    narrower than the whole ride (no DEPENDS_ON and no cache_key()
+    override) are called on every quote.
+
+    Each rule keeps up to max_size entries, which expire ttl seconds after
+    they were computed. Eviction is second-chance LRU: a hit only marks its
+    entry, and a full cache evicts the oldest unmarked entry, giving marked
+    ones another round. The cache empties itself when the rule registry
+    changes. The use case's instrumentation sees none of these quotes.
+
+    A cache may be shared between threads, with or without the GIL. Lookups
+    take no lock; inserting and evicting entries happen under a lock. Two
+    threads missing on the same key both compute it and store equal
+    entries. Statistics are updated without locking and are approximate
+    under contention.
+
+    Attributes:
+        max_size: Maximum number of cached entries per rule
+        ttl: Lifetime of an entry in seconds
+    """
+
+    def __init__(
+        self,
+        use_case: CalculateRideDiscountUseCase | None = None,
+        max_size: int = 10_000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            use_case: Use case whose discount cap applies (default: a new instance)
+            max_size: Maximum number of cached entries per rule
+            ttl: Lifetime of an entry in seconds
+            clock: Monotonic time source in seconds
+
+        Raises:
+            ValueError: If max_size or ttl is not positive
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+        use_case = use_case or CalculateRideDiscountUseCase()
+        self._pipeline = CompiledRulePipeline(use_case.MAX_TOTAL_DISCOUNT)
+        self._clock = clock
+        self._lock = Lock()
+        # (registry version, cached rules), replaced as one object
+        self._rules: tuple[int, tuple[_CachedRule, ...]] = (-1, ())
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def execute(self, context: RideContext) -> PricedRide:
+        """Price a ride, reusing cached rule results where possible.
+
+        Args:
+            context: The ride context to price
+
+        Returns:
+            A tuple of (final_price, applied_discounts), equal to what the
+            use case's execute() returns
+        """
+        version, rules = self._rules
+        if version != DiscountRule.registry.snapshot.version:
+            version, rules = self._compile()
+        now = self._clock()
+        hits = misses = 0
+        applied_discounts = []
+        for cache_key, calculate, entries in rules:
+            if entries is None:
+                discount_result = calculate(context)
+            else:
+                key = cache_key(context)
+                entry = entries.get(key)
+                if entry is not None and now < entry[0]:
+                    entry[2] = True  # recently used: survives the next eviction round
+                    discount_result = entry[1]
+                    hits += 1
+                else:
+                    discount_result = calculate(context)
+                    misses += 1
+                    self._store(entries, key, discount_result, now)
+            if discount_result:
+                applied_discounts.append(discount_result)
+        self._hits += hits
+        self._misses += misses
+
+        total_discount_percentage = _ZERO
+        for discount in applied_discounts:
+            total_discount_percentage += discount.discount_percentage
+        max_total_discount = self._pipeline.max_total_discount
+        if total_discount_percentage > max_total_discount:
+            total_discount_percentage = max_total_discount
+
+        base_price = context.base_price
+        final_price = base_price - base_price * (total_discount_percentage / _HUNDRED)
+        return final_price, applied_discounts
+
+    def execute_many(self, contexts: Iterable[RideContext]) -> list[PricedRide]:
+        """Price a batch of rides through the cache.
+
+        Args:
+            contexts: The ride contexts to price
+
+        Returns:
+            One (final_price, applied_discounts) tuple per context, in input order
+        """
+        return [self.execute(context) for context in contexts]
+
+    def stats(self) -> QuoteCacheStats:
+        """Return the current hit/miss statistics."""
+        return QuoteCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations,
+            size=sum(len(rule.entries) for rule in self._rules[1] if rule.entries is not None),
+        )
+
+    def clear(self) -> None:
+        """Drop every cached entry; statistics are kept."""
+        with self._lock:
+            for rule in self._rules[1]:
+                if rule.entries is not None:
+                    rule.entries.clear()
+
+    def _store(
+        self,
+        entries: dict[Hashable, list[Any]],
+        key: Hashable,
+        discount_result: DiscountResult | None,
+        now: float,
+    ) -> None:
+        """Cache a computed rule result, evicting entries if the rule's cache is full."""
+        evicted = 0
+        with self._lock:
+            stale = entries.pop(key, None)
+            if stale is not None and stale[0] <= now:
+                self._expirations += 1
+            while len(entries) >= self.max_size:
+                oldest_key = next(iter(entries))
+                oldest = entries.pop(oldest_key)
+                if oldest[2]:
+                    oldest[2] = False
+                    entries[oldest_key] = oldest  # second chance, at the back
+                else:
+                    evicted += 1
+            entries[key] = [now + self.ttl, discount_result, False]
+        self._evictions += evicted
+
+    def _compile(self) -> tuple[int, tuple[_CachedRule, ...]]:
+        """Rebuild the cached rules, and empty the cache, after a registry change."""
+        version, rules = self._pipeline.versioned_rules()
+        cached_rules = tuple(
+            _CachedRule(
+                rule.cache_key,
+                rule.calculate_discount,
+                None if _keys_whole_context(rule) else {},
+            )
+            for rule in rules
+        )
+        with self._lock:
+            current_version, current_rules = self._rules
+            if current_version != version:
+                if any(rule.entries for rule in current_rules):
+                    self._invalidations += 1
+                self._rules = (version, cached_rules)
+            return self._rules
+
+
+def _keys_whole_context(rule: DiscountRule) -> bool:
+    """Whether a rule's cache key is the whole ride, which never repeats."""
+    return rule.DEPENDS_ON is None and type(rule).cache_key is DiscountRule.cache_key
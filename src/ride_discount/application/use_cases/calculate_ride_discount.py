@@ -1,9 +1,11 @@
 """Use case for calculating ride discounts."""
 
+from collections.abc import Iterable, Iterator
 from decimal import Decimal
 
 from ride_discount.application.dtos import RideContext
-from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.application.instrumentation import PricingInstrumentation
+from ride_discount.application.pipeline import CompiledRulePipeline
 from ride_discount.domain.value_objects import DiscountResult
 
 
@@ -12,6 +14,8 @@ class CalculateRideDiscountUseCase:
 
     This use case orchestrates all registered discount rules and applies them
     to calculate the final price, respecting a maximum total discount cap.
+    Rules are evaluated through a CompiledRulePipeline, so they are
+    instantiated once per use case rather than once per ride.
 
     Attributes:
         MAX_TOTAL_DISCOUNT: Maximum allowed total discount percentage (50%)
@@ -19,6 +23,16 @@ class CalculateRideDiscountUseCase:
 
     MAX_TOTAL_DISCOUNT = Decimal("50")
 
+    def __init__(self, instrumentation: PricingInstrumentation | None = None) -> None:
+        """Create the use case; its pipeline is compiled on the first quote.
+
+        Args:
+            instrumentation: Optional collector of per-rule timings, hit counts
+                and cap hits; disabled (and free) when omitted
+        """
+        self.instrumentation = instrumentation
+        self._pipeline = CompiledRulePipeline(self.MAX_TOTAL_DISCOUNT, instrumentation)
+
     def execute(self, context: RideContext) -> tuple[Decimal, list[DiscountResult]]:
         """Execute the use case to calculate final ride price.
 
@@ -30,19 +44,49 @@ class CalculateRideDiscountUseCase:
                 - final_price: The final price after all discounts
                 - applied_discounts: List of all discounts that were applied
         """
-        applied_discounts = [
-            discount_result
-            for rule_class in DiscountRule.registered_rules
-            if (discount_result := rule_class().calculate_discount(context))
-        ]
+        return self._pipeline.price(context)
 
-        total_discount_percentage = min(
-            sum((d.discount_percentage for d in applied_discounts), Decimal("0")),
-            self.MAX_TOTAL_DISCOUNT,
-        )
+    def execute_total(self, context: RideContext) -> tuple[Decimal, Decimal]:
+        """Calculate the final ride price without the explanation list.
 
-        discount_amount = context.base_price * (total_discount_percentage / Decimal("100"))
-        final_price = context.base_price - discount_amount
+        Rules are evaluated largest MAX_DISCOUNT first, and evaluation stops
+        once MAX_TOTAL_DISCOUNT is reached. Use execute() where the applied
+        discounts are needed, e.g. for receipts. Quotes priced this way are
+        not recorded by the instrumentation.
 
-        return final_price, applied_discounts
+        Args:
+            context: The ride context containing all necessary information
+
+        Returns:
+            A tuple containing:
+                - final_price: The final price after all discounts
+                - total_discount_percentage: The capped total discount
+        """
+        return self._pipeline.price_total(context)
 
+    def execute_many(
+        self, contexts: Iterable[RideContext]
+    ) -> list[tuple[Decimal, list[DiscountResult]]]:
+        """Calculate final prices for a batch of rides.
+
+        Args:
+            contexts: The ride contexts to price
+
+        Returns:
+            One (final_price, applied_discounts) tuple per context, in input
+            order, identical to what execute() returns for each of them
+        """
+        return list(self._pipeline.price_many(contexts))
+
+    def iter_execute(
+        self, contexts: Iterable[RideContext]
+    ) -> Iterator[tuple[Decimal, list[DiscountResult]]]:
+        """Lazily calculate final prices for a stream of rides.
+
+        Args:
+            contexts: The ride contexts to price
+
+        Yields:
+            One (final_price, applied_discounts) tuple per context, in input order
+        """
+        return self._pipeline.price_many(contexts)
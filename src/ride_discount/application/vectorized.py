@@ -0,0 +1,213 @@
+"""Columnar, NumPy-vectorized pricing engine.
+
+NumPy is an optional dependency (``pip install ride-discount-system[vectorized]``);
+it is imported only when this module is used.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import numpy.typing as npt
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.pipeline import CompiledRulePipeline
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+
+FloatArray = npt.NDArray[np.float64]
+IntArray = npt.NDArray[np.int64]
+
+
+def _timestamp_column(timestamps: npt.ArrayLike) -> npt.NDArray[np.datetime64]:
+    """Timestamps as datetime64[s], viewing integer epoch seconds in place."""
+    column = np.asarray(timestamps)
+    if column.dtype.kind in "iu":
+        column = column.astype(np.int64, copy=False).view("datetime64[s]")
+    return column.astype("datetime64[s]", copy=False)
+
+
+class RideColumns:
+    """A batch of rides stored column by column.
+
+    Columns may be any sequence or any object exposing the buffer protocol
+    (array.array, memoryview, NumPy arrays, mmap slices...), so batches are
+    priced without building a Customer and a RideContext per row. Buffers
+    whose items already have the column's type (int64 ride counts, float64
+    distances and prices, int64 epoch seconds or datetime64[s] timestamps)
+    are used in place, without copying; other numeric buffers are converted
+    once.
+
+    Timestamps are naive wall-clock times, exactly like RideContext.ride_datetime;
+    hour of day and weekday are derived from them once per batch.
+
+    Attributes:
+        total_rides: Completed rides of each customer (int64)
+        distance_km: Ride distances in kilometers (float64)
+        base_price: Base prices before any discounts (float64)
+        timestamps: Ride date and time (datetime64[s])
+        customer_ids: Optional customer ids, used when a rule falls back
+            to the scalar calculate_discount path
+        hour: Hour of day of each ride (0-23)
+        weekday: Day of week of each ride (Monday=0 ... Sunday=6)
+    """
+
+    def __init__(
+        self,
+        total_rides: npt.ArrayLike,
+        distance_km: npt.ArrayLike,
+        base_price: npt.ArrayLike,
+        timestamps: npt.ArrayLike,
+        customer_ids: Sequence[str] | None = None,
+    ) -> None:
+        """Build the columns, validating the same invariants as the scalar DTOs.
+
+        Args:
+            total_rides: Completed rides of each customer
+            distance_km: Ride distances in kilometers
+            base_price: Base prices before any discounts
+            timestamps: Ride timestamps as datetime64 values, datetimes, or
+                integer seconds since 1970-01-01 (naive wall-clock time)
+            customer_ids: Optional customer ids, one per ride
+
+        Raises:
+            ValueError: If the columns differ in length or violate an invariant
+        """
+        self.total_rides: IntArray = np.asarray(total_rides, dtype=np.int64)
+        self.distance_km: FloatArray = np.asarray(distance_km, dtype=np.float64)
+        self.base_price: FloatArray = np.asarray(base_price, dtype=np.float64)
+        self.timestamps = _timestamp_column(timestamps)
+        self.customer_ids = customer_ids
+
+        size = len(self.total_rides)
+        lengths = {len(self.distance_km), len(self.base_price), len(self.timestamps), size}
+        if customer_ids is not None:
+            lengths.add(len(customer_ids))
+        if len(lengths) != 1:
+            raise ValueError("all columns must have the same length")
+        if (self.total_rides < 0).any():
+            raise ValueError("total_rides must be non-negative")
+        if (self.distance_km < 0).any():
+            raise ValueError("distance_km must be non-negative")
+        if (self.base_price < 0).any():
+            raise ValueError("base_price must be non-negative")
+
+        hours = self.timestamps.astype("datetime64[h]").astype(np.int64)
+        self.hour: IntArray = hours % 24
+        # 1970-01-01 was a Thursday (weekday 3)
+        self.weekday: IntArray = (hours // 24 + 3) % 7
+
+    def __len__(self) -> int:
+        """Number of rides in the batch."""
+        return len(self.total_rides)
+
+    @classmethod
+    def from_contexts(cls, contexts: Iterable[RideContext]) -> RideColumns:
+        """Build columns from ride contexts.
+
+        Args:
+            contexts: The ride contexts to convert
+
+        Returns:
+            The equivalent columnar batch
+        """
+        contexts = list(contexts)
+        return cls(
+            total_rides=[c.customer.total_rides for c in contexts],
+            distance_km=[float(c.distance_km) for c in contexts],
+            base_price=[float(c.base_price) for c in contexts],
+            timestamps=np.array([c.ride_datetime for c in contexts], dtype="datetime64[s]"),
+            customer_ids=[c.customer.id for c in contexts],
+        )
+
+    def context_at(self, index: int) -> RideContext:
+        """Materialize a single row as a RideContext for scalar rule evaluation.
+
+        Args:
+            index: Row position in the batch
+
+        Returns:
+            The ride context of that row
+        """
+        customer_id = self.customer_ids[index] if self.customer_ids is not None else ""
+        ride_datetime: datetime = self.timestamps[index].astype("datetime64[us]").item()
+        return RideContext(
+            customer=Customer(id=customer_id, total_rides=int(self.total_rides[index])),
+            distance_km=Decimal(repr(float(self.distance_km[index]))),
+            base_price=Decimal(repr(float(self.base_price[index]))),
+            ride_datetime=ride_datetime,
+        )
+
+
+@dataclass(frozen=True)
+class VectorizedPricingResult:
+    """Prices computed for a columnar batch.
+
+    Attributes:
+        final_prices: Final price of each ride after the capped discount
+        discount_percentages: Total discount percentage of each ride, after the cap
+        rule_discounts: Uncapped discount percentage per rule class (0 = not applied)
+    """
+
+    final_prices: FloatArray
+    discount_percentages: FloatArray
+    rule_discounts: dict[type[DiscountRule], FloatArray]
+
+
+class VectorizedPricingEngine:
+    """Prices whole columnar batches with array operations.
+
+    Each registered rule is evaluated through its calculate_discount_vectorized
+    implementation. Rules that do not provide one fall back to their scalar
+    calculate_discount, row by row. Results are floating point, so they match
+    the Decimal path up to float64 precision; use CalculateRideDiscountUseCase
+    where exact Decimal prices are required. The total discount is capped at
+    CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT across the whole batch.
+    """
+
+    def __init__(self) -> None:
+        """Create the engine with a pipeline compiled from the rule registry."""
+        self._pipeline = CompiledRulePipeline(CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT)
+
+    def price(self, columns: RideColumns) -> VectorizedPricingResult:
+        """Price every ride in the batch.
+
+        Args:
+            columns: The columnar ride batch
+
+        Returns:
+            Final prices, capped total discounts and per-rule discounts
+        """
+        rule_discounts: dict[type[DiscountRule], FloatArray] = {}
+        total_discount: FloatArray = np.zeros(len(columns), dtype=np.float64)
+
+        for rule in self._pipeline.rules:
+            discount = rule.calculate_discount_vectorized(columns)
+            if discount is None:
+                discount = self._evaluate_scalar(rule, columns)
+            rule_discounts[type(rule)] = discount
+            total_discount += discount
+
+        np.minimum(total_discount, float(self._pipeline.max_total_discount), out=total_discount)
+        final_prices = columns.base_price - columns.base_price * (total_discount / 100.0)
+
+        return VectorizedPricingResult(
+            final_prices=final_prices,
+            discount_percentages=total_discount,
+            rule_discounts=rule_discounts,
+        )
+
+    @staticmethod
+    def _evaluate_scalar(rule: DiscountRule, columns: RideColumns) -> FloatArray:
+        """Evaluate a rule without a vectorized implementation row by row."""
+        discount: FloatArray = np.zeros(len(columns), dtype=np.float64)
+        for index in range(len(columns)):
+            result = rule.calculate_discount(columns.context_at(index))
+            if result:
+                discount[index] = float(result.discount_percentage)
+        return discount
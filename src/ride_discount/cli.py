@@ -0,0 +1,196 @@
+"""Command line interface for the ride discount system.
+
+Usage:
+    python -m ride_discount price [INPUT] [--format csv|jsonl] [--output-format csv|jsonl]
+    python -m ride_discount serve [--host HOST] [--port PORT]
+"""
+
+import argparse
+import sys
+from collections.abc import Sequence
+from itertools import islice
+from pathlib import Path
+from typing import TextIO
+
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.infrastructure.ride_io import RideFormat, RideResultWriter, read_rides
+
+DEFAULT_BATCH_SIZE = 1000
+IO_BUFFER_SIZE = 1 << 20
+# Defaults of `serve`; http_server is only imported when the server starts
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_MAX_BODY_BYTES = 1 << 20
+
+
+def price_stream(
+    source: TextIO,
+    sink: TextIO,
+    input_format: RideFormat,
+    output_format: RideFormat,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Price every ride read from source and stream the results to sink.
+
+    At most batch_size rides are held in memory at any time, regardless of
+    the size of the input.
+
+    Args:
+        source: Text stream with rides in input_format
+        sink: Text stream the priced rides are written to
+        input_format: Format of the input, "csv" or "jsonl"
+        output_format: Format of the output, "csv" or "jsonl"
+        batch_size: Number of rides parsed, priced and written together
+
+    Returns:
+        The number of rides priced
+    """
+    use_case = CalculateRideDiscountUseCase()
+    writer = RideResultWriter(sink, output_format)
+    rides = read_rides(source, input_format)
+    priced = 0
+
+    while batch := list(islice(rides, batch_size)):
+        writer.write_batch(batch, use_case.execute_many(batch))
+        priced += len(batch)
+
+    return priced
+
+
+def _infer_format(path: str | None, explicit: str | None) -> RideFormat:
+    """Pick the explicit format, else infer it from the file extension (default jsonl)."""
+    if explicit is not None:
+        return "csv" if explicit == "csv" else "jsonl"
+    if path is not None and Path(path).suffix.lower() == ".csv":
+        return "csv"
+    return "jsonl"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ride_discount command."""
+    parser = argparse.ArgumentParser(
+        prog="python -m ride_discount",
+        description="Ride discount system command line tools.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    price = commands.add_parser(
+        "price",
+        help="price rides read from CSV or JSONL",
+        description=(
+            "Price rides and stream the results. Each input record needs the fields "
+            "customer_id, total_rides, distance_km, base_price and ride_datetime (ISO 8601)."
+        ),
+    )
+    price.add_argument("input", nargs="?", default="-", help="input file (default: stdin)")
+    price.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    price.add_argument(
+        "-f", "--format", choices=("csv", "jsonl"), help="input format (default: from extension)"
+    )
+    price.add_argument(
+        "--output-format", choices=("csv", "jsonl"), help="output format (default: input format)"
+    )
+    price.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"rides priced per batch (default: {DEFAULT_BATCH_SIZE})",
+    )
+
+    serve = commands.add_parser(
+        "serve",
+        help="serve quotes over HTTP",
+        description=(
+            "Serve quotes over HTTP/1.1 with keep-alive: POST /quote prices one ride "
+            'object, POST /quotes prices {"rides": [...]}, GET /health reports status.'
+        ),
+    )
+    serve.add_argument("--host", default=DEFAULT_HOST, help=f"(default: {DEFAULT_HOST})")
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help=f"0 picks a free port (default: {DEFAULT_PORT})",
+    )
+    serve.add_argument(
+        "--max-body-bytes",
+        type=int,
+        default=DEFAULT_MAX_BODY_BYTES,
+        help=f"largest request body accepted (default: {DEFAULT_MAX_BODY_BYTES})",
+    )
+    serve.add_argument("--access-log", action="store_true", help="log every request to stderr")
+    return parser
+
+
+def _open_text(path: str, mode: str, standard: TextIO) -> TextIO:
+    """Open path with a large buffer, or return the standard stream for '-'."""
+    if path == "-":
+        return standard
+    return open(path, mode, buffering=IO_BUFFER_SIZE, encoding="utf-8", newline="")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Process exit status
+    """
+    args = build_parser().parse_args(argv)
+    if args.command == "serve":
+        return _serve(args)
+    return _price(args)
+
+
+def _serve(args: argparse.Namespace) -> int:
+    """Run the quote server until interrupted."""
+    # Imported here so that other commands do not load http.server
+    from ride_discount.infrastructure.http_server import QuoteServer
+
+    try:
+        server = QuoteServer(
+            (args.host, args.port),
+            max_body_bytes=args.max_body_bytes,
+            access_log=args.access_log,
+        )
+    except (ValueError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    with server:
+        host, port = server.server_address[:2]
+        print(f"Serving quotes on http://{host}:{port}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _price(args: argparse.Namespace) -> int:
+    """Price a file or stdin into a file or stdout."""
+    if args.batch_size < 1:
+        print("error: --batch-size must be positive", file=sys.stderr)
+        return 2
+
+    input_format = _infer_format(None if args.input == "-" else args.input, args.format)
+    output_format = _infer_format(None, args.output_format or input_format)
+
+    source: TextIO | None = None
+    sink: TextIO | None = None
+    try:
+        source = _open_text(args.input, "r", sys.stdin)
+        sink = _open_text(args.output, "w", sys.stdout)
+        price_stream(source, sink, input_format, output_format, args.batch_size)
+    except (ValueError, ArithmeticError, OSError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if source is not None and source is not sys.stdin:
+            source.close()
+        if sink is sys.stdout:
+            sink.flush()
+        elif sink is not None:
+            sink.close()
+    return 0
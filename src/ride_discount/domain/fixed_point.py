@@ -0,0 +1,40 @@
+"""Integer fixed-point units for the exact, Decimal-free pricing path.
+
+Percentages are expressed in parts per million of the price (ppm): 1% is
+10,000 ppm and one basis point is 100 ppm. Whole basis points are too coarse
+for the distance rule, which grants 0.05 basis points per metre; ppm keeps
+every built-in rule exact for distances in whole metres.
+
+Prices are integers in minor currency units (cents for two decimal digits).
+A final price is exact in units of one millionth of a minor unit:
+price_minor * (PPM - discount_ppm).
+"""
+
+from decimal import Decimal
+
+PPM = 1_000_000
+PPM_PER_PERCENT = PPM // 100
+METRES_PER_KM = 1_000
+
+
+def percent_to_ppm(percentage: Decimal) -> int:
+    """Convert a percentage to ppm, exactly.
+
+    Args:
+        percentage: Percentage such as Decimal("0.5")
+
+    Returns:
+        The percentage in parts per million
+
+    Raises:
+        ValueError: If the percentage has more precision than one ppm
+    """
+    ppm = percentage * PPM_PER_PERCENT
+    if ppm != ppm.to_integral_value():
+        raise ValueError(f"{percentage}% is not a whole number of ppm")
+    return int(ppm)
+
+
+def ppm_to_percent(ppm: int) -> Decimal:
+    """Convert ppm back to a Decimal percentage (API boundary only)."""
+    return Decimal(ppm) / PPM_PER_PERCENT
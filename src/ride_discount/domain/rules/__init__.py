@@ -1,13 +1,44 @@
-"""Discount rules for the domain layer."""
+"""Discount rules for the domain layer.
 
-from ride_discount.domain.rules.base import DiscountRule
-from ride_discount.domain.rules.distance import ProportionalDistanceDiscountRule
-from ride_discount.domain.rules.frequency import RideFrequencyDiscountRule
-from ride_discount.domain.rules.offpeak import OffPeakDiscountRule
+Names are resolved on first access, so importing this package does not
+import any rule module. Rules register themselves when their module is
+imported; see ride_discount.domain.rules.discovery.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ride_discount.domain.rules.base import DiscountRule
+    from ride_discount.domain.rules.distance import ProportionalDistanceDiscountRule
+    from ride_discount.domain.rules.frequency import RideFrequencyDiscountRule
+    from ride_discount.domain.rules.offpeak import OffPeakDiscountRule
+    from ride_discount.domain.rules.registry import RegistrySnapshot, RuleRegistry
+
+_EXPORTS = {
+    "DiscountRule": "ride_discount.domain.rules.base",
+    "ProportionalDistanceDiscountRule": "ride_discount.domain.rules.distance",
+    "RideFrequencyDiscountRule": "ride_discount.domain.rules.frequency",
+    "OffPeakDiscountRule": "ride_discount.domain.rules.offpeak",
+    "RegistrySnapshot": "ride_discount.domain.rules.registry",
+    "RuleRegistry": "ride_discount.domain.rules.registry",
+}
 
 __all__ = [
     "DiscountRule",
     "RideFrequencyDiscountRule",
     "ProportionalDistanceDiscountRule",
     "OffPeakDiscountRule",
+    "RegistrySnapshot",
+    "RuleRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining an exported name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
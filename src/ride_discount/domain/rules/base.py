@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Hashable
+from decimal import Decimal
+from operator import attrgetter
 from typing import TYPE_CHECKING, ClassVar
 
+from ride_discount.domain.rules.discovery import load_rules
+from ride_discount.domain.rules.preconditions import CONTEXT_FIELDS, Precondition
+from ride_discount.domain.rules.registry import RuleRegistry
 from ride_discount.domain.value_objects import DiscountResult
 
 if TYPE_CHECKING:
-    from ride_discount.application.dtos import RideContext
+    import numpy as np
+    import numpy.typing as npt
 
+    from ride_discount.application.dtos import FixedPointRide, RideContext
+    from ride_discount.application.vectorized import RideColumns
 
-class DiscountRule(ABC):
+
+class _DiscountRuleMeta(ABCMeta):
+    """Metaclass exposing the current registry snapshot as registered_rules.
+
+    A property on the metaclass makes the class attribute read-only;
+    DiscountRule defines the matching instance property.
+    """
+
+    @property
+    def registered_rules(cls) -> tuple[type[DiscountRule], ...]:
+        """Registered rule classes of the current snapshot, discovering them first."""
+        load_rules()
+        return DiscountRule.registry.snapshot.rules
+
+
+class DiscountRule(ABC, metaclass=_DiscountRuleMeta):
     """Abstract base class for discount rules.
 
     This class implements the Open/Closed Principle through automatic
@@ -25,20 +49,58 @@ class DiscountRule(ABC):
     without modifying existing code - simply create a new subclass and
     it will be automatically registered and applied.
 
+    Rules may declare the context fields they read (DEPENDS_ON) and cheap
+    necessary conditions (PRECONDITIONS). The pricing pipeline uses them to
+    skip rules that cannot apply to a ride without calling them. A rule may
+    also publish MAX_DISCOUNT, the largest percentage it can ever return, so
+    totals-only pricing can evaluate large discounts first and stop at the cap.
+
+    Registered classes are kept by a RuleRegistry that publishes immutable,
+    versioned snapshots, so pricing can read them without locking while
+    rules are being registered.
+
     Class Attributes:
-        registered_rules: List of all registered discount rule classes
+        registry: Versioned registry of all discount rule classes
+        registered_rules: Rule classes of the current snapshot (read-only)
+        DEPENDS_ON: Dotted context fields the rule reads, or None for any
+        PRECONDITIONS: Conditions that must all hold for a discount to apply
+        MAX_DISCOUNT: Upper bound of the rule's discount percentage, or None
     """
 
-    registered_rules: ClassVar[list[type[DiscountRule]]] = []
+    registry: ClassVar[RuleRegistry] = RuleRegistry()
+    DEPENDS_ON: ClassVar[frozenset[str] | None] = None
+    PRECONDITIONS: ClassVar[tuple[Precondition, ...]] = ()
+    MAX_DISCOUNT: ClassVar[Decimal | None] = None
+
+    @property
+    def registered_rules(self) -> tuple[type[DiscountRule], ...]:
+        """Registered rule classes of the current snapshot, as on the class."""
+        return type(self).registered_rules
 
     def __init_subclass__(cls) -> None:
         """Automatically register new discount rule subclasses.
 
         This method is called when a new subclass is defined, ensuring
         automatic registration without manual intervention.
+
+        Raises:
+            ValueError: If DEPENDS_ON names an unknown field, a pre-condition
+                reads a field outside DEPENDS_ON, or MAX_DISCOUNT is not 0-100
         """
         super().__init_subclass__()
-        DiscountRule.registered_rules.append(cls)
+        if cls.MAX_DISCOUNT is not None and not 0 <= cls.MAX_DISCOUNT <= 100:
+            raise ValueError(f"{cls.__name__}.MAX_DISCOUNT must be between 0 and 100")
+        if cls.DEPENDS_ON is not None:
+            unknown = cls.DEPENDS_ON - CONTEXT_FIELDS
+            if unknown:
+                raise ValueError(f"{cls.__name__}.DEPENDS_ON has unknown fields: {sorted(unknown)}")
+            for precondition in cls.PRECONDITIONS:
+                if precondition.field not in cls.DEPENDS_ON:
+                    raise ValueError(
+                        f"{cls.__name__} pre-condition reads {precondition.field!r}, "
+                        "which is not in DEPENDS_ON"
+                    )
+        DiscountRule.registry.register(cls)
 
     @abstractmethod
     def calculate_discount(self, context: RideContext) -> DiscountResult | None:
@@ -51,3 +113,56 @@ class DiscountRule(ABC):
             DiscountResult if a discount applies, None otherwise
         """
         pass
+
+    def calculate_discount_vectorized(
+        self, columns: RideColumns
+    ) -> npt.NDArray[np.float64] | None:
+        """Calculate the discount for a whole columnar batch at once.
+
+        Overriding this method is optional. Rules that keep the default are
+        evaluated through calculate_discount, one row at a time, by the
+        vectorized pricing engine.
+
+        Args:
+            columns: The columnar ride batch
+
+        Returns:
+            Discount percentage per ride (0 where the rule does not apply),
+            or None if the rule has no vectorized implementation
+        """
+        return None
+
+    def calculate_discount_ppm(self, ride: FixedPointRide) -> int | None:
+        """Calculate the discount with integer arithmetic only.
+
+        Overriding this method is optional. The fixed-point pricing engine
+        uses it when every registered rule implements it, and falls back to
+        the Decimal path otherwise.
+
+        Args:
+            ride: The ride with integer distance (metres) and price (minor units)
+
+        Returns:
+            Discount in parts per million of the price (0 where the rule does
+            not apply), or None if the rule has no fixed-point implementation
+        """
+        return None
+
+    def cache_key(self, context: RideContext) -> Hashable:
+        """Return the part of the context this rule's result depends on.
+
+        Two contexts with equal keys must produce equal results. QuoteCache
+        stores this rule's results under their key, so rides that differ
+        only in inputs the rule does not read share its result. Overriding
+        is optional; the default key is the DEPENDS_ON fields when declared,
+        and the whole context otherwise, which QuoteCache does not cache.
+
+        Args:
+            context: The ride context to be priced
+
+        Returns:
+            A hashable key covering every input calculate_discount reads
+        """
+        if self.DEPENDS_ON is None:
+            return context
+        return attrgetter(*sorted(self.DEPENDS_ON))(context)
@@ -0,0 +1,89 @@
+"""Lazy discovery of built-in and third-party discount rules.
+
+Rule classes register themselves when their module is imported. Nothing is
+imported when ``ride_discount`` itself is imported; load_rules() imports the
+built-in rule modules and every rule published under the
+``ride_discount.rules`` entry-point group, once, when the first quote is
+priced or when ``ride_discount.warm_up()`` is called.
+
+A third-party package publishes its rules in its own pyproject.toml::
+
+    [project.entry-points."ride_discount.rules"]
+    loyalty = "acme_rules.loyalty:LoyaltyDiscountRule"
+"""
+
+import importlib
+from importlib.metadata import entry_points
+from threading import RLock
+
+ENTRY_POINT_GROUP = "ride_discount.rules"
+
+# Built-in rules are evaluated in this order, before any other rule
+BUILTIN_RULE_MODULES = (
+    "ride_discount.domain.rules.distance",
+    "ride_discount.domain.rules.frequency",
+    "ride_discount.domain.rules.offpeak",
+)
+
+_loaded = False
+_loading = False
+# Reentrant, so that a rule module calling load_rules() while it is imported
+# gets an error instead of deadlocking; other threads wait for the load
+_lock = RLock()
+
+
+def rules_loaded() -> bool:
+    """Whether load_rules() has completed."""
+    return _loaded
+
+
+def load_rules() -> None:
+    """Import the built-in rule modules and all entry-point rules, once.
+
+    Safe to call from several threads; later calls return immediately.
+
+    Raises:
+        ImportError: If a rule entry point cannot be loaded
+        RuntimeError: If called by a rule module while load_rules() imports it,
+            e.g. to price a quote at import time
+    """
+    global _loaded, _loading
+    if _loaded:
+        return
+    with _lock:
+        if _loaded:
+            return
+        if _loading:  # only the thread holding the lock gets here
+            raise RuntimeError(
+                "load_rules() was called while the rules are being loaded; "
+                "rule modules must not price quotes when they are imported"
+            )
+        _loading = True
+        try:
+            for module in BUILTIN_RULE_MODULES:
+                importlib.import_module(module)
+            _order_builtin_rules()
+            for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+                try:
+                    entry_point.load()
+                except Exception as error:
+                    raise ImportError(
+                        f"cannot load discount rule entry point {entry_point.name!r} "
+                        f"({entry_point.value})"
+                    ) from error
+            _loaded = True
+        finally:
+            _loading = False
+
+
+def _order_builtin_rules() -> None:
+    """Move the built-in rules first, in BUILTIN_RULE_MODULES order.
+
+    Rules register when their module is imported, and code may import a
+    rule module (directly, or through a module that uses it) before
+    discovery runs. Other rules keep their registration order.
+    """
+    from ride_discount.domain.rules.base import DiscountRule  # base imports this module
+
+    ranks = {module: rank for rank, module in enumerate(BUILTIN_RULE_MODULES)}
+    DiscountRule.registry.sort(key=lambda rule: ranks.get(rule.__module__, len(ranks)))
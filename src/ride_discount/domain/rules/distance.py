@@ -1,10 +1,28 @@
 """Distance-based discount rule."""
 
+from __future__ import annotations
+
 from decimal import Decimal
+from typing import TYPE_CHECKING, ClassVar
 
-from ride_discount.application.dtos import RideContext
+from ride_discount.application.dtos import FixedPointRide, RideContext
+from ride_discount.domain.fixed_point import METRES_PER_KM, percent_to_ppm
 from ride_discount.domain.rules.base import DiscountRule
-from ride_discount.domain.value_objects import DiscountResult
+from ride_discount.domain.rules.preconditions import Precondition
+from ride_discount.domain.value_objects import DiscountResult, LazyDiscountResult
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from ride_discount.application.vectorized import RideColumns
+
+_FREE_METRES = 5 * METRES_PER_KM
+_PPM_PER_METRE = percent_to_ppm(Decimal("0.5")) // METRES_PER_KM
+_MAX_PPM = percent_to_ppm(Decimal("20"))
+_FREE_KM = Decimal("5")
+_PERCENT_PER_KM = Decimal("0.5")
+_MAX_PERCENT = Decimal("20")
 
 
 class ProportionalDistanceDiscountRule(DiscountRule):
@@ -16,6 +34,12 @@ class ProportionalDistanceDiscountRule(DiscountRule):
     Formula: min((distance - 5) * 0.5, 20) for distance > 5km
     """
 
+    DEPENDS_ON: ClassVar[frozenset[str]] = frozenset({"distance_km"})
+    MAX_DISCOUNT: ClassVar[Decimal] = _MAX_PERCENT
+    PRECONDITIONS: ClassVar[tuple[Precondition, ...]] = (
+        Precondition("distance_km", ">", _FREE_KM),
+    )
+
     def calculate_discount(self, context: RideContext) -> DiscountResult | None:
         """Calculate distance-based discount.
 
@@ -27,12 +51,49 @@ class ProportionalDistanceDiscountRule(DiscountRule):
         """
         distance = context.distance_km
 
-        if distance > 5:
-            discount = min((distance - 5) * Decimal("0.5"), Decimal("20"))
+        if distance > _FREE_KM:
+            discount = min((distance - _FREE_KM) * _PERCENT_PER_KM, _MAX_PERCENT)
             if discount > 0:
-                return DiscountResult(
-                    discount_percentage=discount,
-                    reason=f"Distance discount ({distance}km)",
-                )
+                return LazyDiscountResult(discount, "Distance discount ({}km)", distance)
 
         return None
+
+    def cache_key(self, context: RideContext) -> str | None:
+        """Key on the exact distance text beyond 5km; shorter rides share one key.
+
+        The reason embeds the distance as written, so 12 and 12.0 differ.
+
+        Args:
+            context: The ride context containing distance information
+
+        Returns:
+            None for rides of 5km or less, the distance as written otherwise
+        """
+        distance = context.distance_km
+        return str(distance) if distance > _FREE_KM else None
+
+    def calculate_discount_vectorized(self, columns: RideColumns) -> npt.NDArray[np.float64]:
+        """Calculate distance-based discounts for a whole batch.
+
+        Args:
+            columns: The columnar ride batch
+
+        Returns:
+            Discount percentage per ride (0 for rides of 5km or less)
+        """
+        import numpy as np
+
+        return np.clip((columns.distance_km - 5) * 0.5, 0.0, 20.0)
+
+    def calculate_discount_ppm(self, ride: FixedPointRide) -> int:
+        """Calculate distance-based discount in parts per million.
+
+        Args:
+            ride: The integer ride containing distance in metres
+
+        Returns:
+            Discount in ppm (0 for rides of 5km or less)
+        """
+        if ride.distance_m <= _FREE_METRES:
+            return 0
+        return min((ride.distance_m - _FREE_METRES) * _PPM_PER_METRE, _MAX_PPM)
@@ -1,10 +1,50 @@
 """Ride frequency discount rule."""
 
+from __future__ import annotations
+
 from decimal import Decimal
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar
 
-from ride_discount.application.dtos import RideContext
+from ride_discount.application.dtos import FixedPointRide, RideContext
+from ride_discount.domain.fixed_point import PPM_PER_PERCENT
 from ride_discount.domain.rules.base import DiscountRule
-from ride_discount.domain.value_objects import DiscountResult
+from ride_discount.domain.rules.preconditions import Precondition
+from ride_discount.domain.value_objects import DiscountResult, LazyDiscountResult
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from ride_discount.application.vectorized import RideColumns
+
+_MAX_TIER = 15
+_TIER_PERCENTAGES = tuple(Decimal(tier) for tier in range(_MAX_TIER + 1))
+
+
+def frequency_tier(total_rides: int) -> int:
+    """Frequency tier of a ride count: the discount percentage it earns (0-15)."""
+    return min(total_rides // 10, _MAX_TIER)
+
+
+@lru_cache(maxsize=4096)
+def frequency_discount(total_rides: int) -> DiscountResult | None:
+    """Frequency discount of a ride count, without building a RideContext.
+
+    Results are interned: equal counts return the same instance.
+
+    Args:
+        total_rides: Total number of rides completed by the customer
+
+    Returns:
+        The discount RideFrequencyDiscountRule grants, or None below 10 rides
+    """
+    tier = frequency_tier(total_rides)
+    if tier == 0:
+        return None
+    return LazyDiscountResult(
+        _TIER_PERCENTAGES[tier], "Ride frequency discount ({} rides)", total_rides
+    )
 
 
 class RideFrequencyDiscountRule(DiscountRule):
@@ -14,8 +54,17 @@ class RideFrequencyDiscountRule(DiscountRule):
     up to a maximum of 15%.
 
     Formula: min(total_rides // 10, 15)
+
+    Results are interned per ride count: customers with the same count share
+    one DiscountResult, and its reason is formatted only when read.
     """
 
+    DEPENDS_ON: ClassVar[frozenset[str]] = frozenset({"customer.total_rides"})
+    MAX_DISCOUNT: ClassVar[Decimal] = _TIER_PERCENTAGES[_MAX_TIER]
+    PRECONDITIONS: ClassVar[tuple[Precondition, ...]] = (
+        Precondition("customer.total_rides", ">=", 10),
+    )
+
     def calculate_discount(self, context: RideContext) -> DiscountResult | None:
         """Calculate frequency-based discount.
 
@@ -25,17 +74,39 @@ class RideFrequencyDiscountRule(DiscountRule):
         Returns:
             DiscountResult if customer has completed rides, None otherwise
         """
-        total_rides = context.customer.total_rides
+        return frequency_discount(context.customer.total_rides)
+
+    def cache_key(self, context: RideContext) -> int:
+        """Key on the ride count, which the reason text embeds.
+
+        Args:
+            context: The ride context containing customer information
+
+        Returns:
+            The customer's total rides
+        """
+        return context.customer.total_rides
+
+    def calculate_discount_vectorized(self, columns: RideColumns) -> npt.NDArray[np.float64]:
+        """Calculate frequency-based discounts for a whole batch.
+
+        Args:
+            columns: The columnar ride batch
+
+        Returns:
+            Discount percentage per ride (0 for fewer than 10 rides)
+        """
+        import numpy as np
 
-        if total_rides == 0:
-            return None
+        return np.minimum(columns.total_rides // 10, _MAX_TIER).astype(np.float64)
 
-        discount = min(Decimal(total_rides // 10), Decimal("15"))
+    def calculate_discount_ppm(self, ride: FixedPointRide) -> int:
+        """Calculate frequency-based discount in parts per million.
 
-        if discount > 0:
-            return DiscountResult(
-                discount_percentage=discount,
-                reason=f"Ride frequency discount ({total_rides} rides)",
-            )
+        Args:
+            ride: The integer ride containing the customer's ride count
 
-        return None
+        Returns:
+            Discount in ppm (0 for fewer than 10 rides)
+        """
+        return min(ride.total_rides // 10, _MAX_TIER) * PPM_PER_PERCENT
@@ -1,11 +1,26 @@
 """Off-peak hours discount rule."""
 
+from __future__ import annotations
+
 from decimal import Decimal
+from typing import TYPE_CHECKING, ClassVar
 
-from ride_discount.application.dtos import RideContext
+from ride_discount.application.dtos import FixedPointRide, RideContext
 from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.schedule import (
+    HOURS_PER_DAY,
+    WEEKDAYS,
+    ScheduleWindow,
+    compile_schedule,
+)
 from ride_discount.domain.value_objects import DiscountResult
 
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from ride_discount.application.vectorized import RideColumns
+
 
 class OffPeakDiscountRule(DiscountRule):
     """Discount rule for off-peak riding hours.
@@ -13,8 +28,30 @@ class OffPeakDiscountRule(DiscountRule):
     Provides discounts for rides during less busy times:
     - Late night (0-6h): 20% discount
     - Mid-day weekdays (10-16h): 10% discount
+
+    The schedule is declared as ScheduleWindow entries and compiled into a
+    168-slot hour-of-week table of shared results, so evaluating the rule is
+    a single lookup. New windows (e.g. a weekend discount) are added to
+    SCHEDULE, not as new branches.
+
+    Class Attributes:
+        SCHEDULE: Discount windows in priority order (first match wins)
     """
 
+    DEPENDS_ON: ClassVar[frozenset[str]] = frozenset({"ride_datetime"})
+    SCHEDULE: ClassVar[tuple[ScheduleWindow, ...]] = (
+        ScheduleWindow(0, 6, Decimal("20"), "Late night off-peak discount"),
+        ScheduleWindow(10, 16, Decimal("10"), "Mid-day off-peak discount", days=WEEKDAYS),
+    )
+    MAX_DISCOUNT: ClassVar[Decimal] = max(window.discount_percentage for window in SCHEDULE)
+
+    def __init__(self) -> None:
+        """Resolve the compiled hour-of-week table of this rule's schedule."""
+        schedule = compile_schedule(self.SCHEDULE)
+        self._schedule = schedule
+        self._results = schedule.results
+        self._ppm = schedule.ppm
+
     def calculate_discount(self, context: RideContext) -> DiscountResult | None:
         """Calculate off-peak hours discount.
 
@@ -24,17 +61,43 @@ class OffPeakDiscountRule(DiscountRule):
         Returns:
             DiscountResult if ride occurs during off-peak hours, None otherwise
         """
-        current_hour = context.ride_datetime.hour
-
-        if 0 <= current_hour < 6:
-            return DiscountResult(
-                discount_percentage=Decimal("20"),
-                reason="Late night off-peak discount",
-            )
-        elif 10 <= current_hour < 16 and context.ride_datetime.weekday() < 5:
-            return DiscountResult(
-                discount_percentage=Decimal("10"),
-                reason="Mid-day off-peak discount",
-            )
-
-        return None
+        ride_datetime = context.ride_datetime
+        return self._results[ride_datetime.weekday() * HOURS_PER_DAY + ride_datetime.hour]
+
+    def cache_key(self, context: RideContext) -> int:
+        """Key on the hour-of-week slot of the ride.
+
+        Args:
+            context: The ride context containing datetime information
+
+        Returns:
+            The slot index (Monday 00h = 0 ... Sunday 23h = 167)
+        """
+        ride_datetime = context.ride_datetime
+        return ride_datetime.weekday() * HOURS_PER_DAY + ride_datetime.hour
+
+    def calculate_discount_vectorized(self, columns: RideColumns) -> npt.NDArray[np.float64]:
+        """Calculate off-peak discounts for a whole batch.
+
+        Args:
+            columns: The columnar ride batch
+
+        Returns:
+            Discount percentage per ride (0 outside off-peak hours)
+        """
+        import numpy as np
+
+        table = np.asarray(self._schedule.percentages, dtype=np.float64)
+        return table[columns.weekday * HOURS_PER_DAY + columns.hour]
+
+    def calculate_discount_ppm(self, ride: FixedPointRide) -> int:
+        """Calculate off-peak hours discount in parts per million.
+
+        Args:
+            ride: The integer ride containing datetime information
+
+        Returns:
+            Discount in ppm (0 outside off-peak hours)
+        """
+        ride_datetime = ride.ride_datetime
+        return self._ppm[ride_datetime.weekday() * HOURS_PER_DAY + ride_datetime.hour]
@@ -0,0 +1,62 @@
+"""Declarative rule dependencies and threshold pre-conditions."""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Literal
+
+# Dotted paths of the RideContext fields a rule may depend on
+CONTEXT_FIELDS = frozenset(
+    {"customer.id", "customer.total_rides", "distance_km", "base_price", "ride_datetime"}
+)
+
+Operator = Literal[">", ">=", "<", "<="]
+LOWER_BOUNDS: frozenset[str] = frozenset({">", ">="})
+UPPER_BOUNDS: frozenset[str] = frozenset({"<", "<="})
+
+
+@dataclass(frozen=True, slots=True)
+class Precondition:
+    """A cheap necessary condition for a rule to grant a discount.
+
+    A rule must return None for every ride where one of its pre-conditions
+    does not hold, so the evaluation planner can skip it without calling it.
+
+    Attributes:
+        field: Dotted path of the context field, e.g. "customer.total_rides"
+        operator: Comparison applied as ``field <operator> threshold``
+        threshold: Value the field is compared with
+    """
+
+    field: str
+    operator: Operator
+    threshold: Any
+
+    def __post_init__(self) -> None:
+        """Validate value object invariants."""
+        if self.field not in CONTEXT_FIELDS:
+            raise ValueError(f"unknown context field: {self.field!r}")
+        if self.operator not in LOWER_BOUNDS | UPPER_BOUNDS:
+            raise ValueError(f"unsupported operator: {self.operator!r}")
+
+    @property
+    def strict(self) -> bool:
+        """Whether the comparison excludes the threshold itself."""
+        return self.operator in (">", "<")
+
+    def holds(self, context: object) -> bool:
+        """Evaluate the condition against a ride context.
+
+        Args:
+            context: The ride context
+
+        Returns:
+            True if the rule may apply to this ride
+        """
+        value = attrgetter(self.field)(context)
+        if self.operator == ">":
+            return bool(value > self.threshold)
+        if self.operator == ">=":
+            return bool(value >= self.threshold)
+        if self.operator == "<":
+            return bool(value < self.threshold)
+        return bool(value <= self.threshold)
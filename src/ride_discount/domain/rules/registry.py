@@ -0,0 +1,109 @@
+"""Versioned, copy-on-write registry of discount rule classes."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ride_discount.domain.rules.base import DiscountRule
+
+# Shared by every registry, so a version number is never reused in the
+# process, even when a registry is replaced (e.g. by test isolation).
+_versions = count(1)
+
+
+@dataclass(frozen=True, slots=True)
+class RegistrySnapshot:
+    """An immutable view of the registered rules at one point in time.
+
+    Attributes:
+        version: Process-wide unique, increasing version of this snapshot
+        rules: Registered rule classes, in registration order
+    """
+
+    version: int
+    rules: tuple[type[DiscountRule], ...]
+
+
+class RuleRegistry:
+    """Publishes immutable snapshots of the registered rule classes.
+
+    Every change builds a new RegistrySnapshot with a higher version and
+    swaps it in with a single attribute assignment, under a lock that only
+    writers take. Readers use ``registry.snapshot`` without locking: they
+    always see a complete, consistent snapshot, and can key caches or
+    compiled pipelines on its version.
+
+    Attributes:
+        snapshot: The current snapshot (read-only; replaced on every change)
+    """
+
+    def __init__(self, rules: Iterable[type[DiscountRule]] = ()) -> None:
+        """Create a registry holding the given rules.
+
+        Args:
+            rules: Initial rule classes, in registration order
+        """
+        self._lock = Lock()
+        self.snapshot = RegistrySnapshot(next(_versions), tuple(rules))
+
+    @property
+    def version(self) -> int:
+        """Version of the current snapshot."""
+        return self.snapshot.version
+
+    @property
+    def rules(self) -> tuple[type[DiscountRule], ...]:
+        """Rule classes of the current snapshot."""
+        return self.snapshot.rules
+
+    def register(self, rule_class: type[DiscountRule]) -> RegistrySnapshot:
+        """Append a rule class and publish the new snapshot.
+
+        Args:
+            rule_class: The rule class to register
+
+        Returns:
+            The published snapshot
+        """
+        with self._lock:
+            snapshot = RegistrySnapshot(next(_versions), (*self.snapshot.rules, rule_class))
+            self.snapshot = snapshot
+        return snapshot
+
+    def replace(self, rules: Iterable[type[DiscountRule]]) -> RegistrySnapshot:
+        """Publish a snapshot holding exactly the given rule classes.
+
+        Args:
+            rules: Rule classes, in registration order
+
+        Returns:
+            The published snapshot
+        """
+        with self._lock:
+            snapshot = RegistrySnapshot(next(_versions), tuple(rules))
+            self.snapshot = snapshot
+        return snapshot
+
+    def sort(self, key: Callable[[type[DiscountRule]], Any]) -> RegistrySnapshot:
+        """Publish a snapshot with the rules stably sorted by key.
+
+        Unlike reading the rules and calling replace(), no rule registered
+        concurrently can be lost.
+
+        Args:
+            key: Sort key of a rule class
+
+        Returns:
+            The published snapshot, or the current one if the order is unchanged
+        """
+        with self._lock:
+            rules = self.snapshot.rules
+            ordered = tuple(sorted(rules, key=key))
+            if ordered != rules:
+                self.snapshot = RegistrySnapshot(next(_versions), ordered)
+            return self.snapshot
@@ -0,0 +1,105 @@
+"""Declarative weekly discount schedules compiled to hour-of-week tables."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+
+from ride_discount.domain.fixed_point import percent_to_ppm
+from ride_discount.domain.value_objects import DiscountResult
+
+HOURS_PER_DAY = 24
+HOURS_PER_WEEK = 7 * HOURS_PER_DAY
+ALL_DAYS = frozenset(range(7))
+WEEKDAYS = frozenset(range(5))
+WEEKEND = frozenset({5, 6})
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleWindow:
+    """A recurring weekly time window granting a discount.
+
+    Attributes:
+        start_hour: First hour of the window (0-23)
+        end_hour: Hour the window ends, exclusive (1-24)
+        discount_percentage: Discount granted inside the window
+        reason: Human-readable explanation of the discount
+        days: Days of the week the window applies to (Monday=0 ... Sunday=6)
+    """
+
+    start_hour: int
+    end_hour: int
+    discount_percentage: Decimal
+    reason: str
+    days: frozenset[int] = ALL_DAYS
+
+    def __post_init__(self) -> None:
+        """Validate value object invariants."""
+        if not 0 <= self.start_hour < self.end_hour <= HOURS_PER_DAY:
+            raise ValueError("window hours must satisfy 0 <= start_hour < end_hour <= 24")
+        if not self.days or not self.days <= ALL_DAYS:
+            raise ValueError("days must be a non-empty subset of 0-6")
+
+
+class HourOfWeekSchedule:
+    """A weekly schedule compiled into one slot per hour of the week.
+
+    Slot weekday * 24 + hour holds the pre-built DiscountResult of the first
+    window covering that hour, or None. Lookups are a single tuple index and
+    return shared instances, so they allocate nothing.
+
+    Attributes:
+        windows: The windows the table was compiled from, in priority order
+        results: 168 shared DiscountResult instances or None
+        ppm: 168 discounts in parts per million (0 where none applies)
+        percentages: 168 discounts as floats, for vectorized lookups
+    """
+
+    def __init__(self, windows: tuple[ScheduleWindow, ...]) -> None:
+        """Compile the windows; earlier windows win where they overlap.
+
+        Args:
+            windows: The schedule's windows, in priority order
+        """
+        self.windows = windows
+        shared = {
+            window: DiscountResult(
+                discount_percentage=window.discount_percentage, reason=window.reason
+            )
+            for window in windows
+        }
+        slots: list[DiscountResult | None] = [None] * HOURS_PER_WEEK
+        for day in range(7):
+            for hour in range(HOURS_PER_DAY):
+                slots[day * HOURS_PER_DAY + hour] = next(
+                    (
+                        shared[window]
+                        for window in windows
+                        if day in window.days and window.start_hour <= hour < window.end_hour
+                    ),
+                    None,
+                )
+        self.results: tuple[DiscountResult | None, ...] = tuple(slots)
+        self.ppm: tuple[int, ...] = tuple(
+            percent_to_ppm(result.discount_percentage) if result else 0 for result in slots
+        )
+        self.percentages: tuple[float, ...] = tuple(
+            float(result.discount_percentage) if result else 0.0 for result in slots
+        )
+
+    def lookup(self, ride_datetime: datetime) -> DiscountResult | None:
+        """Return the shared discount for a datetime, or None outside every window."""
+        return self.results[ride_datetime.weekday() * HOURS_PER_DAY + ride_datetime.hour]
+
+
+@lru_cache(maxsize=None)
+def compile_schedule(windows: tuple[ScheduleWindow, ...]) -> HourOfWeekSchedule:
+    """Compile a schedule once and share it between every user of the same windows.
+
+    Args:
+        windows: The schedule's windows, in priority order
+
+    Returns:
+        The compiled hour-of-week table
+    """
+    return HourOfWeekSchedule(windows)
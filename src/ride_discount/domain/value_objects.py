@@ -4,10 +4,13 @@ from dataclasses import dataclass
 from decimal import Decimal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class DiscountResult:
     """Immutable value object representing a discount calculation result.
 
+    Results compare equal by value, whatever their concrete class, so a
+    LazyDiscountResult equals the DiscountResult carrying the same text.
+
     Attributes:
         discount_percentage: The discount percentage (0-100)
         reason: Human-readable explanation of why this discount was applied
@@ -22,3 +25,78 @@ class DiscountResult:
             raise ValueError("discount_percentage must be non-negative")
         if self.discount_percentage > 100:
             raise ValueError("discount_percentage cannot exceed 100")
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by discount percentage and reason text."""
+        if not isinstance(other, DiscountResult):
+            return NotImplemented
+        return (
+            self.discount_percentage == other.discount_percentage
+            and self.reason == other.reason
+        )
+
+    def __hash__(self) -> int:
+        """Hash by discount percentage and reason text."""
+        return hash((self.discount_percentage, self.reason))
+
+
+class LazyDiscountResult(DiscountResult):
+    """A DiscountResult whose reason is formatted only when it is read.
+
+    Rules whose reason embeds a per-ride value (a ride count, a distance)
+    store the template and the value instead of building the string on
+    every hit. Pickling produces a plain DiscountResult. A reason given as
+    text replaces the template, so dataclasses.replace() works as on the
+    base class.
+
+    Attributes:
+        reason_template: str.format template with a single positional field
+        reason_value: Value substituted into the template
+    """
+
+    __slots__ = ("reason_template", "reason_value")
+
+    reason_template: str
+    reason_value: object
+
+    def __init__(
+        self,
+        discount_percentage: Decimal,
+        reason_template: str | None = None,
+        reason_value: object = None,
+        *,
+        reason: str | None = None,
+    ) -> None:
+        """Create the result without formatting its reason.
+
+        Args:
+            discount_percentage: The discount percentage (0-100)
+            reason_template: Template such as "Distance discount ({}km)"
+            reason_value: Value substituted into the template
+            reason: Formatted reason, used instead of the template
+
+        Raises:
+            TypeError: If neither reason_template nor reason is given
+            ValueError: If the discount percentage is out of range
+        """
+        if reason is not None:
+            reason_template, reason_value = "{}", reason
+        elif reason_template is None:
+            raise TypeError("LazyDiscountResult needs a reason_template or a reason")
+        object.__setattr__(self, "discount_percentage", discount_percentage)
+        object.__setattr__(self, "reason_template", reason_template)
+        object.__setattr__(self, "reason_value", reason_value)
+        self.__post_init__()
+
+    @property  # type: ignore[override]
+    def reason(self) -> str:
+        """Human-readable explanation, formatted on access."""
+        return self.reason_template.format(self.reason_value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Reject mutation, like the frozen base class."""
+        raise AttributeError(f"cannot assign to field {name!r}")
+
+    def __reduce__(self) -> tuple[type[DiscountResult], tuple[Decimal, str]]:
+        """Pickle as a plain DiscountResult with the formatted reason."""
+        return DiscountResult, (self.discount_percentage, self.reason)
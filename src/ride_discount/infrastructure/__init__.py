@@ -0,0 +1,52 @@
+"""Infrastructure layer for ride discount system.
+
+The public names are resolved on first access, so importing one adapter
+(for example ride_io from the CLI) does not load the others, nor the
+stdlib HTTP server behind QuoteServer.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ride_discount.infrastructure.http_server import QuoteServer
+    from ride_discount.infrastructure.ride_count_store import RideCountStore
+    from ride_discount.infrastructure.ride_io import RideResultWriter, read_rides
+    from ride_discount.infrastructure.ride_log import (
+        RideLog,
+        RideLogWriter,
+        RideRecord,
+        price_ride_log,
+    )
+
+_EXPORTS = {
+    "QuoteServer": "ride_discount.infrastructure.http_server",
+    "RideCountStore": "ride_discount.infrastructure.ride_count_store",
+    "RideLog": "ride_discount.infrastructure.ride_log",
+    "RideLogWriter": "ride_discount.infrastructure.ride_log",
+    "RideRecord": "ride_discount.infrastructure.ride_log",
+    "RideResultWriter": "ride_discount.infrastructure.ride_io",
+    "price_ride_log": "ride_discount.infrastructure.ride_log",
+    "read_rides": "ride_discount.infrastructure.ride_io",
+}
+
+__all__ = [
+    "QuoteServer",
+    "RideCountStore",
+    "RideLog",
+    "RideLogWriter",
+    "RideRecord",
+    "RideResultWriter",
+    "price_ride_log",
+    "read_rides",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the module defining an exported name on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
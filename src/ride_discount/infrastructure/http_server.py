@@ -0,0 +1,216 @@
+"""Stdlib HTTP server exposing ride quotes as JSON.
+
+Endpoints:
+    POST /quote   a ride object, answered with one priced ride object
+    POST /quotes  ``{"rides": [ride, ...]}``, answered with ``{"results": [...]}``
+    GET  /health  ``{"status": "ok"}``
+
+Rides use the fields of ride_io.RIDE_FIELDS and priced rides those of
+ride_io.RESULT_FIELDS, exactly as in the JSONL files of the CLI. Amounts
+are parsed as Decimal and returned as strings, so quotes stay exact.
+"""
+
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.infrastructure.ride_io import ride_from_record, result_record
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+DEFAULT_MAX_BODY_BYTES = 1 << 20
+
+_decode_json = json.JSONDecoder(parse_float=Decimal).decode
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+_WARM_UP_RIDE = RideContext(
+    customer=Customer(id="WARM-UP", total_rides=0),
+    distance_km=Decimal("1"),
+    base_price=Decimal("1"),
+    ride_datetime=datetime(2024, 1, 1),
+)
+
+
+class QuoteServer(ThreadingHTTPServer):
+    """HTTP server pricing rides with one shared CalculateRideDiscountUseCase.
+
+    Each connection is served by its own thread and kept alive between
+    requests (HTTP/1.1). All threads share the use case, whose pipeline is
+    compiled before the server accepts its first connection.
+
+    Attributes:
+        use_case: Use case pricing every request
+        max_body_bytes: Largest request body accepted, in bytes
+        access_log: Whether requests are logged to stderr
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        use_case: CalculateRideDiscountUseCase | None = None,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        access_log: bool = False,
+    ) -> None:
+        """Bind the server; call serve_forever() to start answering requests.
+
+        Args:
+            address: (host, port) to listen on; port 0 picks a free port
+            use_case: Use case pricing the requests (default: a new instance)
+            max_body_bytes: Largest request body accepted, in bytes
+            access_log: Log every request to stderr
+
+        Raises:
+            ValueError: If max_body_bytes is not positive
+            OSError: If the address cannot be bound
+        """
+        if max_body_bytes < 1:
+            raise ValueError("max_body_bytes must be positive")
+        self.use_case = use_case or CalculateRideDiscountUseCase()
+        self.max_body_bytes = max_body_bytes
+        self.access_log = access_log
+        self.use_case.execute(_WARM_UP_RIDE)  # discover the rules and compile the pipeline
+        super().__init__(address, QuoteRequestHandler)
+
+
+class QuoteRequestHandler(BaseHTTPRequestHandler):
+    """Answers the quote endpoints of a QuoteServer.
+
+    Responses are buffered and sent with a single write, with Nagle's
+    algorithm disabled, so keep-alive clients are not delayed waiting for
+    TCP acknowledgements.
+    """
+
+    server: QuoteServer
+
+    protocol_version = "HTTP/1.1"
+    server_version = "ride-discount"
+    disable_nagle_algorithm = True
+    wbufsize = io.DEFAULT_BUFFER_SIZE
+
+    def do_GET(self) -> None:
+        """Answer GET /health."""
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"no such endpoint: {self.path}")
+
+    def do_POST(self) -> None:
+        """Answer POST /quote and POST /quotes."""
+        if self.path == "/quote":
+            price = self._quote
+        elif self.path == "/quotes":
+            price = self._quotes
+        else:
+            self.close_connection = True  # the body is left unread
+            self._send_error(HTTPStatus.NOT_FOUND, f"no such endpoint: {self.path}")
+            return
+
+        body = self._read_body()
+        if body is None:
+            return
+        try:
+            response = price(_decode_json(body.decode("utf-8")))
+        except ValueError as error:  # includes JSON and UTF-8 decoding errors
+            self._send_error(HTTPStatus.BAD_REQUEST, str(error))
+            return
+        except ArithmeticError as error:  # amounts overflowing the decimal context
+            self._send_error(HTTPStatus.BAD_REQUEST, f"cannot price amount: {type(error).__name__}")
+            return
+        except RecursionError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "JSON nests too deeply")
+            return
+        self._send_json(HTTPStatus.OK, response)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Log to stderr only when the server's access log is enabled."""
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+    def _quote(self, payload: Any) -> dict[str, Any]:
+        """Price the ride object of a /quote request."""
+        context = _ride(payload)
+        return result_record(context, self.server.use_case.execute(context))
+
+    def _quotes(self, payload: Any) -> dict[str, Any]:
+        """Price the rides of a /quotes request, in order."""
+        if not isinstance(payload, dict) or not isinstance(payload.get("rides"), list):
+            raise ValueError('expected an object with a "rides" array')
+        contexts = []
+        for index, record in enumerate(payload["rides"]):
+            try:
+                contexts.append(_ride(record))
+            except ValueError as error:
+                raise ValueError(f"rides[{index}]: {error}") from None
+        results = self.server.use_case.execute_many(contexts)
+        return {
+            "results": [
+                result_record(context, result)
+                for context, result in zip(contexts, results, strict=True)
+            ]
+        }
+
+    def _read_body(self) -> bytes | None:
+        """Read the request body, or answer with an error and return None."""
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            self.close_connection = True
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "chunked bodies are not supported")
+            return None
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required")
+            return None
+        try:
+            size = int(length)
+        except ValueError:
+            size = -1
+        if size < 0:
+            self.close_connection = True
+            self._send_error(HTTPStatus.BAD_REQUEST, f"invalid Content-Length: {length!r}")
+            return None
+        if size > self.server.max_body_bytes:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self._send_error(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"body exceeds {self.server.max_body_bytes} bytes",
+            )
+            return None
+        return self.rfile.read(size)
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        """Send a JSON error response."""
+        self._send_json(status, {"error": message})
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, Any]) -> None:
+        """Send a JSON response; it is flushed once the request is handled."""
+        body = _encode_json(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _ride(record: Any) -> RideContext:
+    """Build a ride from a decoded JSON value.
+
+    Raises:
+        ValueError: If the value is not a valid ride object
+    """
+    if not isinstance(record, dict):
+        raise ValueError("expected a ride object")
+    if "customer_id" in record and not isinstance(record["customer_id"], str):
+        raise ValueError("customer_id must be a string")
+    return ride_from_record(record)
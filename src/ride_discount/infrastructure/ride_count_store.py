@@ -0,0 +1,199 @@
+"""Lock-striped, in-memory store of customer ride counts."""
+
+import csv
+import os
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from threading import Lock
+
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.frequency import frequency_discount, frequency_tier
+from ride_discount.domain.value_objects import DiscountResult
+
+SNAPSHOT_FIELDS = ("customer_id", "total_rides")
+
+
+class RideCountStore:
+    """Thread-safe ride counts per customer id, kept as ready-made Customers.
+
+    Customers are spread over a fixed number of stripes, each a dictionary
+    guarded by its own lock, so concurrent updates of different customers
+    rarely contend. Each stripe maps a customer id to a frozen Customer:
+    lookups return that instance without building anything, and a completed
+    ride replaces it under the stripe's lock. Reads take no lock; a single
+    dictionary lookup always sees either the old or the new Customer.
+
+    Unknown customers have zero rides.
+
+    Attributes:
+        stripes: Number of independently locked stripes
+    """
+
+    def __init__(self, counts: Mapping[str, int] | None = None, stripes: int = 64) -> None:
+        """Create a store.
+
+        Args:
+            counts: Initial ride count per customer id
+            stripes: Number of independently locked stripes
+
+        Raises:
+            ValueError: If stripes is not positive or a count is negative
+        """
+        if stripes < 1:
+            raise ValueError("stripes must be positive")
+        self.stripes = stripes
+        self._customers: tuple[dict[str, Customer], ...] = tuple({} for _ in range(stripes))
+        self._locks = tuple(Lock() for _ in range(stripes))
+        if counts is not None:
+            self.bulk_load(counts.items())
+
+    def __len__(self) -> int:
+        """Number of customers with a stored ride count."""
+        return sum(len(customers) for customers in self._customers)
+
+    def __contains__(self, customer_id: object) -> bool:
+        """Whether a ride count is stored for the customer id."""
+        if not isinstance(customer_id, str):
+            return False
+        return customer_id in self._customers[hash(customer_id) % self.stripes]
+
+    def customer(self, customer_id: str) -> Customer:
+        """The customer with their current ride count.
+
+        Args:
+            customer_id: The customer's id
+
+        Returns:
+            The stored Customer, or a new one with zero rides if unknown
+        """
+        customer = self._customers[hash(customer_id) % self.stripes].get(customer_id)
+        return customer if customer is not None else Customer(id=customer_id, total_rides=0)
+
+    def total_rides(self, customer_id: str) -> int:
+        """Current ride count of a customer (0 if unknown)."""
+        customer = self._customers[hash(customer_id) % self.stripes].get(customer_id)
+        return customer.total_rides if customer is not None else 0
+
+    def frequency_tier(self, customer_id: str) -> int:
+        """Frequency tier of a customer: the discount percentage it earns (0-15)."""
+        return frequency_tier(self.total_rides(customer_id))
+
+    def frequency_discount(self, customer_id: str) -> DiscountResult | None:
+        """The frequency discount a customer currently earns, or None."""
+        return frequency_discount(self.total_rides(customer_id))
+
+    def increment(self, customer_id: str, rides: int = 1) -> Customer:
+        """Atomically record completed rides.
+
+        Args:
+            customer_id: The customer's id
+            rides: Number of rides completed
+
+        Returns:
+            The customer with the updated ride count
+
+        Raises:
+            ValueError: If rides is not positive
+        """
+        if rides < 1:
+            raise ValueError("rides must be positive")
+        index = hash(customer_id) % self.stripes
+        customers = self._customers[index]
+        with self._locks[index]:
+            current = customers.get(customer_id)
+            total_rides = rides if current is None else current.total_rides + rides
+            customer = Customer(id=customer_id, total_rides=total_rides)
+            customers[customer_id] = customer
+        return customer
+
+    def bulk_load(self, counts: Iterable[tuple[str, int]]) -> int:
+        """Set the ride counts of many customers, replacing stored counts.
+
+        Counts are grouped by stripe first, so each stripe's lock is taken
+        once for the whole batch.
+
+        Args:
+            counts: (customer_id, total_rides) pairs
+
+        Returns:
+            The number of counts loaded
+
+        Raises:
+            ValueError: If a count is negative; nothing is loaded in that case
+        """
+        batches: list[list[Customer]] = [[] for _ in range(self.stripes)]
+        loaded = 0
+        for customer_id, total_rides in counts:
+            customer = Customer(id=customer_id, total_rides=total_rides)
+            batches[hash(customer_id) % self.stripes].append(customer)
+            loaded += 1
+        for customers, lock, batch in zip(self._customers, self._locks, batches, strict=True):
+            if batch:
+                with lock:
+                    customers.update((customer.id, customer) for customer in batch)
+        return loaded
+
+    def snapshot(self) -> dict[str, int]:
+        """A consistent copy of every ride count.
+
+        All stripe locks are held while copying, so no increment is half
+        visible; reads are not blocked.
+        """
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            return {
+                customer_id: customer.total_rides
+                for customers in self._customers
+                for customer_id, customer in customers.items()
+            }
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def save(self, path: str | os.PathLike[str]) -> int:
+        """Write a snapshot of the ride counts to a CSV file.
+
+        The file is written next to its destination and renamed into place,
+        so readers never see a partial snapshot.
+
+        Args:
+            path: Destination file
+
+        Returns:
+            The number of customers written
+        """
+        counts = self.snapshot()
+        path = Path(path)
+        temporary = path.with_name(f".{path.name}.tmp")
+        with temporary.open("w", encoding="utf-8", newline="") as stream:
+            writer = csv.writer(stream, lineterminator="\n")
+            writer.writerow(SNAPSHOT_FIELDS)
+            writer.writerows(counts.items())
+        os.replace(temporary, path)
+        return len(counts)
+
+    def load(self, path: str | os.PathLike[str]) -> int:
+        """Bulk load ride counts from a CSV snapshot written by save().
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            The number of counts loaded
+
+        Raises:
+            ValueError: If a row is malformed; the message includes its line number
+        """
+        with open(path, encoding="utf-8", newline="") as stream:
+            reader = csv.DictReader(stream)
+            counts = []
+            for row in reader:
+                line = reader.line_num
+                try:
+                    counts.append((row["customer_id"], int(row["total_rides"])))
+                except KeyError as error:
+                    raise ValueError(f"line {line}: missing field {error.args[0]!r}") from None
+                except (TypeError, ValueError):
+                    raise ValueError(f"line {line}: invalid ride count") from None
+        return self.bulk_load(counts)
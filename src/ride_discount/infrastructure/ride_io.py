@@ -0,0 +1,174 @@
+"""Streaming CSV and JSONL readers and writers for rides and priced results."""
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Literal, TextIO
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.value_objects import DiscountResult
+
+RideFormat = Literal["csv", "jsonl"]
+
+RIDE_FIELDS = ("customer_id", "total_rides", "distance_km", "base_price", "ride_datetime")
+RESULT_FIELDS = ("customer_id", "ride_datetime", "base_price", "final_price", "discounts")
+
+
+def ride_from_record(record: Mapping[str, Any]) -> RideContext:
+    """Build a RideContext from a parsed CSV row or JSON object.
+
+    Args:
+        record: Mapping with the RIDE_FIELDS keys; numbers may be strings
+
+    Returns:
+        The ride context described by the record
+
+    Raises:
+        ValueError: If the record is not a mapping, or a field is missing or
+            invalid (amounts must be finite)
+    """
+    if not isinstance(record, Mapping):
+        raise ValueError(f"expected a ride object, got {type(record).__name__}")
+    try:
+        distance_km = Decimal(str(record["distance_km"]))
+        base_price = Decimal(str(record["base_price"]))
+        if not (distance_km.is_finite() and base_price.is_finite()):
+            raise ValueError("distance_km and base_price must be finite")
+        return RideContext(
+            customer=Customer(
+                id=str(record["customer_id"]),
+                total_rides=int(record["total_rides"]),
+            ),
+            distance_km=distance_km,
+            base_price=base_price,
+            ride_datetime=datetime.fromisoformat(str(record["ride_datetime"])),
+        )
+    except KeyError as error:
+        raise ValueError(f"missing field {error.args[0]!r}") from None
+    except ArithmeticError as error:
+        raise ValueError(f"invalid number: {error}") from None
+    except TypeError as error:  # e.g. null or a list where a number is expected
+        raise ValueError(f"invalid field: {error}") from None
+
+
+def result_record(
+    context: RideContext, result: tuple[Decimal, list[DiscountResult]]
+) -> dict[str, Any]:
+    """Build the JSON object of a priced ride; amounts are strings, to stay exact.
+
+    Args:
+        context: The priced ride context
+        result: Its (final_price, applied_discounts) tuple
+
+    Returns:
+        A mapping with the RESULT_FIELDS keys, ready for json.dumps()
+    """
+    final_price, discounts = result
+    return {
+        "customer_id": context.customer.id,
+        "ride_datetime": context.ride_datetime.isoformat(),
+        "base_price": str(context.base_price),
+        "final_price": str(final_price),
+        "discounts": [
+            {"reason": d.reason, "discount_percentage": str(d.discount_percentage)}
+            for d in discounts
+        ],
+    }
+
+
+def read_rides(stream: TextIO, ride_format: RideFormat) -> Iterator[RideContext]:
+    """Lazily parse rides from a CSV (with header) or JSONL text stream.
+
+    Only the current line is held in memory, so arbitrarily large inputs can
+    be streamed. Blank JSONL lines are skipped.
+
+    Args:
+        stream: Text stream to read from
+        ride_format: Either "csv" or "jsonl"
+
+    Yields:
+        One RideContext per input record
+
+    Raises:
+        ValueError: If a record is malformed; the message includes its line number
+    """
+    if ride_format == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            try:
+                yield ride_from_record(row)
+            except ValueError as error:
+                raise ValueError(f"line {reader.line_num}: {error}") from None
+    else:
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield ride_from_record(json.loads(line, parse_float=Decimal))
+            except ValueError as error:
+                raise ValueError(f"line {line_number}: {error}") from None
+
+
+class RideResultWriter:
+    """Buffered writer for priced rides in CSV or JSONL format.
+
+    Each call to write_batch serializes a whole batch into a single string
+    before touching the underlying stream, so output costs one write per batch
+    instead of one per ride.
+    """
+
+    def __init__(self, stream: TextIO, ride_format: RideFormat) -> None:
+        """Create a writer; the CSV header is written immediately.
+
+        Args:
+            stream: Text stream to write to
+            ride_format: Either "csv" or "jsonl"
+        """
+        self._stream = stream
+        self._format = ride_format
+        if ride_format == "csv":
+            self._buffer = io.StringIO()
+            self._csv = csv.writer(self._buffer, lineterminator="\n")
+            self._csv.writerow(RESULT_FIELDS)
+            self._flush_buffer()
+
+    def write_batch(
+        self,
+        contexts: Iterable[RideContext],
+        results: Iterable[tuple[Decimal, list[DiscountResult]]],
+    ) -> None:
+        """Serialize and write one batch of priced rides.
+
+        Args:
+            contexts: The priced ride contexts
+            results: The (final_price, applied_discounts) tuple of each context
+        """
+        if self._format == "csv":
+            self._csv.writerows(
+                (
+                    context.customer.id,
+                    context.ride_datetime.isoformat(),
+                    context.base_price,
+                    final_price,
+                    ";".join(f"{d.reason}:{d.discount_percentage}" for d in discounts),
+                )
+                for context, (final_price, discounts) in zip(contexts, results, strict=True)
+            )
+            self._flush_buffer()
+        else:
+            self._stream.write(
+                "".join(
+                    json.dumps(result_record(context, result)) + "\n"
+                    for context, result in zip(contexts, results, strict=True)
+                )
+            )
+
+    def _flush_buffer(self) -> None:
+        """Move the serialized CSV rows to the stream in a single write."""
+        self._stream.write(self._buffer.getvalue())
+        self._buffer.seek(0)
+        self._buffer.truncate()
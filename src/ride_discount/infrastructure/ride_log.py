@@ -0,0 +1,470 @@
+"""Fixed-width binary ride log, read through mmap without parsing.
+
+A ride log is a small header followed by RECORD_SIZE-byte little-endian
+records. Every value is an exact integer in the units of the fixed-point
+pricing path, so records are priced without any text or Decimal parsing:
+
+    ======  ==================  ==================================================
+    offset  field               encoding
+    ======  ==================  ==================================================
+    0       timestamp           int64, naive wall-clock seconds since 1970-01-01
+    8       total_rides         int64
+    16      distance_m          int64, whole metres
+    24      price_minor         int64, base price in minor units (e.g. cents), at
+                                most MAX_PRICE_MINOR so the final price fits too
+    32      final_price_scaled  int64, millionths of a minor unit (-1: unpriced)
+    40      rule_mask           uint64, bit i set if rule i discounted the ride
+    48      customer_id         16 bytes, UTF-8, NUL-padded
+    ======  ==================  ==================================================
+
+The header holds the magic bytes, the format version, the record size, the
+currency's minor digits and the names of the rules the mask bits refer to.
+Records start at the first multiple of RECORD_SIZE after the header, so
+they are aligned for NumPy and struct access alike.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from os import PathLike
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from ride_discount.application.dtos import FixedPointRide, RideContext
+from ride_discount.application.fixed_point import FixedPointPricingEngine
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.fixed_point import PPM, PPM_PER_PERCENT
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from ride_discount.application.vectorized import RideColumns
+
+MAGIC = b"RIDELOG\x00"
+FORMAT_VERSION = 1
+UNPRICED = -1
+
+RECORD = struct.Struct("<qqqqqQ16s")
+RECORD_SIZE = RECORD.size
+CUSTOMER_ID_SIZE = 16
+# Largest base price whose final_price_scaled (price_minor * 10**6) fits in int64
+MAX_PRICE_MINOR = (2**63 - 1) // PPM
+MAX_RULES = 64
+DEFAULT_BATCH_SIZE = 4096
+
+# magic, format version, record size, minor digits, length of the rule names
+_HEADER = struct.Struct("<8sHHHH")
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def _data_offset(names_length: int) -> int:
+    """Offset of the first record: the header rounded up to a whole record."""
+    return -(-(_HEADER.size + names_length) // RECORD_SIZE) * RECORD_SIZE
+
+
+@dataclass(frozen=True, slots=True)
+class RideRecord:
+    """One decoded ride log record.
+
+    Attributes:
+        customer_id: Customer identifier (at most 16 bytes of UTF-8)
+        total_rides: Total number of rides completed by the customer
+        distance_m: Distance of the ride in whole metres
+        price_minor: Base price in minor currency units (0 to MAX_PRICE_MINOR)
+        timestamp: Naive wall-clock seconds since 1970-01-01
+        final_price_scaled: Final price in millionths of a minor unit, or
+            None if the ride has not been priced
+        rule_mask: Bit i set if rule i of the log's rule names discounted the ride
+    """
+
+    customer_id: str
+    total_rides: int
+    distance_m: int
+    price_minor: int
+    timestamp: int
+    final_price_scaled: int | None = None
+    rule_mask: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate that the record fits the fixed-width format.
+
+        Raises:
+            ValueError: If the customer id is longer than 16 bytes of UTF-8,
+                or price_minor is negative or above MAX_PRICE_MINOR
+        """
+        if len(self.customer_id.encode()) > CUSTOMER_ID_SIZE:
+            raise ValueError(f"customer id longer than {CUSTOMER_ID_SIZE} bytes")
+        if not 0 <= self.price_minor <= MAX_PRICE_MINOR:
+            raise ValueError(f"price_minor must be between 0 and {MAX_PRICE_MINOR}")
+
+    @classmethod
+    def from_context(cls, context: RideContext, minor_digits: int = 2) -> RideRecord:
+        """Encode a ride context.
+
+        Args:
+            context: The ride context to encode
+            minor_digits: Decimal digits of the currency's minor unit
+
+        Returns:
+            The unpriced record
+
+        Raises:
+            ValueError: If the ride cannot be stored exactly: fractional
+                metres or minor units, sub-second or timezone-aware times,
+                a customer id longer than 16 bytes or a price above
+                MAX_PRICE_MINOR
+        """
+        ride = FixedPointRide.from_context(context, minor_digits)
+        if ride is None:
+            raise ValueError("distance and price must be whole metres and minor units")
+        ride_datetime = context.ride_datetime
+        if ride_datetime.tzinfo is not None or ride_datetime.microsecond:
+            raise ValueError("ride_datetime must be naive and in whole seconds")
+        return cls(
+            customer_id=context.customer.id,
+            total_rides=ride.total_rides,
+            distance_m=ride.distance_m,
+            price_minor=ride.price_minor,
+            timestamp=(ride_datetime - _EPOCH) // _SECOND,
+        )
+
+    @property
+    def ride_datetime(self) -> datetime:
+        """Date and time of the ride."""
+        return _EPOCH + timedelta(seconds=self.timestamp)
+
+    def to_fixed_point(self) -> FixedPointRide:
+        """The ride as input of the fixed-point pricing engine."""
+        return FixedPointRide(
+            total_rides=self.total_rides,
+            distance_m=self.distance_m,
+            price_minor=self.price_minor,
+            ride_datetime=self.ride_datetime,
+        )
+
+    def to_context(self, minor_digits: int = 2) -> RideContext:
+        """The ride as input of the Decimal use case.
+
+        Args:
+            minor_digits: Decimal digits of the currency's minor unit
+
+        Returns:
+            The equivalent ride context
+        """
+        return RideContext(
+            customer=Customer(id=self.customer_id, total_rides=self.total_rides),
+            distance_km=Decimal(self.distance_m).scaleb(-3),
+            base_price=Decimal(self.price_minor).scaleb(-minor_digits),
+            ride_datetime=self.ride_datetime,
+        )
+
+    def final_price(self, minor_digits: int = 2) -> Decimal | None:
+        """Final price in major units, or None if the ride has not been priced."""
+        if self.final_price_scaled is None:
+            return None
+        return Decimal(self.final_price_scaled).scaleb(-(minor_digits + 6))
+
+    def _values(self) -> tuple[Any, ...]:
+        """Field values in RECORD order."""
+        return (
+            self.timestamp,
+            self.total_rides,
+            self.distance_m,
+            self.price_minor,
+            UNPRICED if self.final_price_scaled is None else self.final_price_scaled,
+            self.rule_mask,
+            self.customer_id.encode(),
+        )
+
+    @classmethod
+    def _from_values(cls, values: tuple[Any, ...]) -> RideRecord:
+        """Decode the values unpacked from one record."""
+        timestamp, total_rides, distance_m, price_minor, final_price, rule_mask, customer = values
+        return cls(
+            customer_id=customer.rstrip(b"\x00").decode(),
+            total_rides=total_rides,
+            distance_m=distance_m,
+            price_minor=price_minor,
+            timestamp=timestamp,
+            final_price_scaled=None if final_price == UNPRICED else final_price,
+            rule_mask=rule_mask,
+        )
+
+
+class RideLogWriter:
+    """Appends records to a binary ride log stream.
+
+    The header is written immediately. Each call to write_batch packs the
+    whole batch into one buffer and writes it at once.
+    """
+
+    def __init__(
+        self, stream: BinaryIO, minor_digits: int = 2, rule_names: Sequence[str] = ()
+    ) -> None:
+        """Create a writer and write the log header.
+
+        Args:
+            stream: Binary stream positioned where the log starts
+            minor_digits: Decimal digits of the currency's minor unit
+            rule_names: Names of the rules the mask bits refer to, in bit order
+
+        Raises:
+            ValueError: If there are more than 64 rule names, or a name
+                contains a newline
+        """
+        if len(rule_names) > MAX_RULES:
+            raise ValueError(f"at most {MAX_RULES} rules fit in the rule mask")
+        if any("\n" in name for name in rule_names):
+            raise ValueError("rule names must not contain newlines")
+        names = "\n".join(rule_names).encode()
+        header = bytearray(_data_offset(len(names)))
+        _HEADER.pack_into(header, 0, MAGIC, FORMAT_VERSION, RECORD_SIZE, minor_digits, len(names))
+        header[_HEADER.size : _HEADER.size + len(names)] = names
+        stream.write(header)
+        self._stream = stream
+        self.minor_digits = minor_digits
+
+    def write_batch(self, records: Iterable[RideRecord]) -> int:
+        """Write a batch of records.
+
+        Args:
+            records: The records to append
+
+        Returns:
+            The number of records written
+        """
+        return self._write_values([record._values() for record in records])
+
+    def write_rides(self, contexts: Iterable[RideContext]) -> int:
+        """Encode and write a batch of unpriced rides.
+
+        Args:
+            contexts: The ride contexts to append
+
+        Returns:
+            The number of records written
+
+        Raises:
+            ValueError: If a ride cannot be stored exactly (see RideRecord.from_context)
+        """
+        minor_digits = self.minor_digits
+        return self.write_batch(RideRecord.from_context(c, minor_digits) for c in contexts)
+
+    def _write_values(self, rows: Sequence[tuple[Any, ...]]) -> int:
+        """Pack rows of RECORD values into one buffer and write it."""
+        buffer = bytearray(len(rows) * RECORD_SIZE)
+        pack_into = RECORD.pack_into
+        for index, values in enumerate(rows):
+            pack_into(buffer, index * RECORD_SIZE, *values)
+        self._stream.write(buffer)
+        return len(rows)
+
+
+class RideLog:
+    """Read-only, memory-mapped ride log.
+
+    Records are decoded straight from the mapped pages, on access; nothing
+    is read or parsed up front, so opening a log of any size is instant.
+    Arrays and views returned by the log share its memory and must be
+    released before the log is closed.
+
+    Attributes:
+        minor_digits: Decimal digits of the currency's minor unit
+        rule_names: Names of the rules the mask bits refer to, in bit order
+    """
+
+    def __init__(self, path: str | PathLike[str]) -> None:
+        """Map a ride log file.
+
+        Args:
+            path: Path of the log
+
+        Raises:
+            ValueError: If the file is not a ride log of this format version,
+                or ends with a partial record
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mmap) < _HEADER.size:
+                raise ValueError("not a ride log: file too short")
+            magic, version, record_size, minor_digits, names_length = _HEADER.unpack_from(
+                self._mmap
+            )
+            if magic != MAGIC:
+                raise ValueError("not a ride log: bad magic bytes")
+            if version != FORMAT_VERSION or record_size != RECORD_SIZE:
+                raise ValueError(f"unsupported ride log version {version}")
+            names = bytes(self._mmap[_HEADER.size : _HEADER.size + names_length]).decode()
+            self._offset = _data_offset(names_length)
+            size, partial = divmod(len(self._mmap) - self._offset, RECORD_SIZE)
+            if size < 0 or partial:
+                raise ValueError("ride log ends with a partial record")
+        except BaseException:
+            self._mmap.close()
+            raise
+        self.minor_digits: int = minor_digits
+        self.rule_names: tuple[str, ...] = tuple(names.split("\n")) if names else ()
+        self._size = size
+
+    def __len__(self) -> int:
+        """Number of records in the log."""
+        return self._size
+
+    def __getitem__(self, index: int) -> RideRecord:
+        """Decode one record.
+
+        Args:
+            index: Record position; negative values count from the end
+
+        Returns:
+            The decoded record
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ride log index out of range")
+        values = RECORD.unpack_from(self._mmap, self._offset + index * RECORD_SIZE)
+        return RideRecord._from_values(values)
+
+    def __iter__(self) -> Iterator[RideRecord]:
+        """Decode every record, in order."""
+        from_values = RideRecord._from_values
+        for values in RECORD.iter_unpack(self.records()):
+            yield from_values(values)
+
+    def __enter__(self) -> RideLog:
+        """Use the log as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the log."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file.
+
+        Raises:
+            BufferError: If a view or array of the log is still alive
+        """
+        self._mmap.close()
+
+    def records(self) -> memoryview:
+        """Zero-copy view of the raw record bytes."""
+        return memoryview(self._mmap)[self._offset :]
+
+    def fixed_point_rides(self) -> Iterator[FixedPointRide]:
+        """Decode every record directly as fixed-point pricing input, in order."""
+        epoch = _EPOCH
+        for timestamp, total_rides, distance_m, price_minor, *_ in RECORD.iter_unpack(
+            self.records()
+        ):
+            yield FixedPointRide(
+                total_rides=total_rides,
+                distance_m=distance_m,
+                price_minor=price_minor,
+                ride_datetime=epoch + timedelta(seconds=timestamp),
+            )
+
+    def to_array(self) -> npt.NDArray[np.void]:
+        """Zero-copy NumPy structured array over the records (requires NumPy)."""
+        import numpy as np
+
+        dtype = np.dtype(
+            [
+                ("timestamp", "<i8"),
+                ("total_rides", "<i8"),
+                ("distance_m", "<i8"),
+                ("price_minor", "<i8"),
+                ("final_price_scaled", "<i8"),
+                ("rule_mask", "<u8"),
+                ("customer_id", "S16"),
+            ]
+        )
+        return np.frombuffer(self._mmap, dtype=dtype, count=self._size, offset=self._offset)
+
+    def to_columns(self) -> RideColumns:
+        """Columnar batch for the vectorized pricing engine (requires NumPy).
+
+        Ride counts and timestamps are views of the mapped records; distances
+        and prices are converted to kilometres and major units.
+        """
+        from ride_discount.application.vectorized import RideColumns
+
+        array = self.to_array()
+        return RideColumns(
+            total_rides=array["total_rides"],
+            distance_km=array["distance_m"] / 1000.0,
+            base_price=array["price_minor"] / 10.0**self.minor_digits,
+            timestamps=array["timestamp"],
+        )
+
+
+def price_ride_log(
+    log: RideLog,
+    stream: BinaryIO,
+    engine: FixedPointPricingEngine | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Price every ride of a log and write the priced records to a new log.
+
+    Records are priced with exact integer arithmetic straight from the
+    mapped input. If a registered rule has no fixed-point implementation,
+    the ride is priced through each rule's Decimal calculate_discount
+    instead, and its final price is rounded to a millionth of a minor unit.
+
+    Args:
+        log: The input log
+        stream: Binary stream the priced log is written to
+        engine: Fixed-point engine (default: one for the log's minor digits)
+        batch_size: Records priced and written together
+
+    Returns:
+        The number of rides priced
+    """
+    engine = engine or FixedPointPricingEngine(log.minor_digits)
+    rules = engine.rules
+    writer = RideLogWriter(stream, log.minor_digits, [type(rule).__name__ for rule in rules])
+    price = engine.price_with_rule_mask
+    epoch = _EPOCH
+
+    batch: list[tuple[Any, ...]] = []
+    priced = 0
+    for values in RECORD.iter_unpack(log.records()):
+        timestamp, total_rides, distance_m, price_minor, _, _, customer = values
+        ride_datetime = epoch + timedelta(seconds=timestamp)
+        result = price(FixedPointRide(total_rides, distance_m, price_minor, ride_datetime))
+        if result is None:
+            result = _price_decimal(engine, RideRecord._from_values(values), log.minor_digits)
+        batch.append((timestamp, total_rides, distance_m, price_minor, *result, customer))
+        if len(batch) == batch_size:
+            priced += writer._write_values(batch)
+            batch.clear()
+    if batch:
+        priced += writer._write_values(batch)
+    return priced
+
+
+def _price_decimal(
+    engine: FixedPointPricingEngine, record: RideRecord, minor_digits: int
+) -> tuple[int, int]:
+    """Price a record through the rules' Decimal path, as (final_price_scaled, rule_mask)."""
+    context = record.to_context(minor_digits)
+    total = Decimal(0)
+    mask = 0
+    for bit, rule in enumerate(engine.rules):
+        result = rule.calculate_discount(context)
+        if result is not None and result.discount_percentage:
+            total += result.discount_percentage
+            mask |= 1 << bit
+    discount_ppm = int((total * PPM_PER_PERCENT).to_integral_value())
+    return record.price_minor * (PPM - min(discount_ppm, engine.max_total_discount_ppm)), mask
@@ -0,0 +1,110 @@
+"""Tests for the asyncio micro-batching pricer."""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.async_pricer import AsyncBatchPricer, _percentile
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+
+
+@pytest.fixture
+def contexts():
+    """Twenty rides with different prices."""
+    return [
+        RideContext(
+            customer=Customer(id=f"CUST-{i}", total_rides=i * 10),
+            distance_km=Decimal(i),
+            base_price=Decimal(10 + i),
+            ride_datetime=datetime(2024, 1, 10, i % 24, 0),
+        )
+        for i in range(20)
+    ]
+
+
+class TestAsyncBatchPricer:
+    """Tests for AsyncBatchPricer."""
+
+    def test_concurrent_quotes_share_a_batch(self, contexts):
+        """Test that concurrent quotes are priced together and resolved individually."""
+
+        async def run():
+            async with AsyncBatchPricer(max_delay=0.05, max_batch_size=100) as pricer:
+                results = await asyncio.gather(*(pricer.quote(c) for c in contexts))
+                return results, pricer.stats()
+
+        results, stats = asyncio.run(run())
+
+        use_case = CalculateRideDiscountUseCase()
+        assert results == [use_case.execute(c) for c in contexts]
+        assert stats.batches == 1
+        assert stats.quotes == 20
+        assert stats.mean_batch_size == 20
+
+    def test_batch_size_limit_flushes_early(self, contexts):
+        """Test that reaching max_batch_size prices without waiting for the window."""
+
+        async def run():
+            async with AsyncBatchPricer(max_delay=60, max_batch_size=5) as pricer:
+                await asyncio.wait_for(
+                    asyncio.gather(*(pricer.quote(c) for c in contexts)), timeout=5
+                )
+                return pricer.stats()
+
+        stats = asyncio.run(run())
+
+        assert stats.batches == 4
+        assert stats.p99_latency >= stats.p50_latency > 0
+
+    def test_single_quote_resolves_after_window(self, contexts):
+        """Test that a lone request is priced once the window elapses."""
+
+        async def run():
+            async with AsyncBatchPricer(max_delay=0.001) as pricer:
+                return await pricer.quote(contexts[3])
+
+        assert asyncio.run(run()) == CalculateRideDiscountUseCase().execute(contexts[3])
+
+    def test_errors_propagate_to_every_caller(self, contexts):
+        """Test that a failing batch rejects all of its futures."""
+
+        class FailingUseCase(CalculateRideDiscountUseCase):
+            def execute_many(self, contexts):
+                raise RuntimeError("pricing backend down")
+
+        async def run():
+            async with AsyncBatchPricer(FailingUseCase(), max_delay=0.001) as pricer:
+                return await asyncio.gather(
+                    *(pricer.quote(c) for c in contexts[:3]), return_exceptions=True
+                )
+
+        results = asyncio.run(run())
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    def test_stats_before_any_quote(self):
+        """Test that empty statistics are well defined."""
+        stats = AsyncBatchPricer().stats()
+
+        assert (stats.quotes, stats.batches, stats.p50_latency) == (0, 0, 0.0)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_delay": -1}, {"max_batch_size": 0}, {"latency_window": 0}]
+    )
+    def test_rejects_invalid_configuration(self, kwargs):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            AsyncBatchPricer(**kwargs)
+
+
+class TestPercentile:
+    """Tests for the nearest-rank percentile helper."""
+
+    @pytest.mark.parametrize("percent,expected", [(50, 5.0), (99, 10.0), (100, 10.0), (1, 1.0)])
+    def test_percentile_nearest_rank(self, percent, expected):
+        """Test nearest-rank percentiles of 1..10."""
+        assert _percentile([float(v) for v in range(1, 11)], percent) == expected
@@ -1,5 +1,6 @@
 """Tests for application DTOs."""
 
+import pickle
 from datetime import datetime
 from decimal import Decimal
 
@@ -37,6 +38,17 @@ class TestRideContext:
         with pytest.raises(AttributeError):
             context.distance_km = Decimal("20")  # type: ignore
 
+    def test_ride_context_is_slotted(self, customer_no_rides, base_price):
+        """Test that ride contexts carry no per-instance __dict__ and survive pickling."""
+        context = RideContext(
+            customer=customer_no_rides,
+            distance_km=Decimal("10"),
+            base_price=base_price,
+            ride_datetime=datetime(2024, 1, 10, 14, 30),
+        )
+        assert not hasattr(context, "__dict__")
+        assert pickle.loads(pickle.dumps(context)) == context
+
     def test_ride_context_with_negative_distance_raises_error(
         self, customer_no_rides, base_price
     ):
@@ -0,0 +1,230 @@
+"""Tests for the integer fixed-point pricing path."""
+
+from array import array
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import FixedPointRide, RideContext
+from ride_discount.application.fixed_point import FixedPointPricingEngine
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.fixed_point import percent_to_ppm, ppm_to_percent
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.distance import ProportionalDistanceDiscountRule
+from ride_discount.domain.rules.frequency import RideFrequencyDiscountRule
+from ride_discount.domain.rules.offpeak import OffPeakDiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+
+def make_context(total_rides, distance, price, ride_datetime):
+    """Build a ride context from plain values."""
+    return RideContext(
+        customer=Customer(id="CUST-001", total_rides=total_rides),
+        distance_km=Decimal(distance),
+        base_price=Decimal(price),
+        ride_datetime=ride_datetime,
+    )
+
+
+@pytest.fixture
+def contexts():
+    """Rides across every rule branch, odd prices and the cap."""
+    return [
+        make_context(total_rides, distance, price, datetime(2024, 1, day, hour, 15))
+        for total_rides in (0, 9, 10, 75, 149, 10_000)
+        for distance in ("0", "5", "5.001", "10.123", "25", "45", "100")
+        for price in ("0", "0.01", "45.00", "45.01", "1234.57")
+        for day, hour in ((10, 3), (10, 8), (10, 14), (13, 14))
+    ]
+
+
+class TestFixedPointUnits:
+    """Tests for ppm conversions."""
+
+    @pytest.mark.parametrize(
+        "percentage,ppm", [("1", 10_000), ("0.5", 5_000), ("0.0001", 1), ("50", 500_000)]
+    )
+    def test_percent_to_ppm(self, percentage, ppm):
+        """Test exact percentage to ppm conversion and back."""
+        assert percent_to_ppm(Decimal(percentage)) == ppm
+        assert ppm_to_percent(ppm) == Decimal(percentage)
+
+    def test_percent_to_ppm_rejects_inexact(self):
+        """Test that percentages finer than one ppm are rejected."""
+        with pytest.raises(ValueError):
+            percent_to_ppm(Decimal("0.00001"))
+
+
+class TestFixedPointRide:
+    """Tests for FixedPointRide conversion."""
+
+    def test_from_context(self):
+        """Test conversion to metres and minor units."""
+        ride = FixedPointRide.from_context(
+            make_context(75, "10.123", "45.01", datetime(2024, 1, 10, 14, 0))
+        )
+
+        assert ride == FixedPointRide(75, 10_123, 4_501, datetime(2024, 1, 10, 14, 0))
+
+    @pytest.mark.parametrize("distance,price", [("10.1234", "1.00"), ("10", "1.001")])
+    def test_unrepresentable_context(self, distance, price):
+        """Test that rides needing rounding are not converted."""
+        context = make_context(1, distance, price, datetime(2024, 1, 10, 14, 0))
+
+        assert FixedPointRide.from_context(context) is None
+
+
+class TestFixedPointRules:
+    """Tests for calculate_discount_ppm of the built-in rules."""
+
+    @pytest.mark.parametrize(
+        "rule_class",
+        [RideFrequencyDiscountRule, ProportionalDistanceDiscountRule, OffPeakDiscountRule],
+    )
+    def test_matches_decimal_rule(self, rule_class, contexts):
+        """Test that integer discounts equal the Decimal discounts exactly."""
+        rule = rule_class()
+        for context in contexts:
+            result = rule.calculate_discount(context)
+            expected = result.discount_percentage if result else Decimal("0")
+
+            ppm = rule.calculate_discount_ppm(FixedPointRide.from_context(context))
+
+            assert ppm_to_percent(ppm) == expected
+
+
+class TestFixedPointPricingEngine:
+    """Tests for FixedPointPricingEngine."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create an engine for a two-digit currency."""
+        return FixedPointPricingEngine()
+
+    def test_quotes_equal_decimal_path(self, engine, contexts):
+        """Test that final prices equal the Decimal use case, cap included."""
+        use_case = CalculateRideDiscountUseCase()
+
+        assert list(engine.quote_many(contexts)) == [use_case.execute(c)[0] for c in contexts]
+
+    def test_quotes_have_the_decimal_path_exponent(self, engine, contexts):
+        """Test that quotes print exactly like the Decimal use case's final prices."""
+        use_case = CalculateRideDiscountUseCase()
+        contexts += [make_context(75, "25", "45", datetime(2024, 1, 10, 14, 0))]
+        contexts += [make_context(75, "25", "45.000", datetime(2024, 1, 10, 14, 0))]
+
+        assert [str(engine.quote(c)) for c in contexts] == [
+            str(use_case.execute(c)[0]) for c in contexts
+        ]
+
+    @pytest.mark.parametrize(
+        "discount_ppm,expected", [(270_000, "32.8500"), (100_000, "40.500"), (0, "45.00")]
+    )
+    def test_to_decimal_with_discount(self, engine, discount_ppm, expected):
+        """Test that the discount gives the Decimal path's exponent for 45.00."""
+        final_price = engine.to_decimal(4_500 * (1_000_000 - discount_ppm), discount_ppm)
+
+        assert str(final_price) == expected
+
+    def test_integer_results(self, engine):
+        """Test the integer API: 55% is capped to 50% of 4501 cents."""
+        ride = FixedPointRide(200, 100_000, 4_501, datetime(2024, 1, 10, 3, 0))
+
+        assert engine.total_discount_ppm(ride) == 500_000
+        assert engine.final_price_scaled(ride) == 4_501 * 500_000
+        assert engine.to_decimal(engine.final_price_scaled(ride)) == Decimal("22.505")
+
+    def test_falls_back_for_unrepresentable_rides(self, engine):
+        """Test that rides with sub-cent prices use the Decimal path."""
+        context = make_context(75, "25", "45.005", datetime(2024, 1, 10, 14, 0))
+
+        assert engine.quote(context) == CalculateRideDiscountUseCase().execute(context)[0]
+
+    def test_falls_back_for_rules_without_fixed_point(
+        self, engine, isolated_rule_registry, contexts
+    ):
+        """Test that rules without calculate_discount_ppm force the Decimal path."""
+
+        class FlatDiscountRule(DiscountRule):
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                return DiscountResult(discount_percentage=Decimal("1.5"), reason="Flat")
+
+        ride = FixedPointRide.from_context(contexts[0])
+        assert engine.total_discount_ppm(ride) is None
+        assert engine.final_price_scaled(ride) is None
+        use_case = CalculateRideDiscountUseCase()
+        assert list(engine.quote_many(contexts)) == [use_case.execute(c)[0] for c in contexts]
+
+
+class TestFixedPointPriceColumns:
+    """Tests for FixedPointPricingEngine.price_columns."""
+
+    @pytest.fixture
+    def engine(self):
+        """Create an engine for a two-digit currency."""
+        return FixedPointPricingEngine()
+
+    @pytest.fixture
+    def rides(self, contexts):
+        """The representable contexts as integer rides."""
+        return [r for r in map(FixedPointRide.from_context, contexts) if r is not None]
+
+    @staticmethod
+    def columns(rides):
+        """Integer columns of the rides, as int64 arrays."""
+        epoch = datetime(1970, 1, 1)
+        return (
+            array("q", [r.total_rides for r in rides]),
+            array("q", [r.distance_m for r in rides]),
+            array("q", [r.price_minor for r in rides]),
+            array("q", [int((r.ride_datetime - epoch).total_seconds()) for r in rides]),
+        )
+
+    def test_prices_like_final_price_scaled(self, engine, rides):
+        """Test that int64 columns are priced exactly like single rides."""
+        assert engine.price_columns(*self.columns(rides)) == [
+            engine.final_price_scaled(r) for r in rides
+        ]
+
+    def test_reads_raw_bytes_and_numpy_buffers(self, engine, rides):
+        """Test that raw int64 bytes and NumPy int64 arrays are read in place."""
+        np = pytest.importorskip("numpy")
+        columns = self.columns(rides)
+        expected = engine.price_columns(*columns)
+
+        assert engine.price_columns(*(memoryview(c).cast("B") for c in columns)) == expected
+        assert engine.price_columns(*(np.asarray(c, dtype=np.int64) for c in columns)) == expected
+
+    def test_falls_back_for_rules_without_fixed_point(
+        self, engine, isolated_rule_registry, contexts
+    ):
+        """Test that rules without calculate_discount_ppm are priced through Decimals."""
+
+        class FlatDiscountRule(DiscountRule):
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                return DiscountResult(discount_percentage=Decimal("1.5"), reason="Flat")
+
+        exact = [c for c in contexts if FixedPointRide.from_context(c) is not None]
+        rides = [FixedPointRide.from_context(c) for c in exact]
+        use_case = CalculateRideDiscountUseCase()
+
+        final_prices = engine.price_columns(*self.columns(rides))
+
+        assert [engine.to_decimal(p) for p in final_prices] == [
+            use_case.execute(c)[0] for c in exact
+        ]
+
+    @pytest.mark.parametrize(
+        "columns,message",
+        [
+            (([1], [1, 2], [1], [0]), "same length"),
+            (([1], [-1], [1], [0]), "distance_m"),
+            ((array("i", [1]), [1], [1], [0]), "int64"),
+        ],
+    )
+    def test_rejects_invalid_columns(self, engine, columns, message):
+        """Test column validation."""
+        with pytest.raises(ValueError, match=message):
+            engine.price_columns(*columns)
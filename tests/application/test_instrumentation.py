@@ -0,0 +1,106 @@
+"""Tests for per-rule pricing instrumentation."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.instrumentation import PricingInstrumentation
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.frequency import RideFrequencyDiscountRule
+
+
+@pytest.fixture
+def capped_context(base_price):
+    """Ride whose discounts add up to 55%, above the 50% cap."""
+    return RideContext(
+        customer=Customer(id="CUST-001", total_rides=200),
+        distance_km=Decimal("100"),
+        base_price=base_price,
+        ride_datetime=datetime(2024, 1, 10, 3, 0),
+    )
+
+
+class TestPricingInstrumentation:
+    """Tests for PricingInstrumentation wired into the use case."""
+
+    @pytest.fixture
+    def instrumentation(self):
+        """Create an instrumentation with default buckets."""
+        return PricingInstrumentation()
+
+    def test_counts_calls_hits_and_cap(
+        self, instrumentation, ride_context_basic, ride_context_multiple_discounts, capped_context
+    ):
+        """Test call, hit and cap counters across several quotes."""
+        use_case = CalculateRideDiscountUseCase(instrumentation)
+
+        for context in (ride_context_basic, ride_context_multiple_discounts, capped_context):
+            use_case.execute(context)
+
+        metrics = instrumentation.snapshot()
+        assert metrics.quotes == 3
+        assert metrics.capped_quotes == 1
+        assert metrics.cap_rate == pytest.approx(1 / 3)
+        by_rule = {rule.rule: rule for rule in metrics.rules}
+        # the basic ride fails the frequency and distance pre-conditions,
+        # so those rules are skipped rather than called
+        assert {name: (rule.calls, rule.hits) for name, rule in by_rule.items()} == {
+            "RideFrequencyDiscountRule": (2, 2),
+            "ProportionalDistanceDiscountRule": (2, 2),
+            "OffPeakDiscountRule": (3, 2),
+        }
+        for rule in by_rule.values():
+            assert rule.total_ns > 0
+            assert sum(count for _, count in rule.histogram) == rule.calls
+            assert rule.histogram[-1][0] is None
+        assert by_rule["OffPeakDiscountRule"].hit_rate == pytest.approx(2 / 3)
+
+    def test_results_unchanged(self, instrumentation, ride_context_multiple_discounts):
+        """Test that instrumented pricing returns the same results."""
+        expected = CalculateRideDiscountUseCase().execute(ride_context_multiple_discounts)
+
+        use_case = CalculateRideDiscountUseCase(instrumentation)
+
+        assert use_case.execute(ride_context_multiple_discounts) == expected
+        assert use_case.execute_many([ride_context_multiple_discounts]) == [expected]
+
+    def test_histogram_buckets(self):
+        """Test that latencies land in the first bucket whose bound covers them."""
+        instrumentation = PricingInstrumentation(latency_buckets_ns=(100, 1_000))
+        counters = instrumentation.counters_for(RideFrequencyDiscountRule)
+
+        for elapsed in (50, 100, 101, 5_000):
+            instrumentation.record(counters, elapsed, hit=False)
+
+        (metrics,) = instrumentation.snapshot().rules
+        assert metrics.histogram == ((100, 2), (1_000, 1), (None, 1))
+        assert metrics.mean_ns == pytest.approx((50 + 100 + 101 + 5_000) / 4)
+
+    def test_reset_keeps_recording(self, instrumentation, ride_context_basic):
+        """Test that reset zeroes counters without detaching compiled pipelines."""
+        use_case = CalculateRideDiscountUseCase(instrumentation)
+        use_case.execute(ride_context_basic)
+
+        instrumentation.reset()
+        assert instrumentation.snapshot().quotes == 0
+        use_case.execute(ride_context_basic)
+
+        metrics = instrumentation.snapshot()
+        assert metrics.quotes == 1
+        assert {rule.rule: rule.calls for rule in metrics.rules} == {
+            "RideFrequencyDiscountRule": 0,
+            "ProportionalDistanceDiscountRule": 0,
+            "OffPeakDiscountRule": 1,
+        }
+
+    def test_rejects_unsorted_buckets(self):
+        """Test bucket validation."""
+        with pytest.raises(ValueError):
+            PricingInstrumentation(latency_buckets_ns=(1_000, 100))
+
+    def test_disabled_by_default(self):
+        """Test that the use case is uninstrumented unless asked."""
+        assert CalculateRideDiscountUseCase().instrumentation is None
@@ -0,0 +1,105 @@
+"""Tests for process-pool parallel pricing."""
+
+import gc
+from dataclasses import replace
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application import parallel
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.parallel import ParallelPricingExecutor
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+
+@pytest.fixture
+def contexts():
+    """Fifty rides with varied ride counts, distances and hours."""
+    return [
+        RideContext(
+            customer=Customer(id=f"CUST-{i}", total_rides=i * 7),
+            distance_km=Decimal(i) / 2,
+            base_price=Decimal("30.00"),
+            ride_datetime=datetime(2024, 1, 8 + i % 7, i % 24, 0),
+        )
+        for i in range(50)
+    ]
+
+
+@pytest.fixture
+def executor():
+    """Two-worker executor with small chunks to exercise reordering."""
+    with ParallelPricingExecutor(max_workers=2, chunk_size=7) as executor:
+        yield executor
+
+
+class TestParallelPricingExecutor:
+    """Tests for ParallelPricingExecutor."""
+
+    def test_matches_sequential_results_in_order(self, executor, contexts):
+        """Test that parallel results equal execute() for each ride, in order."""
+        expected = [CalculateRideDiscountUseCase().execute(c) for c in contexts]
+
+        assert executor.execute_many(contexts) == expected
+
+    def test_iter_execute_accepts_generators(self, executor, contexts):
+        """Test streaming input from a generator."""
+        results = list(executor.iter_execute(c for c in contexts))
+
+        assert len(results) == len(contexts)
+
+    def test_empty_batch(self, executor):
+        """Test that an empty batch returns no results."""
+        assert executor.execute_many([]) == []
+
+    def test_runtime_registered_rules_reach_workers(
+        self, executor, isolated_rule_registry, contexts
+    ):
+        """Test that rules registered after the pool started are applied by workers."""
+        executor.execute_many(contexts[:1])
+
+        class MilestoneDiscountRule(DiscountRule):
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                if context.customer.total_rides == 70:
+                    return DiscountResult(discount_percentage=Decimal("5"), reason="Milestone")
+                return None
+
+        results = executor.execute_many(contexts)
+
+        reasons = [[d.reason for d in discounts] for _, discounts in results]
+        assert "Milestone" in reasons[10]
+        assert sum("Milestone" in r for r in reasons) == 1
+
+    @pytest.mark.parametrize("kwargs", [{"max_workers": 0}, {"chunk_size": 0}])
+    def test_rejects_invalid_sizes(self, kwargs):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            ParallelPricingExecutor(**kwargs)
+
+    def test_timezone_aware_datetimes(self, executor, contexts):
+        """Test that aware datetimes survive the trip to the workers unchanged."""
+        aware = [
+            replace(c, ride_datetime=c.ride_datetime.replace(tzinfo=timezone.utc))
+            for c in contexts[:5]
+        ]
+
+        assert executor.execute_many(aware) == [
+            CalculateRideDiscountUseCase().execute(c) for c in aware
+        ]
+
+    def test_generator_input_matches_sequential_results(self, executor, contexts):
+        """Test that input sent to the shared pool prices like an inherited batch."""
+        expected = [CalculateRideDiscountUseCase().execute(c) for c in contexts]
+
+        assert executor.execute_many(c for c in contexts) == expected
+
+    def test_inherited_batch_is_released(self, executor, contexts):
+        """Test that a batch inherited by forked workers is dropped once priced."""
+        executor.execute_many(contexts)
+
+        assert parallel._inherited_batches == {}
+        assert gc.isenabled()
@@ -0,0 +1,134 @@
+"""Tests for the compiled rule pipeline."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.pipeline import CompiledRulePipeline
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+
+class TestCompiledRulePipeline:
+    """Tests for CompiledRulePipeline."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a pipeline with the standard 50% cap."""
+        return CompiledRulePipeline(CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT)
+
+    def test_rules_instantiated_once(self, pipeline, ride_context_multiple_discounts):
+        """Test that the same rule instances are reused across quotes."""
+        rules = pipeline.rules
+        pipeline.price(ride_context_multiple_discounts)
+        pipeline.price(ride_context_multiple_discounts)
+
+        assert pipeline.rules is rules
+        assert [type(rule) for rule in rules] == list(DiscountRule.registered_rules)
+        assert pipeline.version == DiscountRule.registry.version
+
+    def test_price_applies_cap(self, pipeline, ride_context_multiple_discounts):
+        """Test that the cap is folded into the compiled pricing function."""
+        capped = CompiledRulePipeline(Decimal("20"))
+
+        final_price, applied_discounts = capped.price(ride_context_multiple_discounts)
+
+        assert len(applied_discounts) == 3
+        assert final_price == Decimal("80.00")
+        assert pipeline.price(ride_context_multiple_discounts)[0] == Decimal("73.00")
+
+    def test_recompiles_when_rule_registered(
+        self, pipeline, isolated_rule_registry, ride_context_basic
+    ):
+        """Test that a newly registered rule is picked up without manual rebuilds."""
+        assert pipeline.price(ride_context_basic)[1] == []
+
+        class FlatDiscountRule(DiscountRule):
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                return DiscountResult(discount_percentage=Decimal("5"), reason="Flat")
+
+        final_price, applied_discounts = pipeline.price(ride_context_basic)
+
+        assert [d.reason for d in applied_discounts] == ["Flat"]
+        assert final_price == Decimal("95.00")
+        assert isinstance(pipeline.rules[-1], FlatDiscountRule)
+        assert pipeline.version == isolated_rule_registry.version
+
+    def test_price_many_picks_up_rules_registered_mid_stream(
+        self, pipeline, isolated_rule_registry, ride_context_basic
+    ):
+        """Test that streams see rules registered while being consumed."""
+        results = pipeline.price_many([ride_context_basic, ride_context_basic])
+        assert next(results)[1] == []
+
+        class FlatDiscountRule(DiscountRule):
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                return DiscountResult(discount_percentage=Decimal("5"), reason="Flat")
+
+        assert next(results)[0] == Decimal("95.00")
+
+
+class TestTotalsOnlyPricing:
+    """Tests for the cap-aware, totals-only pricing path."""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a pipeline with the standard 50% cap."""
+        return CompiledRulePipeline(CalculateRideDiscountUseCase.MAX_TOTAL_DISCOUNT)
+
+    @pytest.mark.parametrize("total_rides", [0, 75, 200])
+    @pytest.mark.parametrize("distance", ["3", "12.5", "100"])
+    @pytest.mark.parametrize("hour", [3, 8, 14])
+    def test_matches_full_pricing(self, pipeline, total_rides, distance, hour):
+        """Test that totals equal the full path, below and at the cap."""
+        context = RideContext(
+            customer=Customer(id="CUST-001", total_rides=total_rides),
+            distance_km=Decimal(distance),
+            base_price=Decimal("45.01"),
+            ride_datetime=datetime(2024, 1, 10, hour, 0),
+        )
+        final_price, applied_discounts = pipeline.price(context)
+        expected_total = min(
+            sum((d.discount_percentage for d in applied_discounts), Decimal("0")),
+            pipeline.max_total_discount,
+        )
+
+        assert pipeline.price_total(context) == (final_price, expected_total)
+
+    def test_stops_once_cap_is_reached(self, pipeline, isolated_rule_registry, ride_context_basic):
+        """Test that rules with smaller bounds are skipped once the cap is hit."""
+        calls = []
+
+        class LoyaltyRule(DiscountRule):
+            MAX_DISCOUNT = Decimal("5")
+
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                calls.append("loyalty")
+                return DiscountResult(discount_percentage=Decimal("5"), reason="Loyalty")
+
+        class HalfPriceRule(DiscountRule):
+            MAX_DISCOUNT = Decimal("50")
+
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                return DiscountResult(discount_percentage=Decimal("50"), reason="Half price")
+
+        assert pipeline.price_total(ride_context_basic) == (Decimal("50.00"), Decimal("50"))
+        assert calls == []
+
+        final_price, applied_discounts = pipeline.price(ride_context_basic)
+        assert final_price == Decimal("50.00")
+        assert [d.reason for d in applied_discounts] == ["Loyalty", "Half price"]
+        assert calls == ["loyalty"]
+
+    def test_use_case_execute_total(self, ride_context_multiple_discounts):
+        """Test the use case entry point of the totals-only path."""
+        use_case = CalculateRideDiscountUseCase()
+
+        assert use_case.execute_total(ride_context_multiple_discounts) == (
+            Decimal("73.00"),
+            Decimal("27"),
+        )
@@ -0,0 +1,148 @@
+"""Tests for pre-condition based evaluation planning."""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.planner import EvaluationPlan
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.preconditions import Precondition
+from ride_discount.domain.value_objects import DiscountResult
+
+
+def make_context(total_rides=0, distance="0"):
+    """Build a ride context from plain values."""
+    return RideContext(
+        customer=Customer(id="CUST-001", total_rides=total_rides),
+        distance_km=Decimal(distance),
+        base_price=Decimal("100.00"),
+        ride_datetime=datetime(2024, 1, 10, 8, 0),
+    )
+
+
+def rule_with(*preconditions):
+    """Stand-in rule declaring the given pre-conditions, kept out of the registry."""
+    return SimpleNamespace(PRECONDITIONS=preconditions)
+
+
+class TestEvaluationPlan:
+    """Tests for EvaluationPlan."""
+
+    def test_trivial_without_preconditions(self):
+        """Test that a plan without pre-conditions always selects every item."""
+        plan = EvaluationPlan([rule_with(), rule_with()], ["a", "b"])
+
+        assert plan.is_trivial
+        assert plan.select(make_context()) == ("a", "b")
+
+    @pytest.mark.parametrize(
+        "total_rides,expected",
+        [
+            (0, ("always",)),
+            (9, ("always",)),
+            (10, (">=10", "always")),
+            (21, (">=10", "always", ">20")),
+        ],
+    )
+    def test_lower_bounds_keep_registration_order(self, total_rides, expected):
+        """Test lower bounds, strictness and ordering of the selection."""
+        plan = EvaluationPlan(
+            [
+                rule_with(Precondition("customer.total_rides", ">=", 10)),
+                rule_with(),
+                rule_with(Precondition("customer.total_rides", ">", 20)),
+            ],
+            [">=10", "always", ">20"],
+        )
+
+        assert not plan.is_trivial
+        assert plan.select(make_context(total_rides=total_rides)) == expected
+
+    @pytest.mark.parametrize(
+        "distance,expected",
+        [
+            ("0", ("<3", "<=5")),
+            ("3", ("<=5", "3..8")),
+            ("5", ("<=5", "3..8")),
+            ("8", ("3..8",)),
+            ("8.1", ()),
+        ],
+    )
+    def test_upper_bounds_and_ranges(self, distance, expected):
+        """Test upper bounds and a rule with both a lower and an upper bound."""
+        plan = EvaluationPlan(
+            [
+                rule_with(Precondition("distance_km", "<", 3)),
+                rule_with(Precondition("distance_km", "<=", 5)),
+                rule_with(
+                    Precondition("distance_km", ">=", 3),
+                    Precondition("distance_km", "<=", 8),
+                ),
+            ],
+            ["<3", "<=5", "3..8"],
+        )
+
+        assert plan.select(make_context(distance=distance)) == expected
+
+    def test_conditions_on_several_fields_must_all_hold(self):
+        """Test that a rule is selected only when all its pre-conditions hold."""
+        plan = EvaluationPlan(
+            [
+                rule_with(
+                    Precondition("customer.total_rides", ">=", 10),
+                    Precondition("distance_km", ">", 5),
+                ),
+                rule_with(Precondition("distance_km", ">", 5)),
+            ],
+            ["both", "distance"],
+        )
+
+        assert plan.select(make_context(total_rides=10, distance="6")) == ("both", "distance")
+        assert plan.select(make_context(total_rides=9, distance="6")) == ("distance",)
+        assert plan.select(make_context(total_rides=10, distance="5")) == ()
+
+    def test_tightest_of_repeated_bounds_wins(self):
+        """Test that only the tightest bound per direction is indexed."""
+        plan = EvaluationPlan(
+            [
+                rule_with(
+                    Precondition("customer.total_rides", ">", 5),
+                    Precondition("customer.total_rides", ">=", 10),
+                ),
+                rule_with(Precondition("customer.total_rides", ">", 100)),
+            ],
+            ["tight", "other"],
+        )
+
+        assert plan.select(make_context(total_rides=9)) == ()
+        assert plan.select(make_context(total_rides=10)) == ("tight",)
+
+
+@pytest.mark.usefixtures("isolated_rule_registry")
+class TestPipelinePlanning:
+    """Tests for planned evaluation in the use case."""
+
+    def test_rules_failing_preconditions_are_not_called(self):
+        """Test that the use case skips rules whose pre-conditions fail."""
+        calls = []
+
+        class VeteranRule(DiscountRule):
+            DEPENDS_ON = frozenset({"customer.total_rides"})
+            PRECONDITIONS = (Precondition("customer.total_rides", ">=", 500),)
+
+            def calculate_discount(self, context):
+                calls.append(context.customer.total_rides)
+                return DiscountResult(discount_percentage=Decimal("5"), reason="Veteran")
+
+        use_case = CalculateRideDiscountUseCase()
+        _, few = use_case.execute(make_context(total_rides=499))
+        _, many = use_case.execute(make_context(total_rides=500))
+
+        assert calls == [500]
+        assert "Veteran" not in [d.reason for d in few]
+        assert [d.reason for d in many][-1] == "Veteran"
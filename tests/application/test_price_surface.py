@@ -0,0 +1,147 @@
+"""Tests for precomputed price surfaces."""
+
+import pickle
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import ClassVar
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.price_surface import PriceSurfaceBuilder
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+DISTANCES = [Decimal(km) for km in ("0.5", "3", "5", "5.5", "12", "25", "40")]
+WEEK_START = datetime(2024, 1, 8)
+
+
+def base_price(distance_km):
+    """A typical per-kilometre tariff."""
+    return (Decimal("4.50") + distance_km * Decimal("1.85")).quantize(Decimal("0.01"))
+
+
+def assert_matches_use_case(surface, customer):
+    """Check every cell against the use case pricing the same ride."""
+    use_case = CalculateRideDiscountUseCase()
+    for hour_of_week, row in enumerate(surface.final_prices()):
+        for distance, final_price in zip(DISTANCES, row, strict=True):
+            context = RideContext(
+                customer=customer,
+                distance_km=distance,
+                base_price=base_price(distance),
+                ride_datetime=WEEK_START + timedelta(hours=hour_of_week),
+            )
+            assert final_price == use_case.execute(context)[0]
+
+
+class TestPriceSurfaceBuilder:
+    """Tests for PriceSurfaceBuilder."""
+
+    @pytest.mark.parametrize("total_rides", [0, 75, 1000])
+    def test_matches_use_case_on_every_cell(self, total_rides):
+        """Test that every cell equals the quote execute() returns, cap included."""
+        customer = Customer(id="CUST-001", total_rides=total_rides)
+
+        surface = PriceSurfaceBuilder().build(customer, DISTANCES, base_price, WEEK_START)
+
+        assert surface.cell_discounts is None
+        assert_matches_use_case(surface, customer)
+
+    def test_evaluates_each_rule_along_its_axis(self, isolated_rule_registry):
+        """Test that single-axis rules are called once per bucket, hour or surface."""
+        calls = {"customer": 0, "distance": 0, "hour": 0}
+
+        class CountingRule(DiscountRule):
+            AXIS: ClassVar[str]
+
+            def calculate_discount(self, context):
+                calls[self.AXIS] += 1
+                return None
+
+        class CustomerRule(CountingRule):
+            AXIS = "customer"
+            DEPENDS_ON = frozenset({"customer.total_rides"})
+
+        class DistanceRule(CountingRule):
+            AXIS = "distance"
+            DEPENDS_ON = frozenset({"distance_km", "base_price"})
+
+        class HourRule(CountingRule):
+            AXIS = "hour"
+            DEPENDS_ON = frozenset({"ride_datetime"})
+
+        isolated_rule_registry.replace([CustomerRule, DistanceRule, HourRule])
+        customer = Customer(id="CUST-001", total_rides=75)
+
+        PriceSurfaceBuilder().build(customer, DISTANCES, base_price, WEEK_START)
+
+        assert calls == {"customer": 1, "distance": len(DISTANCES), "hour": 168}
+
+    def test_rules_depending_on_both_axes_get_a_cell_table(self, isolated_rule_registry):
+        """Test that rules reading time and distance are evaluated per cell."""
+
+        class LongNightRule(DiscountRule):
+            DEPENDS_ON = frozenset({"distance_km", "ride_datetime"})
+
+            def calculate_discount(self, context):
+                if context.distance_km >= 10 and context.ride_datetime.hour < 6:
+                    return DiscountResult(discount_percentage=Decimal("5"), reason="Long night")
+                return None
+
+        customer = Customer(id="CUST-001", total_rides=75)
+
+        surface = PriceSurfaceBuilder().build(customer, DISTANCES, base_price, WEEK_START)
+
+        assert surface.cell_discounts is not None
+        assert len(surface.cell_discounts) == 168 * len(DISTANCES)
+        assert_matches_use_case(surface, customer)
+
+    @pytest.mark.parametrize(
+        "distances,week_start,message",
+        [
+            ([], WEEK_START, "at least one"),
+            ([Decimal("5"), Decimal("5")], WEEK_START, "increasing"),
+            (DISTANCES, datetime(2024, 1, 9), "Monday"),
+            (DISTANCES, datetime(2024, 1, 8, 1), "Monday"),
+        ],
+    )
+    def test_rejects_invalid_arguments(self, distances, week_start, message):
+        """Test argument validation."""
+        customer = Customer(id="CUST-001", total_rides=0)
+
+        with pytest.raises(ValueError, match=message):
+            PriceSurfaceBuilder().build(customer, distances, base_price, week_start)
+
+
+class TestPriceSurface:
+    """Tests for PriceSurface lookups."""
+
+    @pytest.fixture
+    def surface(self):
+        """Surface of a regular customer."""
+        customer = Customer(id="CUST-001", total_rides=75)
+        return PriceSurfaceBuilder().build(customer, DISTANCES, base_price, WEEK_START)
+
+    def test_quote_looks_up_bucket_and_hour_of_week(self, surface):
+        """Test that a quote uses the ride's weekday, hour and distance bucket."""
+        saturday_night = datetime(2024, 3, 16, 23, 45)
+
+        assert surface.bucket(Decimal("13.7")) == 4
+        assert surface.quote(saturday_night, Decimal("13.7")) == surface.final_price(
+            5 * 24 + 23, 4
+        )
+        with pytest.raises(ValueError, match="below the first bucket"):
+            surface.bucket(Decimal("0.1"))
+
+    def test_is_cacheable(self, surface):
+        """Test that surfaces are hashable and survive pickling."""
+        restored = pickle.loads(pickle.dumps(surface))
+
+        assert restored == surface
+        assert hash(restored) == hash(surface)
+        assert surface.version == PriceSurfaceBuilder().build(
+            surface.customer, DISTANCES, base_price, WEEK_START
+        ).version
@@ -0,0 +1,182 @@
+"""Tests for the LRU + TTL cache of rule results."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.quote_cache import QuoteCache
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        """Start at time zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Return the current fake time."""
+        return self.now
+
+
+def make_context(
+    customer_id="CUST-001",
+    total_rides=75,
+    distance="12",
+    price="100.00",
+    ride_datetime=datetime(2024, 1, 10, 3, 15),
+):
+    """Build a ride context from plain values."""
+    return RideContext(
+        customer=Customer(id=customer_id, total_rides=total_rides),
+        distance_km=Decimal(distance),
+        base_price=Decimal(price),
+        ride_datetime=ride_datetime,
+    )
+
+
+@pytest.fixture
+def clock():
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Create a small cache driven by the fake clock."""
+    return QuoteCache(max_size=2, ttl=10.0, clock=clock)
+
+
+class TestQuoteCache:
+    """Tests for QuoteCache."""
+
+    def test_quotes_match_use_case(self):
+        """Test that hits and misses both equal execute() for varied rides."""
+        use_case = CalculateRideDiscountUseCase()
+        contexts = [
+            make_context(total_rides=rides, distance=distance, price=price, ride_datetime=when)
+            for rides in (0, 75, 150)
+            for distance in ("3", "4.5", "25", "25.0")
+            for price in ("10.00", "45.01")
+            for when in (datetime(2024, 1, 10, 3), datetime(2024, 1, 13, 14))
+        ]
+        big_cache = QuoteCache()
+
+        assert big_cache.execute_many(contexts + contexts) == use_case.execute_many(
+            contexts + contexts
+        )
+        assert big_cache.stats().hits > 0
+
+    def test_shares_entries_across_irrelevant_inputs(self, cache):
+        """Test that customer id, minute and short distances do not split entries."""
+        cache.execute(make_context(distance="2"))
+        price, discounts = cache.execute(
+            make_context(
+                customer_id="CUST-999",
+                distance="4.5",
+                price="80.00",
+                ride_datetime=datetime(2024, 1, 10, 3, 59),
+            )
+        )
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (3, 3, 3)
+        assert stats.hit_rate == 0.5
+        assert price == CalculateRideDiscountUseCase().execute(
+            make_context(distance="4.5", price="80.00")
+        )[0]
+        assert len(discounts) == 2
+
+    def test_moved_pin_recomputes_only_the_distance_rule(self, cache):
+        """Test that the rules whose keys did not change are still hits."""
+        cache.execute(make_context(distance="12"))
+        cache.execute(make_context(distance="12.1"))
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (2, 4)
+
+    def test_rules_keyed_on_the_whole_ride_are_not_cached(self, isolated_rule_registry):
+        """Test that a rule without a narrower key runs on every quote."""
+        calls = []
+
+        class CountingRule(DiscountRule):
+            def calculate_discount(self, context):
+                calls.append(context)
+                return None
+
+        cache = QuoteCache()
+        cache.execute(make_context())
+        cache.execute(make_context())
+
+        assert len(calls) == 2
+        assert cache.stats().size == 3
+
+    def test_returned_list_is_a_copy(self, cache):
+        """Test that callers cannot corrupt cached entries."""
+        cache.execute(make_context())[1].clear()
+
+        assert len(cache.execute(make_context())[1]) == 3
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test size-bounded LRU eviction of one rule's entries.
+
+        Only the frequency rule's key differs between these rides; the
+        distance and off-peak results are hits after the first quote.
+        """
+        first, second, third = (make_context(total_rides=n) for n in (10, 20, 30))
+        cache.execute(first)
+        cache.execute(second)
+        cache.execute(first)
+        cache.execute(third)
+
+        cache.execute(first)
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.evictions, stats.size) == (10, 5, 1, 4)
+        cache.execute(second)
+        assert cache.stats().misses == 6
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        """Test that entries older than the TTL are priced again."""
+        cache.execute(make_context())
+        clock.now = 9.9
+        cache.execute(make_context())
+        clock.now = 10.0
+        cache.execute(make_context())
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.expirations) == (3, 6, 3)
+
+    @pytest.mark.usefixtures("isolated_rule_registry")
+    def test_invalidates_on_registry_change(self, cache):
+        """Test that a newly registered rule empties the cache and applies."""
+        cache.execute(make_context())
+
+        class FlatRule(DiscountRule):
+            def calculate_discount(self, context):
+                return DiscountResult(discount_percentage=Decimal("1"), reason="Flat")
+
+        _, discounts = cache.execute(make_context())
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (0, 6, 1)
+        assert [d.reason for d in discounts][-1] == "Flat"
+
+    def test_clear_keeps_statistics(self, cache):
+        """Test that clear() drops entries only."""
+        cache.execute(make_context())
+        cache.clear()
+        cache.execute(make_context())
+
+        assert (cache.stats().misses, cache.stats().size) == (6, 3)
+
+    @pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl": 0}])
+    def test_invalid_arguments(self, kwargs):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            QuoteCache(**kwargs)
@@ -0,0 +1,139 @@
+"""Concurrency tests: shared engines priced from many threads at once."""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.fixed_point import FixedPointPricingEngine
+from ride_discount.application.instrumentation import PricingInstrumentation
+from ride_discount.application.quote_cache import QuoteCache
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+THREADS = 8
+
+RIDES = [
+    RideContext(
+        customer=Customer(id=f"CUST-{index % 50}", total_rides=index % 200),
+        distance_km=Decimal(index % 40),
+        base_price=Decimal("30.00"),
+        ride_datetime=datetime(2024, 1, 8) + timedelta(hours=index % 168),
+    )
+    for index in range(400)
+]
+
+
+@pytest.fixture(autouse=True)
+def frequent_thread_switches():
+    """Switch threads as often as possible on GIL builds, to surface races."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def in_threads(function):
+    """Run function(thread_index) in THREADS threads started together."""
+    barrier = threading.Barrier(THREADS)
+
+    def run(index):
+        barrier.wait()
+        return function(index)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        return list(pool.map(run, range(THREADS)))
+
+
+class TestSharedUseCase:
+    """Tests for one use case shared by many threads."""
+
+    def test_results_match_sequential_pricing(self):
+        """Test that concurrent quotes equal the sequential ones."""
+        expected = CalculateRideDiscountUseCase().execute_many(RIDES)
+        use_case = CalculateRideDiscountUseCase()
+
+        results = in_threads(lambda index: [use_case.execute(ride) for ride in RIDES])
+
+        assert all(result == expected for result in results)
+
+    def test_instrumentation_loses_no_count(self):
+        """Test that every quote and rule call is counted exactly once."""
+        instrumentation = PricingInstrumentation()
+        use_case = CalculateRideDiscountUseCase(instrumentation)
+        reference = PricingInstrumentation()
+        CalculateRideDiscountUseCase(reference).execute_many(RIDES)
+
+        in_threads(lambda index: use_case.execute_many(RIDES))
+
+        metrics = instrumentation.snapshot()
+        assert metrics.quotes == THREADS * len(RIDES)
+        assert metrics.capped_quotes == THREADS * reference.snapshot().capped_quotes
+        for rule, expected in zip(metrics.rules, reference.snapshot().rules, strict=True):
+            assert rule.calls == THREADS * expected.calls
+            assert sum(count for _, count in rule.histogram) == rule.calls
+
+    def test_registry_changes_never_tear_a_quote(self, isolated_rule_registry):
+        """Test that each quote is priced entirely by one registry snapshot."""
+
+        class FlatRule(DiscountRule):
+            def calculate_discount(self, context):
+                return DiscountResult(discount_percentage=Decimal("1"), reason="Flat")
+
+        with_flat = isolated_rule_registry.rules
+        without_flat = with_flat[:-1]
+        ride = RIDES[3]
+        isolated_rule_registry.replace(without_flat)
+        use_case = CalculateRideDiscountUseCase()
+        price_without = use_case.execute(ride)
+        isolated_rule_registry.replace(with_flat)
+        price_with = use_case.execute(ride)
+        stop = threading.Event()
+
+        def toggle_rules():
+            while not stop.is_set():
+                isolated_rule_registry.replace(without_flat)
+                isolated_rule_registry.replace(with_flat)
+
+        toggler = threading.Thread(target=toggle_rules)
+        toggler.start()
+        try:
+            results = in_threads(lambda index: [use_case.execute(ride) for _ in range(300)])
+        finally:
+            stop.set()
+            toggler.join()
+
+        assert {result for quotes in results for result in map(repr, quotes)} <= {
+            repr(price_without),
+            repr(price_with),
+        }
+        assert use_case.execute(ride) == price_with
+
+
+class TestSharedEngines:
+    """Tests for the caching and fixed-point engines shared by many threads."""
+
+    def test_quote_cache(self):
+        """Test that a small shared cache stays bounded and answers correctly."""
+        expected = CalculateRideDiscountUseCase().execute_many(RIDES)
+        cache = QuoteCache(max_size=64)
+
+        results = in_threads(lambda index: cache.execute_many(RIDES))
+
+        assert all(result == expected for result in results)
+        assert cache.stats().size <= 64 * len(DiscountRule.registered_rules)
+
+    def test_fixed_point_engine(self):
+        """Test that a shared fixed-point engine quotes like the use case."""
+        expected = [price for price, _ in CalculateRideDiscountUseCase().execute_many(RIDES)]
+        engine = FixedPointPricingEngine()
+
+        results = in_threads(lambda index: list(engine.quote_many(RIDES)))
+
+        assert all(result == expected for result in results)
@@ -177,3 +177,56 @@ class TestCalculateRideDiscountUseCase:
         # Should apply discounts proportionally to higher price
         assert final_price < high_price
         assert final_price > 0
+
+
+class TestCalculateRideDiscountUseCaseBatch:
+    """Tests for the batch pricing API of CalculateRideDiscountUseCase."""
+
+    @pytest.fixture
+    def use_case(self):
+        """Create a use case instance."""
+        return CalculateRideDiscountUseCase()
+
+    @pytest.fixture
+    def contexts(self, base_price):
+        """A mix of contexts covering no discount, single discounts and the cap."""
+        return [
+            RideContext(
+                customer=Customer(id=f"CUST-{total_rides}", total_rides=total_rides),
+                distance_km=distance,
+                base_price=base_price,
+                ride_datetime=datetime(2024, 1, 10, hour, 0),
+            )
+            for total_rides, distance, hour in [
+                (0, Decimal("3"), 8),
+                (50, Decimal("3"), 8),
+                (0, Decimal("15"), 8),
+                (0, Decimal("3"), 3),
+                (75, Decimal("25"), 14),
+                (200, Decimal("100"), 3),
+            ]
+        ]
+
+    def test_execute_many_matches_execute(self, use_case, contexts):
+        """Test that batch results are identical to per-ride results, in order."""
+        expected = [use_case.execute(context) for context in contexts]
+
+        assert use_case.execute_many(contexts) == expected
+
+    def test_iter_execute_is_lazy(self, use_case, contexts):
+        """Test that the generator version prices rides one at a time."""
+        results = use_case.iter_execute(iter(contexts))
+
+        assert next(results) == use_case.execute(contexts[0])
+        assert list(results) == [use_case.execute(context) for context in contexts[1:]]
+
+    def test_execute_many_accepts_any_iterable(self, use_case, contexts):
+        """Test that generators are accepted as batch input."""
+        results = use_case.execute_many(context for context in contexts)
+
+        assert len(results) == len(contexts)
+        assert results[-1][0] == Decimal("50.00")  # Capped at 50%
+
+    def test_execute_many_empty_batch(self, use_case):
+        """Test that an empty batch returns an empty list."""
+        assert use_case.execute_many([]) == []
@@ -0,0 +1,178 @@
+"""Tests for the NumPy-vectorized pricing engine."""
+
+import array
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ride_discount.application.dtos import RideContext  # noqa: E402
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase  # noqa: E402
+from ride_discount.application.vectorized import (  # noqa: E402
+    RideColumns,
+    VectorizedPricingEngine,
+)
+from ride_discount.domain.entities import Customer  # noqa: E402
+from ride_discount.domain.rules.base import DiscountRule  # noqa: E402
+from ride_discount.domain.rules.distance import ProportionalDistanceDiscountRule  # noqa: E402
+from ride_discount.domain.rules.frequency import RideFrequencyDiscountRule  # noqa: E402
+from ride_discount.domain.rules.offpeak import OffPeakDiscountRule  # noqa: E402
+from ride_discount.domain.value_objects import DiscountResult  # noqa: E402
+
+
+@pytest.fixture
+def contexts():
+    """Rides covering every rule branch, weekdays, weekends and the cap."""
+    rides = []
+    for total_rides in (0, 9, 75, 1000):
+        for distance in ("3", "5.1", "25", "100"):
+            for day, hour in ((10, 3), (10, 8), (10, 14), (13, 14), (14, 23)):
+                rides.append(
+                    RideContext(
+                        customer=Customer(id=f"CUST-{total_rides}", total_rides=total_rides),
+                        distance_km=Decimal(distance),
+                        base_price=Decimal("45.00"),
+                        ride_datetime=datetime(2024, 1, day, hour, 30),
+                    )
+                )
+    return rides
+
+
+class TestRideColumns:
+    """Tests for RideColumns."""
+
+    def test_derives_hour_and_weekday(self):
+        """Test hour and weekday derivation from timestamps."""
+        columns = RideColumns(
+            total_rides=[0, 0, 0],
+            distance_km=[1.0, 1.0, 1.0],
+            base_price=[10.0, 10.0, 10.0],
+            timestamps=np.array(
+                ["2024-01-08T03:15", "2024-01-13T14:30", "1969-12-28T23:59"],
+                dtype="datetime64[s]",
+            ),
+        )
+
+        assert columns.hour.tolist() == [3, 14, 23]
+        assert columns.weekday.tolist() == [0, 5, 6]  # Monday, Saturday, Sunday
+
+    def test_rejects_mismatched_lengths(self):
+        """Test that columns must all have the same length."""
+        with pytest.raises(ValueError, match="same length"):
+            RideColumns([1, 2], [1.0], [1.0, 2.0], np.array(["2024-01-08", "2024-01-08"], "M8[s]"))
+
+    def test_rejects_negative_values(self):
+        """Test that the scalar DTO invariants are enforced column-wise."""
+        with pytest.raises(ValueError, match="distance_km"):
+            RideColumns([1], [-1.0], [1.0], np.array(["2024-01-08"], "M8[s]"))
+
+    def test_buffer_columns_are_not_copied(self):
+        """Test that buffer-protocol columns of the right type are used in place."""
+        total_rides = array.array("q", [0, 75])
+        distance_km = memoryview(array.array("d", [3.0, 25.0]))
+        base_price = np.array([10.0, 45.0])
+        timestamps = np.array(["2024-01-08T03:00", "2024-01-13T14:00"], dtype="datetime64[s]")
+
+        columns = RideColumns(total_rides, distance_km, base_price, timestamps)
+
+        assert np.shares_memory(columns.total_rides, np.frombuffer(total_rides, np.int64))
+        assert np.shares_memory(columns.distance_km, np.frombuffer(distance_km, np.float64))
+        assert columns.base_price is base_price
+        assert columns.timestamps is timestamps
+
+    def test_integer_timestamps_are_epoch_seconds(self):
+        """Test that integer timestamps are viewed as seconds since 1970-01-01."""
+        seconds = array.array("q", [0, 1_704_681_900])
+
+        columns = RideColumns([0, 0], [1.0, 1.0], [1.0, 1.0], seconds)
+
+        assert np.shares_memory(columns.timestamps, np.frombuffer(seconds, np.int64))
+        assert columns.context_at(1).ride_datetime == datetime(2024, 1, 8, 2, 45)
+        assert columns.hour.tolist() == [0, 2]
+        assert columns.weekday.tolist() == [3, 0]
+
+    def test_context_at_round_trips(self, contexts):
+        """Test that rows can be materialized back into equal contexts."""
+        columns = RideColumns.from_contexts(contexts)
+
+        assert columns.context_at(5) == contexts[5]
+
+
+class TestVectorizedRules:
+    """Tests for the vectorized implementations of the built-in rules."""
+
+    @pytest.mark.parametrize(
+        "rule_class",
+        [RideFrequencyDiscountRule, ProportionalDistanceDiscountRule, OffPeakDiscountRule],
+    )
+    def test_matches_scalar_rule(self, rule_class, contexts):
+        """Test that each vectorized rule agrees with its scalar implementation."""
+        rule = rule_class()
+        expected = [
+            float(result.discount_percentage) if (result := rule.calculate_discount(c)) else 0.0
+            for c in contexts
+        ]
+
+        discounts = rule.calculate_discount_vectorized(RideColumns.from_contexts(contexts))
+
+        np.testing.assert_allclose(discounts, expected)
+
+
+class TestVectorizedPricingEngine:
+    """Tests for VectorizedPricingEngine."""
+
+    def test_matches_use_case(self, contexts):
+        """Test that batch prices match the Decimal use case, cap included."""
+        use_case = CalculateRideDiscountUseCase()
+        expected = [float(use_case.execute(c)[0]) for c in contexts]
+
+        result = VectorizedPricingEngine().price(RideColumns.from_contexts(contexts))
+
+        np.testing.assert_allclose(result.final_prices, expected)
+        assert result.discount_percentages.max() == 50.0
+
+    def test_prices_buffers_like_contexts(self, contexts):
+        """Test that pricing raw buffers matches pricing the same rides as contexts."""
+        epoch = datetime(1970, 1, 1)
+        columns = RideColumns(
+            total_rides=array.array("q", [c.customer.total_rides for c in contexts]),
+            distance_km=array.array("d", [float(c.distance_km) for c in contexts]),
+            base_price=memoryview(array.array("d", [float(c.base_price) for c in contexts])),
+            timestamps=array.array(
+                "q", [int((c.ride_datetime - epoch).total_seconds()) for c in contexts]
+            ),
+        )
+        engine = VectorizedPricingEngine()
+
+        np.testing.assert_array_equal(
+            engine.price(columns).final_prices,
+            engine.price(RideColumns.from_contexts(contexts)).final_prices,
+        )
+
+    def test_reports_per_rule_discounts(self, contexts):
+        """Test that uncapped per-rule discounts are exposed."""
+        result = VectorizedPricingEngine().price(RideColumns.from_contexts(contexts))
+
+        assert set(result.rule_discounts) == set(DiscountRule.registered_rules)
+        assert result.rule_discounts[OffPeakDiscountRule].max() == 20.0
+
+    def test_scalar_fallback_for_rules_without_vectorized_implementation(
+        self, isolated_rule_registry, contexts
+    ):
+        """Test that rules without a vectorized path are evaluated row by row."""
+
+        class LoyalCustomerRule(DiscountRule):
+            def calculate_discount(self, context: RideContext) -> DiscountResult | None:
+                if context.customer.id == "CUST-9":
+                    return DiscountResult(discount_percentage=Decimal("5"), reason="Loyal")
+                return None
+
+        columns = RideColumns.from_contexts(contexts)
+        result = VectorizedPricingEngine().price(columns)
+
+        loyal = result.rule_discounts[LoyalCustomerRule]
+        assert loyal.tolist() == [5.0 if c.customer.id == "CUST-9" else 0.0 for c in contexts]
+        expected = [float(CalculateRideDiscountUseCase().execute(c)[0]) for c in contexts]
+        np.testing.assert_allclose(result.final_prices, expected)
@@ -7,6 +7,8 @@ import pytest
 
 from ride_discount.application.dtos import RideContext
 from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.registry import RuleRegistry
 
 
 @pytest.fixture
@@ -111,3 +113,11 @@ def ride_context_multiple_discounts(
         base_price=base_price,
         ride_datetime=weekday_midday,
     )
+
+
+@pytest.fixture
+def isolated_rule_registry(monkeypatch: pytest.MonkeyPatch) -> RuleRegistry:
+    """Rule registry copy so rules defined inside a test do not leak to others."""
+    registry = RuleRegistry(DiscountRule.registered_rules)
+    monkeypatch.setattr(DiscountRule, "registry", registry)
+    return registry
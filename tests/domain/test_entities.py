@@ -1,5 +1,7 @@
 """Tests for domain entities."""
 
+import pickle
+
 import pytest
 
 from ride_discount.domain.entities import Customer
@@ -20,6 +22,14 @@ class TestCustomer:
         with pytest.raises(AttributeError):
             customer.total_rides = 20  # type: ignore
 
+    def test_customer_is_slotted(self):
+        """Test that customers carry no per-instance __dict__ and survive pickling."""
+        customer = Customer(id="CUST-001", total_rides=10)
+        assert not hasattr(customer, "__dict__")
+        with pytest.raises((AttributeError, TypeError)):
+            customer.nickname = "rider"  # type: ignore
+        assert pickle.loads(pickle.dumps(customer)) == customer
+
     def test_customer_with_zero_rides(self):
         """Test creating a customer with zero rides."""
         customer = Customer(id="CUST-001", total_rides=0)
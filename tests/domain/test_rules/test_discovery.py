@@ -0,0 +1,181 @@
+"""Tests for lazy, entry-point based rule discovery."""
+
+import os
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.domain.rules import discovery
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+
+
+class FakeEntryPoint:
+    """Stand-in for importlib.metadata.EntryPoint."""
+
+    def __init__(self, name, load):
+        """Create an entry point whose load() calls the given function."""
+        self.name = name
+        self.value = f"fake_package:{name}"
+        self.load = load
+
+
+def define_partner_rule():
+    """What importing a third-party rule module does: define (and register) a rule."""
+
+    class PartnerRule(DiscountRule):
+        def calculate_discount(self, context):
+            return DiscountResult(discount_percentage=Decimal("1"), reason="Partner")
+
+    return PartnerRule
+
+
+def broken_module():
+    """Simulate a third-party module failing at import time."""
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def undiscovered(monkeypatch, isolated_rule_registry):
+    """Make load_rules() run again against an isolated registry."""
+    monkeypatch.setattr(discovery, "_loaded", False)
+    return isolated_rule_registry
+
+
+def run_python(code):
+    """Run code in a fresh interpreter with the same import path."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    ).stdout.split()
+
+
+class TestLoadRules:
+    """Tests for load_rules()."""
+
+    def test_loads_entry_point_rules_once(self, monkeypatch, undiscovered):
+        """Test that entry-point rules are registered after the built-ins, once."""
+        loads = []
+
+        def load():
+            loads.append(1)
+            return define_partner_rule()
+
+        monkeypatch.setattr(
+            discovery, "entry_points", lambda group: [FakeEntryPoint("partner", load)]
+        )
+
+        discovery.load_rules()
+        discovery.load_rules()
+
+        assert discovery.rules_loaded()
+        assert loads == [1]
+        assert [rule.__name__ for rule in undiscovered.rules][-1] == "PartnerRule"
+
+    def test_broken_entry_point_raises_import_error(self, monkeypatch, undiscovered):
+        """Test that a failing plugin is reported, and discovery is retried later."""
+        monkeypatch.setattr(
+            discovery, "entry_points", lambda group: [FakeEntryPoint("broken", broken_module)]
+        )
+
+        with pytest.raises(ImportError, match="broken"):
+            discovery.load_rules()
+        assert not discovery.rules_loaded()
+
+    def test_reentrant_call_raises_instead_of_deadlocking(self, monkeypatch, undiscovered):
+        """Test that a rule module calling load_rules() on import gets a clear error."""
+        calls = []
+
+        def load():
+            calls.append(1)
+            if len(calls) == 1:
+                discovery.load_rules()
+            return define_partner_rule()
+
+        monkeypatch.setattr(
+            discovery, "entry_points", lambda group: [FakeEntryPoint("eager", load)]
+        )
+
+        with pytest.raises(ImportError, match="eager") as raised:
+            discovery.load_rules()
+        assert isinstance(raised.value.__cause__, RuntimeError)
+        assert "while the rules are being loaded" in str(raised.value.__cause__)
+        assert not discovery.rules_loaded()
+
+        discovery.load_rules()  # the guard is reset, so discovery can be retried
+        assert discovery.rules_loaded()
+
+    def test_queries_the_rule_group(self, monkeypatch, undiscovered):
+        """Test that only the ride_discount.rules group is queried."""
+        groups = []
+        monkeypatch.setattr(discovery, "entry_points", lambda group: groups.append(group) or [])
+
+        discovery.load_rules()
+
+        assert groups == ["ride_discount.rules"]
+
+
+class TestLazyImport:
+    """Tests for the lazy package imports."""
+
+    def test_import_does_not_load_rules(self):
+        """Test that importing the package imports no rule module until warm_up()."""
+        code = (
+            "import sys, ride_discount\n"
+            "loaded = lambda: 'ride_discount.domain.rules.distance' in sys.modules\n"
+            "print(loaded())\n"
+            "snapshot = ride_discount.warm_up()\n"
+            "print(loaded(), len(snapshot.rules))\n"
+        )
+
+        assert run_python(code) == ["False", "True", "3"]
+
+    def test_first_quote_discovers_rules(self):
+        """Test that a quote priced without warm_up() sees every built-in rule."""
+        code = (
+            "from datetime import datetime\n"
+            "from decimal import Decimal\n"
+            "from ride_discount import CalculateRideDiscountUseCase, Customer, RideContext\n"
+            "context = RideContext(Customer('c', 75), Decimal('12'), Decimal('100'),"
+            " datetime(2024, 1, 10, 3))\n"
+            "print(len(CalculateRideDiscountUseCase().execute(context)[1]))\n"
+        )
+
+        assert run_python(code) == ["3"]
+
+    def test_builtin_order_does_not_depend_on_import_order(self):
+        """Test that importing a rule module early does not change the evaluation order."""
+        code = (
+            "import ride_discount.domain.rules.offpeak\n"
+            "import ride_discount.domain.rules.frequency\n"
+            "import ride_discount\n"
+            "print(*[rule.__name__ for rule in ride_discount.warm_up().rules])\n"
+        )
+
+        assert run_python(code) == [
+            "ProportionalDistanceDiscountRule",
+            "RideFrequencyDiscountRule",
+            "OffPeakDiscountRule",
+        ]
+
+    def test_rule_classes_are_exported_lazily(self):
+        """Test that the rule classes are still importable from the package, on access."""
+        code = (
+            "import sys, ride_discount\n"
+            "print('ride_discount.domain.rules.base' in sys.modules)\n"
+            "from ride_discount import DiscountRule, OffPeakDiscountRule\n"
+            "rules = (OffPeakDiscountRule, ride_discount.ProportionalDistanceDiscountRule,"
+            " ride_discount.RideFrequencyDiscountRule)\n"
+            "print(all(issubclass(rule, DiscountRule) for rule in rules))\n"
+        )
+
+        assert run_python(code) == ["False", "True"]
+
+    def test_unknown_attribute(self):
+        """Test that lazy packages still raise AttributeError for unknown names."""
+        import ride_discount
+
+        with pytest.raises(AttributeError):
+            ride_discount.NotAThing  # noqa: B018
@@ -75,3 +75,19 @@ class TestRideFrequencyDiscountRule:
         assert result is not None
         assert "Ride frequency discount" in result.reason
         assert "75 rides" in result.reason
+
+    def test_equal_ride_counts_share_one_result(self, rule, base_price, weekday_rush_hour):
+        """Test that results are interned per ride count."""
+        contexts = [
+            RideContext(
+                customer=Customer(id=customer_id, total_rides=42),
+                distance_km=Decimal("5"),
+                base_price=base_price,
+                ride_datetime=weekday_rush_hour,
+            )
+            for customer_id in ("CUST-001", "CUST-002")
+        ]
+
+        first, second = (rule.calculate_discount(c) for c in contexts)
+
+        assert first is second
@@ -141,3 +141,19 @@ class TestOffPeakDiscountRule:
         )
         result = rule.calculate_discount(context)
         assert result is None
+
+    def test_results_are_shared_instances(self, rule, customer_no_rides, base_price):
+        """Test that hits return pre-built results instead of new objects."""
+        contexts = [
+            RideContext(
+                customer=customer_no_rides,
+                distance_km=Decimal("5"),
+                base_price=base_price,
+                ride_datetime=datetime(2024, 1, day, 2, 0),
+            )
+            for day in (8, 9)
+        ]
+
+        first, second = (rule.calculate_discount(c) for c in contexts)
+
+        assert first is second
@@ -0,0 +1,128 @@
+"""Tests for rule dependency and pre-condition declarations."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules import (
+    OffPeakDiscountRule,
+    ProportionalDistanceDiscountRule,
+    RideFrequencyDiscountRule,
+)
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.preconditions import Precondition
+
+
+@pytest.fixture
+def context():
+    """Ride with 10 rides and 5km."""
+    return RideContext(
+        customer=Customer(id="CUST-001", total_rides=10),
+        distance_km=Decimal("5"),
+        base_price=Decimal("100.00"),
+        ride_datetime=datetime(2024, 1, 10, 8, 0),
+    )
+
+
+class TestPrecondition:
+    """Tests for Precondition."""
+
+    @pytest.mark.parametrize(
+        "field,operator,threshold,expected",
+        [
+            ("customer.total_rides", ">=", 10, True),
+            ("customer.total_rides", ">", 10, False),
+            ("distance_km", "<=", Decimal("5"), True),
+            ("distance_km", "<", Decimal("5"), False),
+            ("distance_km", ">", 4, True),
+        ],
+    )
+    def test_holds(self, context, field, operator, threshold, expected):
+        """Test each operator, at and around the threshold."""
+        assert Precondition(field, operator, threshold).holds(context) is expected
+
+    def test_rejects_unknown_field(self):
+        """Test field validation."""
+        with pytest.raises(ValueError, match="unknown context field"):
+            Precondition("customer.rating", ">", 4)
+
+    def test_rejects_unknown_operator(self):
+        """Test operator validation."""
+        with pytest.raises(ValueError, match="unsupported operator"):
+            Precondition("distance_km", "==", 5)  # type: ignore[arg-type]
+
+
+@pytest.mark.usefixtures("isolated_rule_registry")
+class TestRuleDeclarations:
+    """Tests for DEPENDS_ON and PRECONDITIONS on DiscountRule subclasses."""
+
+    def test_rejects_unknown_dependency(self):
+        """Test that DEPENDS_ON is validated at class definition."""
+        with pytest.raises(ValueError, match="unknown fields"):
+
+            class BadRule(DiscountRule):
+                DEPENDS_ON = frozenset({"weather"})
+
+                def calculate_discount(self, context):
+                    return None
+
+    def test_rejects_precondition_outside_dependencies(self):
+        """Test that pre-conditions may only read declared fields."""
+        with pytest.raises(ValueError, match="not in DEPENDS_ON"):
+
+            class BadRule(DiscountRule):
+                DEPENDS_ON = frozenset({"distance_km"})
+                PRECONDITIONS = (Precondition("customer.total_rides", ">", 0),)
+
+                def calculate_discount(self, context):
+                    return None
+
+    def test_default_cache_key_uses_dependencies(self, context):
+        """Test that the default cache key covers exactly the declared fields."""
+
+        class DistanceAndRidesRule(DiscountRule):
+            DEPENDS_ON = frozenset({"distance_km", "customer.total_rides"})
+
+            def calculate_discount(self, context):
+                return None
+
+        assert DistanceAndRidesRule().cache_key(context) == (10, Decimal("5"))
+
+    def test_rejects_out_of_range_bound(self):
+        """Test that MAX_DISCOUNT is validated at class definition."""
+        with pytest.raises(ValueError, match="MAX_DISCOUNT"):
+
+            class BadRule(DiscountRule):
+                MAX_DISCOUNT = Decimal("101")
+
+                def calculate_discount(self, context):
+                    return None
+
+
+class TestBuiltinRuleDeclarations:
+    """Tests that the built-in rules keep to their own declarations."""
+
+    @pytest.mark.parametrize(
+        "rule_class",
+        [RideFrequencyDiscountRule, ProportionalDistanceDiscountRule, OffPeakDiscountRule],
+    )
+    def test_respect_bounds_and_preconditions(self, rule_class):
+        """Test that results never exceed MAX_DISCOUNT nor apply when a pre-condition fails."""
+        rule = rule_class()
+        for total_rides in (0, 9, 10, 149, 150, 10_000):
+            for distance in ("0", "5", "5.001", "45", "1000"):
+                for day, hour in ((8, 0), (8, 5), (8, 6), (8, 12), (13, 12), (14, 23)):
+                    context = RideContext(
+                        customer=Customer(id="CUST-001", total_rides=total_rides),
+                        distance_km=Decimal(distance),
+                        base_price=Decimal("100.00"),
+                        ride_datetime=datetime(2024, 1, day, hour, 0),
+                    )
+                    result = rule.calculate_discount(context)
+                    if result is None:
+                        continue
+                    assert result.discount_percentage <= rule_class.MAX_DISCOUNT
+                    assert all(p.holds(context) for p in rule_class.PRECONDITIONS)
@@ -0,0 +1,128 @@
+"""Tests for the versioned rule registry."""
+
+import dataclasses
+import threading
+from abc import ABC
+
+import pytest
+
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.rules.registry import RuleRegistry
+
+
+def make_rule_class(name):
+    """Create a bare rule class without registering it anywhere."""
+    return type(name, (), {})
+
+
+class TestRuleRegistry:
+    """Tests for RuleRegistry."""
+
+    def test_register_publishes_new_snapshot(self):
+        """Test that registration swaps in a new, higher version."""
+        registry = RuleRegistry()
+        before = registry.snapshot
+        rule_class = make_rule_class("FirstRule")
+
+        after = registry.register(rule_class)
+
+        assert registry.snapshot is after
+        assert after.version > before.version
+        assert after.rules == (rule_class,)
+        assert before.rules == ()
+
+    def test_snapshots_are_immutable(self):
+        """Test that readers cannot mutate a published snapshot."""
+        snapshot = RuleRegistry([make_rule_class("FirstRule")]).snapshot
+
+        assert isinstance(snapshot.rules, tuple)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.version = 0  # type: ignore[misc]
+
+    def test_replace(self):
+        """Test publishing an exact set of rules."""
+        first, second = make_rule_class("FirstRule"), make_rule_class("SecondRule")
+        registry = RuleRegistry([first])
+        version = registry.version
+
+        registry.replace([second, first])
+
+        assert registry.rules == (second, first)
+        assert registry.version > version
+
+    def test_sort_is_stable_and_skips_unchanged_order(self):
+        """Test that sort() publishes a new snapshot only if the order changes."""
+        first, second, third = (make_rule_class(name) for name in ("A", "B", "C"))
+        registry = RuleRegistry([first, second, third])
+        version = registry.version
+
+        assert registry.sort(key=lambda rule: rule is not third).version > version
+        assert registry.rules == (third, first, second)
+        assert registry.sort(key=lambda rule: rule is not third).version == registry.version
+
+    def test_versions_are_unique_across_registries(self):
+        """Test that a fresh registry never reuses a version seen elsewhere."""
+        versions = [RuleRegistry().version for _ in range(3)]
+
+        assert len(set(versions)) == 3
+        assert versions == sorted(versions)
+
+    def test_concurrent_registration_loses_nothing(self):
+        """Test that concurrent writers never overwrite each other."""
+        registry = RuleRegistry()
+        classes = [make_rule_class(f"Rule{i}") for i in range(200)]
+        barrier = threading.Barrier(4)
+
+        def register(chunk):
+            barrier.wait()
+            for rule_class in chunk:
+                registry.register(rule_class)
+
+        threads = [threading.Thread(target=register, args=(classes[i::4],)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert set(registry.rules) == set(classes)
+        assert len(registry.rules) == len(classes)
+
+
+@pytest.mark.usefixtures("isolated_rule_registry")
+class TestDiscountRuleRegistration:
+    """Tests for DiscountRule auto-registration through the registry."""
+
+    def test_subclass_is_registered_with_new_version(self):
+        """Test that defining a rule publishes a snapshot containing it."""
+        version = DiscountRule.registry.version
+
+        class FlatRule(DiscountRule):
+            def calculate_discount(self, context):
+                return None
+
+        assert DiscountRule.registry.version > version
+        assert DiscountRule.registered_rules[-1] is FlatRule
+        assert DiscountRule.registered_rules == DiscountRule.registry.snapshot.rules
+
+    def test_registered_rules_is_read_only(self):
+        """Test that the legacy attribute is an immutable view."""
+        with pytest.raises(AttributeError):
+            DiscountRule.registered_rules.append(object)  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            DiscountRule.registered_rules = ()  # type: ignore[misc]
+
+    def test_registered_rules_from_an_instance(self):
+        """Test that rule instances still see the registered rules, as before."""
+
+        class FlatRule(DiscountRule):
+            def calculate_discount(self, context):
+                return None
+
+        assert FlatRule().registered_rules == DiscountRule.registered_rules
+        assert FlatRule().registered_rules[-1] is FlatRule
+
+    def test_is_an_abstract_base_class(self):
+        """Test that DiscountRule is an ABC and cannot be instantiated."""
+        assert issubclass(DiscountRule, ABC)
+        with pytest.raises(TypeError, match="abstract"):
+            DiscountRule()  # type: ignore[abstract]
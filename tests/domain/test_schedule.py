@@ -0,0 +1,78 @@
+"""Tests for declarative hour-of-week discount schedules."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.domain.schedule import (
+    HOURS_PER_WEEK,
+    WEEKDAYS,
+    WEEKEND,
+    HourOfWeekSchedule,
+    ScheduleWindow,
+    compile_schedule,
+)
+
+LATE_NIGHT = ScheduleWindow(0, 6, Decimal("20"), "Late night off-peak discount")
+WEEKEND_ALL_DAY = ScheduleWindow(0, 24, Decimal("10"), "Weekend discount", days=WEEKEND)
+
+
+class TestScheduleWindow:
+    """Tests for ScheduleWindow validation."""
+
+    @pytest.mark.parametrize(
+        "start,end,days",
+        [(-1, 6, WEEKDAYS), (6, 6, WEEKDAYS), (20, 25, WEEKDAYS), (0, 6, frozenset()), (0, 6, {7})],
+    )
+    def test_invalid_windows(self, start, end, days):
+        """Test that hour ranges and days are validated."""
+        with pytest.raises(ValueError):
+            ScheduleWindow(start, end, Decimal("5"), "Invalid", days=frozenset(days))
+
+
+class TestHourOfWeekSchedule:
+    """Tests for HourOfWeekSchedule."""
+
+    def test_table_has_one_slot_per_hour_of_week(self):
+        """Test the compiled table shape."""
+        schedule = HourOfWeekSchedule((LATE_NIGHT,))
+
+        assert len(schedule.results) == len(schedule.ppm) == HOURS_PER_WEEK
+        assert sum(result is not None for result in schedule.results) == 7 * 6
+
+    def test_weekend_window_without_new_branches(self):
+        """Test a weekend window declared next to an existing one; first match wins."""
+        schedule = HourOfWeekSchedule((LATE_NIGHT, WEEKEND_ALL_DAY))
+
+        saturday_night = schedule.lookup(datetime(2024, 1, 13, 3, 0))
+        saturday_afternoon = schedule.lookup(datetime(2024, 1, 13, 15, 0))
+        friday_afternoon = schedule.lookup(datetime(2024, 1, 12, 15, 0))
+
+        assert saturday_night.reason == "Late night off-peak discount"
+        assert saturday_afternoon.discount_percentage == Decimal("10")
+        assert saturday_afternoon.reason == "Weekend discount"
+        assert friday_afternoon is None
+
+    def test_results_are_shared(self):
+        """Test that every slot of a window holds the same pre-built instance."""
+        schedule = HourOfWeekSchedule((LATE_NIGHT,))
+
+        assert schedule.lookup(datetime(2024, 1, 8, 1, 0)) is schedule.lookup(
+            datetime(2024, 1, 14, 5, 59)
+        )
+
+    def test_ppm_and_percentages_match_results(self):
+        """Test the integer and float views of the table."""
+        schedule = HourOfWeekSchedule((LATE_NIGHT, WEEKEND_ALL_DAY))
+
+        monday_1am, sunday_noon, monday_noon = 1, 6 * 24 + 12, 12
+        assert schedule.ppm[monday_1am] == 200_000
+        assert schedule.percentages[sunday_noon] == 10.0
+        assert schedule.ppm[monday_noon] == 0
+
+    def test_compile_schedule_is_cached(self):
+        """Test that equal window tuples share one compiled table."""
+        windows = (LATE_NIGHT, WEEKEND_ALL_DAY)
+
+        assert compile_schedule(windows) is compile_schedule(tuple(windows))
@@ -1,10 +1,12 @@
 """Tests for domain value objects."""
 
+import dataclasses
+import pickle
 from decimal import Decimal
 
 import pytest
 
-from ride_discount.domain.value_objects import DiscountResult
+from ride_discount.domain.value_objects import DiscountResult, LazyDiscountResult
 
 
 class TestDiscountResult:
@@ -26,6 +28,12 @@ class TestDiscountResult:
         with pytest.raises(AttributeError):
             result.discount_percentage = Decimal("20")  # type: ignore
 
+    def test_discount_result_is_slotted(self):
+        """Test that discount results carry no per-instance __dict__ and survive pickling."""
+        result = DiscountResult(discount_percentage=Decimal("10"), reason="Test discount")
+        assert not hasattr(result, "__dict__")
+        assert pickle.loads(pickle.dumps(result)) == result
+
     def test_discount_result_with_zero_percentage(self):
         """Test creating a discount result with zero percentage."""
         result = DiscountResult(discount_percentage=Decimal("0"), reason="No discount")
@@ -55,3 +63,58 @@ class TestDiscountResult:
         result = DiscountResult(discount_percentage=percentage, reason=reason)
         assert result.discount_percentage == percentage
         assert result.reason == reason
+
+
+class TestLazyDiscountResult:
+    """Tests for LazyDiscountResult."""
+
+    @pytest.fixture
+    def result(self):
+        """Create a lazily formatted result."""
+        return LazyDiscountResult(Decimal("5"), "Distance discount ({}km)", Decimal("15"))
+
+    def test_reason_is_formatted_on_access(self, result):
+        """Test that the reason reads like an eagerly built one."""
+        assert result.reason == "Distance discount (15km)"
+        assert result.discount_percentage == Decimal("5")
+
+    def test_equals_plain_result_with_same_text(self, result):
+        """Test value equality and hashing across both classes."""
+        plain = DiscountResult(discount_percentage=Decimal("5"), reason="Distance discount (15km)")
+        assert result == plain
+        assert hash(result) == hash(plain)
+        assert result != DiscountResult(discount_percentage=Decimal("5"), reason="Other")
+
+    def test_is_immutable(self, result):
+        """Test that no attribute can be assigned."""
+        with pytest.raises(AttributeError):
+            result.reason_value = Decimal("20")  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            result.discount_percentage = Decimal("20")  # type: ignore[misc]
+
+    def test_pickles_as_plain_result(self, result):
+        """Test that pickling sends the formatted text."""
+        restored = pickle.loads(pickle.dumps(result))
+        assert type(restored) is DiscountResult
+        assert restored == result
+        assert not hasattr(result, "__dict__")
+
+    def test_validates_percentage(self):
+        """Test that invariants are enforced like the base class."""
+        with pytest.raises(ValueError, match="cannot exceed 100"):
+            LazyDiscountResult(Decimal("101"), "Invalid ({})", 1)
+
+    def test_replace_keeps_the_formatted_reason(self, result):
+        """Test that dataclasses.replace() works as on a plain result."""
+        replaced = dataclasses.replace(result, discount_percentage=Decimal("7"))
+        assert replaced.discount_percentage == Decimal("7")
+        assert replaced.reason == "Distance discount (15km)"
+
+        renamed = dataclasses.replace(result, reason="Promo {code}")
+        assert renamed.reason == "Promo {code}"
+        assert renamed.discount_percentage == Decimal("5")
+
+    def test_requires_a_reason(self):
+        """Test that a result cannot be built without a template or a reason."""
+        with pytest.raises(TypeError, match="reason"):
+            LazyDiscountResult(Decimal("5"))
@@ -0,0 +1,138 @@
+"""Tests for the HTTP quote server."""
+
+import json
+import re
+import threading
+from datetime import datetime
+from decimal import Decimal
+from http.client import HTTPConnection
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.infrastructure.http_server import QuoteServer
+from ride_discount.infrastructure.ride_io import result_record
+
+RIDE = {
+    "customer_id": "CUST-001",
+    "total_rides": 75,
+    "distance_km": 25,
+    "base_price": 45.00,
+    "ride_datetime": "2024-03-15T14:30",
+}
+
+
+@pytest.fixture
+def server():
+    """A quote server on a free local port, answering from a background thread."""
+    with QuoteServer(("127.0.0.1", 0), max_body_bytes=4096) as server:
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+@pytest.fixture
+def connection(server):
+    """A keep-alive client connection to the server."""
+    connection = HTTPConnection(*server.server_address[:2], timeout=5)
+    yield connection
+    connection.close()
+
+
+def request(connection, method, path, payload=None, body=None):
+    """Send a request and return (status, decoded JSON response)."""
+    if payload is not None:
+        body = json.dumps(payload).encode()
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def expected_record(record):
+    """What the use case answers for a ride object."""
+    context = RideContext(
+        customer=Customer(id=record["customer_id"], total_rides=record["total_rides"]),
+        distance_km=Decimal(str(record["distance_km"])),
+        base_price=Decimal(str(record["base_price"])),
+        ride_datetime=datetime.fromisoformat(record["ride_datetime"]),
+    )
+    return result_record(context, CalculateRideDiscountUseCase().execute(context))
+
+
+class TestQuoteEndpoints:
+    """Tests for /quote, /quotes and /health."""
+
+    def test_quote(self, connection):
+        """Test that one ride is priced exactly like the use case."""
+        status, response = request(connection, "POST", "/quote", RIDE)
+
+        assert status == 200
+        assert response == expected_record(RIDE)
+        assert Decimal(response["final_price"]) == Decimal("32.8500")
+
+    def test_quotes(self, connection):
+        """Test that a batch is priced in order."""
+        rides = [{**RIDE, "total_rides": index, "customer_id": f"C-{index}"} for index in range(5)]
+
+        status, response = request(connection, "POST", "/quotes", {"rides": rides})
+
+        assert status == 200
+        assert response["results"] == [expected_record(ride) for ride in rides]
+
+    def test_connection_is_kept_alive(self, connection):
+        """Test that several requests share one connection."""
+        request(connection, "GET", "/health")
+        sock = connection.sock
+
+        assert request(connection, "POST", "/quote", RIDE)[0] == 200
+        assert request(connection, "GET", "/health") == (200, {"status": "ok"})
+        assert connection.sock is sock
+
+
+class TestQuoteErrors:
+    """Tests for rejected requests."""
+
+    @pytest.mark.parametrize(
+        "path,body,message",
+        [
+            ("/quote", b"{not json", "Expecting property name"),
+            ("/quote", b"[]", "expected a ride object"),
+            ("/quote", json.dumps({**RIDE, "total_rides": None}).encode(), "invalid field"),
+            ("/quote", json.dumps({"customer_id": "C"}).encode(), "missing field"),
+            ("/quotes", json.dumps({"rides": [RIDE, {}]}).encode(), r"rides\[1\]: missing"),
+            ("/quotes", json.dumps([RIDE]).encode(), "rides"),
+            ("/quote", json.dumps({**RIDE, "base_price": "Infinity"}).encode(), "finite"),
+            ("/quote", json.dumps({**RIDE, "base_price": "1e999999999"}).encode(), "cannot price"),
+            ("/quote", json.dumps({**RIDE, "customer_id": None}).encode(), "must be a string"),
+            ("/quote", b"[" * 4000, "nests too deeply"),
+        ],
+    )
+    def test_bad_request(self, connection, path, body, message):
+        """Test that invalid bodies are answered with 400 and keep the connection."""
+        status, response = request(connection, "POST", path, body=body)
+
+        assert status == 400
+        assert re.search(message, response["error"])
+        assert request(connection, "GET", "/health")[0] == 200
+
+    def test_unknown_endpoint(self, connection):
+        """Test that unknown paths are answered with 404."""
+        assert request(connection, "GET", "/quote")[0] == 404
+        assert request(connection, "POST", "/price", RIDE)[0] == 404
+
+    def test_body_too_large(self, connection):
+        """Test that oversized bodies are rejected and the connection closed."""
+        status, response = request(connection, "POST", "/quotes", {"rides": [RIDE] * 100})
+
+        assert status == 413
+        assert "4096" in response["error"]
+        assert connection.sock is None
+
+    def test_rejects_non_positive_body_limit(self):
+        """Test that the body limit must be positive."""
+        with pytest.raises(ValueError, match="max_body_bytes"):
+            QuoteServer(("127.0.0.1", 0), max_body_bytes=0)
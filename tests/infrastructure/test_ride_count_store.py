@@ -0,0 +1,109 @@
+"""Tests for the lock-striped ride count store."""
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.domain.entities import Customer
+from ride_discount.infrastructure.ride_count_store import RideCountStore
+
+
+class TestRideCountStore:
+    """Tests for RideCountStore."""
+
+    def test_unknown_customer_has_no_rides(self):
+        """Test that customers without a stored count start at zero."""
+        store = RideCountStore()
+
+        assert store.customer("CUST-001") == Customer(id="CUST-001", total_rides=0)
+        assert store.frequency_discount("CUST-001") is None
+        assert "CUST-001" not in store
+        assert len(store) == 0
+
+    def test_increment(self):
+        """Test that completed rides are added to the stored count."""
+        store = RideCountStore({"CUST-001": 9})
+
+        assert store.increment("CUST-001") == Customer(id="CUST-001", total_rides=10)
+        assert store.increment("CUST-002", rides=3).total_rides == 3
+        assert store.total_rides("CUST-001") == 10
+        with pytest.raises(ValueError, match="positive"):
+            store.increment("CUST-001", rides=0)
+
+    def test_customer_is_reused_until_updated(self):
+        """Test that lookups return the stored instance instead of building one."""
+        store = RideCountStore({"CUST-001": 75})
+
+        customer = store.customer("CUST-001")
+
+        assert store.customer("CUST-001") is customer
+        assert store.increment("CUST-001") is store.customer("CUST-001")
+
+    def test_frequency_tier_and_discount(self):
+        """Test that the pricing path gets the frequency discount directly."""
+        store = RideCountStore({"CUST-001": 75, "CUST-002": 1000})
+
+        assert store.frequency_tier("CUST-001") == 7
+        assert store.frequency_tier("CUST-002") == 15
+        assert store.frequency_discount("CUST-001").discount_percentage == Decimal("7")
+        assert store.frequency_discount("CUST-001") is store.frequency_discount("CUST-001")
+
+    def test_concurrent_increments_are_not_lost(self):
+        """Test that increments from many threads are all recorded."""
+        store = RideCountStore(stripes=4)
+        customer_ids = [f"CUST-{index}" for index in range(8)]
+
+        def complete_rides(customer_id):
+            for _ in range(500):
+                store.increment(customer_id)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(complete_rides, customer_ids * 4))
+
+        assert store.snapshot() == {customer_id: 2000 for customer_id in customer_ids}
+
+    def test_bulk_load_is_all_or_nothing(self):
+        """Test that an invalid count loads nothing."""
+        store = RideCountStore()
+
+        with pytest.raises(ValueError, match="non-negative"):
+            store.bulk_load([("CUST-001", 5), ("CUST-002", -1)])
+        assert len(store) == 0
+
+    def test_rejects_invalid_stripes(self):
+        """Test that at least one stripe is required."""
+        with pytest.raises(ValueError, match="stripes"):
+            RideCountStore(stripes=0)
+
+
+class TestRideCountSnapshots:
+    """Tests for saving and loading ride count snapshots."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that a saved snapshot loads back into an equal store."""
+        path = tmp_path / "ride_counts.csv"
+        store = RideCountStore({"CUST-001": 75, "CUST-002": 0})
+        store.increment("CUST-003")
+
+        assert store.save(path) == 3
+        restored = RideCountStore(stripes=2)
+        assert restored.load(path) == 3
+
+        assert restored.snapshot() == store.snapshot()
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    @pytest.mark.parametrize(
+        "text,message",
+        [
+            ("customer_id\nCUST-001\n", "line 2: missing field 'total_rides'"),
+            ("customer_id,total_rides\nCUST-001,many\n", "line 2: invalid ride count"),
+        ],
+    )
+    def test_rejects_malformed_rows(self, tmp_path, text, message):
+        """Test that malformed snapshots raise ValueError with the line number."""
+        path = tmp_path / "ride_counts.csv"
+        path.write_text(text, encoding="utf-8")
+
+        with pytest.raises(ValueError, match=message):
+            RideCountStore().load(path)
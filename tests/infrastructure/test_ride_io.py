@@ -0,0 +1,135 @@
+"""Tests for streaming ride readers and writers."""
+
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.infrastructure.ride_io import RideResultWriter, read_rides
+
+CSV_INPUT = (
+    "customer_id,total_rides,distance_km,base_price,ride_datetime\n"
+    "CUST-001,75,25,45.00,2024-03-15T14:30\n"
+    "CUST-002,0,3,10.00,2024-03-16T08:00\n"
+)
+
+JSONL_INPUT = (
+    '{"customer_id": "CUST-001", "total_rides": 75, "distance_km": 25, '
+    '"base_price": 45.00, "ride_datetime": "2024-03-15T14:30"}\n'
+    "\n"
+    '{"customer_id": "CUST-002", "total_rides": 0, "distance_km": "3", '
+    '"base_price": "10.00", "ride_datetime": "2024-03-16T08:00"}\n'
+)
+
+
+class TestReadRides:
+    """Tests for read_rides."""
+
+    @pytest.mark.parametrize("ride_format,text", [("csv", CSV_INPUT), ("jsonl", JSONL_INPUT)])
+    def test_parses_rides(self, ride_format, text):
+        """Test that both formats produce the same ride contexts."""
+        rides = list(read_rides(io.StringIO(text), ride_format))
+
+        assert len(rides) == 2
+        assert rides[0].customer.id == "CUST-001"
+        assert rides[0].customer.total_rides == 75
+        assert rides[0].distance_km == Decimal("25")
+        assert rides[0].base_price == Decimal("45.00")
+        assert rides[0].ride_datetime == datetime(2024, 3, 15, 14, 30)
+
+    def test_json_floats_parsed_as_decimal(self):
+        """Test that JSON numbers keep their exact decimal value."""
+        line = (
+            '{"customer_id": "C", "total_rides": 1, "distance_km": 5.1, '
+            '"base_price": 0.1, "ride_datetime": "2024-03-16T08:00"}\n'
+        )
+        (ride,) = read_rides(io.StringIO(line), "jsonl")
+
+        assert ride.distance_km == Decimal("5.1")
+        assert ride.base_price == Decimal("0.1")
+
+    def test_reads_lazily(self):
+        """Test that records are parsed on demand, not upfront."""
+        rides = read_rides(io.StringIO(CSV_INPUT + "broken\n"), "csv")
+
+        assert next(rides).customer.id == "CUST-001"
+
+    @pytest.mark.parametrize(
+        "ride_format,text,message",
+        [
+            ("csv", "customer_id,total_rides\nA,1\n", "line 2: missing field 'distance_km'"),
+            ("jsonl", "{not json}\n", "line 1:"),
+            (
+                "jsonl",
+                '{"customer_id": "A", "total_rides": -1, "distance_km": 1, '
+                '"base_price": 1, "ride_datetime": "2024-01-01T00:00"}\n',
+                "total_rides must be non-negative",
+            ),
+            (
+                "jsonl",
+                '{"customer_id": "A", "total_rides": 1, "distance_km": "x", '
+                '"base_price": 1, "ride_datetime": "2024-01-01T00:00"}\n',
+                "invalid number",
+            ),
+            ("jsonl", "null\n", "line 1: expected a ride object, got NoneType"),
+            (
+                "jsonl",
+                '{"customer_id": "A", "total_rides": null, "distance_km": 1, '
+                '"base_price": 1, "ride_datetime": "2024-01-01T00:00"}\n',
+                "line 1: invalid field",
+            ),
+            (
+                "jsonl",
+                '{"customer_id": "A", "total_rides": 1, "distance_km": 1, '
+                '"base_price": "Infinity", "ride_datetime": "2024-01-01T00:00"}\n',
+                "must be finite",
+            ),
+            (
+                "csv",
+                "customer_id,total_rides,distance_km,base_price,ride_datetime\n"
+                "A,1,NaN,1,2024-01-01T00:00\n",
+                "line 2: distance_km and base_price must be finite",
+            ),
+        ],
+    )
+    def test_invalid_records(self, ride_format, text, message):
+        """Test that malformed records raise ValueError with their line number."""
+        with pytest.raises(ValueError, match=message):
+            list(read_rides(io.StringIO(text), ride_format))
+
+
+class TestRideResultWriter:
+    """Tests for RideResultWriter."""
+
+    @pytest.fixture
+    def priced(self):
+        """Two parsed rides and their pricing results."""
+        rides = list(read_rides(io.StringIO(CSV_INPUT), "csv"))
+        return rides, CalculateRideDiscountUseCase().execute_many(rides)
+
+    def test_writes_jsonl(self, priced):
+        """Test JSONL serialization of priced rides."""
+        sink = io.StringIO()
+        RideResultWriter(sink, "jsonl").write_batch(*priced)
+
+        first, second = (json.loads(line) for line in sink.getvalue().splitlines())
+        assert first["customer_id"] == "CUST-001"
+        assert Decimal(first["final_price"]) == Decimal("32.85")
+        assert len(first["discounts"]) == 3
+        assert second["discounts"] == []
+
+    def test_writes_csv_with_header(self, priced):
+        """Test CSV serialization of priced rides."""
+        sink = io.StringIO()
+        writer = RideResultWriter(sink, "csv")
+        writer.write_batch(*priced)
+        writer.write_batch(*priced)
+
+        lines = sink.getvalue().splitlines()
+        assert lines[0] == "customer_id,ride_datetime,base_price,final_price,discounts"
+        assert len(lines) == 5
+        assert lines[1].startswith("CUST-001,2024-03-15T14:30:00,45.00,32.8500,")
+        assert lines[2] == "CUST-002,2024-03-16T08:00:00,10.00,10.00,"
@@ -0,0 +1,225 @@
+"""Tests for the memory-mapped binary ride log."""
+
+import io
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from ride_discount.application.dtos import RideContext
+from ride_discount.application.use_cases import CalculateRideDiscountUseCase
+from ride_discount.domain.entities import Customer
+from ride_discount.domain.rules.base import DiscountRule
+from ride_discount.domain.value_objects import DiscountResult
+from ride_discount.infrastructure.ride_log import (
+    MAX_PRICE_MINOR,
+    RECORD_SIZE,
+    RideLog,
+    RideLogWriter,
+    RideRecord,
+    price_ride_log,
+)
+
+
+def ride(customer_id, total_rides, distance_km, base_price, ride_datetime):
+    """Build a ride context from plain values."""
+    return RideContext(
+        customer=Customer(id=customer_id, total_rides=total_rides),
+        distance_km=Decimal(distance_km),
+        base_price=Decimal(base_price),
+        ride_datetime=ride_datetime,
+    )
+
+
+RIDES = [
+    ride("CUST-001", 75, "25", "45.00", datetime(2024, 3, 15, 14, 30)),
+    ride("CUST-002", 0, "3", "10.00", datetime(2024, 3, 16, 8)),
+    ride("CUST-003", 150, "7.125", "19.99", datetime(2024, 3, 17, 23)),
+]
+
+
+@pytest.fixture
+def ride_log_path(tmp_path):
+    """A log holding the unpriced RIDES."""
+    path = tmp_path / "rides.bin"
+    with path.open("wb") as stream:
+        RideLogWriter(stream).write_rides(RIDES)
+    return path
+
+
+class TestRideRecord:
+    """Tests for RideRecord."""
+
+    def test_round_trips_context(self):
+        """Test that a context survives encoding unchanged."""
+        record = RideRecord.from_context(RIDES[2])
+
+        assert record.distance_m == 7125
+        assert record.price_minor == 1999
+        assert record.final_price_scaled is None
+        assert record.to_context() == RIDES[2]
+
+    @pytest.mark.parametrize(
+        "context,message",
+        [
+            (ride("C", 1, "1.0005", "1", datetime(2024, 1, 1)), "whole metres"),
+            (ride("C", 1, "1", "1", datetime(2024, 1, 1, 0, 0, 0, 5)), "whole seconds"),
+            (ride("C" * 17, 1, "1", "1", datetime(2024, 1, 1)), "16 bytes"),
+        ],
+    )
+    def test_rejects_inexact_rides(self, context, message):
+        """Test that rides the format cannot store exactly are rejected."""
+        with pytest.raises(ValueError, match=message):
+            RideRecord.from_context(context)
+
+    @pytest.mark.parametrize(
+        "changes,message",
+        [
+            ({"customer_id": "a" + "\u00e9" * 8}, "16 bytes"),
+            ({"price_minor": MAX_PRICE_MINOR + 1}, "price_minor"),
+            ({"price_minor": -1}, "price_minor"),
+        ],
+    )
+    def test_rejects_values_the_format_cannot_hold(self, changes, message):
+        """Test that records built directly are validated like encoded contexts."""
+        values = {"customer_id": "C", "total_rides": 1, "distance_m": 1, "price_minor": 1}
+
+        with pytest.raises(ValueError, match=message):
+            RideRecord(**{**values, **changes}, timestamp=0)
+
+
+class TestRideLog:
+    """Tests for RideLogWriter and RideLog."""
+
+    def test_reads_records(self, ride_log_path):
+        """Test random and sequential access to the mapped records."""
+        with RideLog(ride_log_path) as log:
+            assert len(log) == 3
+            assert log.minor_digits == 2
+            assert log.rule_names == ()
+            assert log[-1] == RideRecord.from_context(RIDES[2])
+            assert [record.to_context() for record in log] == RIDES
+            with pytest.raises(IndexError):
+                log[3]
+
+    def test_fixed_point_rides(self, ride_log_path):
+        """Test that records decode straight to fixed-point pricing input."""
+        with RideLog(ride_log_path) as log:
+            rides = list(log.fixed_point_rides())
+
+        assert rides == [RideRecord.from_context(context).to_fixed_point() for context in RIDES]
+
+    def test_records_are_fixed_width(self, ride_log_path):
+        """Test that records start aligned and have a fixed size."""
+        size = ride_log_path.stat().st_size
+
+        assert size % RECORD_SIZE == 0
+        with RideLog(ride_log_path) as log:
+            records = log.records()
+            assert records.nbytes == 3 * RECORD_SIZE
+            records.release()
+
+    @pytest.mark.parametrize(
+        "content,message",
+        [
+            (b"RIDELOG", "too short"),
+            (b"NOTALOG\x00" + bytes(56), "magic"),
+        ],
+    )
+    def test_rejects_invalid_files(self, tmp_path, content, message):
+        """Test that files that are not ride logs are rejected."""
+        path = tmp_path / "invalid.bin"
+        path.write_bytes(content)
+
+        with pytest.raises(ValueError, match=message):
+            RideLog(path)
+
+    def test_rejects_partial_record(self, ride_log_path):
+        """Test that a truncated log is rejected."""
+        ride_log_path.write_bytes(ride_log_path.read_bytes()[:-1])
+
+        with pytest.raises(ValueError, match="partial record"):
+            RideLog(ride_log_path)
+
+    def test_too_many_rules(self):
+        """Test that the rule mask holds at most 64 rules."""
+        with pytest.raises(ValueError, match="64"):
+            RideLogWriter(io.BytesIO(), rule_names=[f"Rule{i}" for i in range(65)])
+
+
+class TestPriceRideLog:
+    """Tests for price_ride_log."""
+
+    def test_prices_like_the_use_case(self, ride_log_path, tmp_path):
+        """Test exact final prices and rule masks of the priced log."""
+        output = tmp_path / "priced.bin"
+        with RideLog(ride_log_path) as log, output.open("wb") as stream:
+            assert price_ride_log(log, stream, batch_size=2) == 3
+
+        use_case = CalculateRideDiscountUseCase()
+        with RideLog(output) as priced:
+            assert priced.rule_names == (
+                "ProportionalDistanceDiscountRule",
+                "RideFrequencyDiscountRule",
+                "OffPeakDiscountRule",
+            )
+            records = list(priced)
+        for context, record in zip(RIDES, records, strict=True):
+            final_price, discounts = use_case.execute(context)
+            assert record.final_price() == final_price
+            assert bin(record.rule_mask).count("1") == len(discounts)
+        assert records[0].rule_mask == 0b111
+        assert records[1].rule_mask == 0
+
+    def test_prices_the_largest_base_price(self, tmp_path):
+        """Test that the final price of the largest storable base price fits its field."""
+        record = RideRecord("C", 0, 1000, MAX_PRICE_MINOR, 0)
+        with (tmp_path / "rides.bin").open("wb") as stream:
+            RideLogWriter(stream).write_batch([record])
+        priced_path = tmp_path / "priced.bin"
+
+        with RideLog(tmp_path / "rides.bin") as log, priced_path.open("wb") as stream:
+            assert price_ride_log(log, stream) == 1
+        with RideLog(priced_path) as priced:
+            final_price = priced[0].final_price()
+        assert final_price == CalculateRideDiscountUseCase().execute(record.to_context())[0]
+
+    def test_falls_back_to_decimal_rules(self, ride_log_path, tmp_path, isolated_rule_registry):
+        """Test that rules without a fixed-point implementation still price the log."""
+
+        class FlatRule(DiscountRule):
+            def calculate_discount(self, context):
+                return DiscountResult(discount_percentage=Decimal("2.5"), reason="Flat")
+
+        output = io.BytesIO()
+        with RideLog(ride_log_path) as log:
+            price_ride_log(log, output)
+        path = tmp_path / "priced.bin"
+        path.write_bytes(output.getvalue())
+
+        use_case = CalculateRideDiscountUseCase()
+        with RideLog(path) as priced:
+            for context, record in zip(RIDES, priced, strict=True):
+                assert record.final_price() == use_case.execute(context)[0]
+                assert record.rule_mask & 0b1000
+
+
+class TestRideLogColumns:
+    """Tests for the NumPy views of a ride log."""
+
+    def test_to_columns_prices_like_the_use_case(self, ride_log_path):
+        """Test that the vectorized engine consumes the mapped log."""
+        pytest.importorskip("numpy")
+        from ride_discount.application.vectorized import VectorizedPricingEngine
+
+        with RideLog(ride_log_path) as log:
+            array = log.to_array()
+            assert array["total_rides"].tolist() == [75, 0, 150]
+            assert not array.flags.owndata
+
+            result = VectorizedPricingEngine().price(log.to_columns())
+            del array
+
+        use_case = CalculateRideDiscountUseCase()
+        for context, final_price in zip(RIDES, result.final_prices, strict=True):
+            assert final_price == pytest.approx(float(use_case.execute(context)[0]))
@@ -0,0 +1,129 @@
+"""Tests for the command line interface."""
+
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from ride_discount import cli
+from ride_discount.cli import main, price_stream
+from ride_discount.infrastructure import http_server
+
+ROW = (
+    '{{"customer_id": "CUST-{index}", "total_rides": {index}, "distance_km": 12, '
+    '"base_price": "20.00", "ride_datetime": "2024-03-15T03:00"}}\n'
+)
+
+
+class TestPriceStream:
+    """Tests for price_stream."""
+
+    def test_prices_in_batches(self):
+        """Test that every ride is priced, in order, across batch boundaries."""
+        source = io.StringIO("".join(ROW.format(index=i) for i in range(25)))
+        sink = io.StringIO()
+
+        priced = price_stream(source, sink, "jsonl", "jsonl", batch_size=10)
+
+        results = [json.loads(line) for line in sink.getvalue().splitlines()]
+        assert priced == 25
+        assert [r["customer_id"] for r in results] == [f"CUST-{i}" for i in range(25)]
+        assert Decimal(results[0]["final_price"]) == Decimal("15.30")  # 23.5% off
+
+
+class TestMain:
+    """Tests for the main entry point."""
+
+    def test_price_file_to_file(self, tmp_path):
+        """Test pricing a CSV file into a JSONL file."""
+        source = tmp_path / "rides.csv"
+        source.write_text(
+            "customer_id,total_rides,distance_km,base_price,ride_datetime\n"
+            "CUST-001,75,25,45.00,2024-03-15T14:30\n"
+        )
+        output = tmp_path / "prices.jsonl"
+
+        status = main(["price", str(source), "-o", str(output), "--output-format", "jsonl"])
+
+        assert status == 0
+        (result,) = (json.loads(line) for line in output.read_text().splitlines())
+        assert Decimal(result["final_price"]) == Decimal("32.85")
+
+    def test_price_stdin_to_stdout(self, monkeypatch, capsys):
+        """Test pricing JSONL from stdin to stdout in CSV format."""
+        monkeypatch.setattr("sys.stdin", io.StringIO(ROW.format(index=0)))
+
+        status = main(["price", "--output-format", "csv"])
+
+        lines = capsys.readouterr().out.splitlines()
+        assert status == 0
+        assert lines[0].startswith("customer_id,")
+        assert lines[1].startswith("CUST-0,")
+
+    def test_invalid_input_reports_error(self, monkeypatch, capsys):
+        """Test that malformed input exits non-zero with a message."""
+        monkeypatch.setattr("sys.stdin", io.StringIO("{}\n"))
+
+        status = main(["price"])
+
+        assert status == 1
+        assert "line 1: missing field" in capsys.readouterr().err
+
+    def test_missing_input_file_reports_error(self, tmp_path, capsys):
+        """Test that an unreadable input exits non-zero with a message."""
+        status = main(["price", str(tmp_path / "missing.jsonl")])
+
+        assert status == 1
+        assert "error:" in capsys.readouterr().err
+
+    def test_overflowing_amount_reports_error(self, monkeypatch, capsys):
+        """Test that amounts overflowing the decimal context exit non-zero."""
+        row = ROW.format(index=1).replace('"20.00"', '"1e999999999"')
+        monkeypatch.setattr("sys.stdin", io.StringIO(row))
+
+        status = main(["price"])
+
+        assert status == 1
+        assert "error:" in capsys.readouterr().err
+
+    def test_rejects_non_positive_batch_size(self, capsys):
+        """Test batch size validation."""
+        assert main(["price", "--batch-size", "0"]) == 2
+        assert "batch-size" in capsys.readouterr().err
+
+    def test_requires_command(self):
+        """Test that a subcommand is mandatory."""
+        with pytest.raises(SystemExit):
+            main([])
+
+    def test_serve_reports_unavailable_port(self, capsys):
+        """Test that serve exits non-zero when the port is taken."""
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", 0))
+            taken.listen()
+
+            status = main(["serve", "--port", str(taken.getsockname()[1])])
+
+        assert status == 1
+        assert "error:" in capsys.readouterr().err
+
+    def test_serve_defaults_match_the_server(self):
+        """Test that the CLI's copies of the server defaults stay in sync."""
+        assert cli.DEFAULT_HOST == http_server.DEFAULT_HOST
+        assert cli.DEFAULT_PORT == http_server.DEFAULT_PORT
+        assert cli.DEFAULT_MAX_BODY_BYTES == http_server.DEFAULT_MAX_BODY_BYTES
+
+    def test_price_does_not_load_the_http_server(self):
+        """Test that importing the CLI leaves http.server unloaded."""
+        code = "import sys, ride_discount.cli; print('http.server' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        ).stdout
+
+        assert output.strip() == "False"